@@ -0,0 +1,1463 @@
+"""
+Benchmarks - Course Registration System
+========================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Micro-benchmarks for the performance-sensitive parts of the managers.
+Each benchmark builds its own data in a temporary directory, so the real
+csv files are never read or modified.
+
+HOW TO RUN:
+python benchmarks.py
+
+FILE DEPENDENCIES:
+- course_manager.py (CourseManager class)
+- course.py (Course class)
+- enrollment_table.py (EnrollmentTable class)
+- student.py (Student class)
+- student_manager.py (StudentManager class)
+- main.py (RegistrationSystem class)
+- snapshot.py (snapshot cache)
+- storage.py (CsvStorage / SqliteStorage storage engines)
+- enrollment_manager.py (EnrollmentManager class)
+- persistence.py (flush policies)
+- server.py / load_client.py (registration server and load generator)
+- search_index.py (TrigramIndex class)
+- prefix_index.py (PrefixTrie class)
+- fuzzy_index.py (FuzzyIndex class)
+- listing.py (TableListing class)
+- enrollment_stats.py (EnrollmentStats class)
+- grade_analytics.py (GradeAnalytics class)
+- transcript.py (Transcript class)
+- waitlist.py (CourseWaitlists class)
+- schedule_index.py (ScheduleIndex class, find_conflicts)
+- semesters.py (semester_sort_key, for term order)
+
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from course import Course
+from course_manager import CourseManager
+from enrollment_manager import EnrollmentManager
+from enrollment_table import EnrollmentTable
+from fuzzy_index import FuzzyIndex, WORD_PATTERN, edit_distance, max_typos
+from grade_analytics import GRADE_POINTS, GradeAnalytics, numpy
+from listing import PAGE_SIZE
+from load_client import print_report, run_load_test, send_request
+from main import RegistrationSystem
+from persistence import EVERY_N_OPERATIONS, ON_EXIT, FlushPolicy
+from prefix_index import PrefixTrie
+from schedule_index import ScheduleIndex, find_conflicts
+from search_index import TrigramIndex
+from semesters import semester_sort_key
+from server import FLUSH_FAILED, STREAM_LIMIT, create_server
+from snapshot import SNAPSHOT_FILE
+from student import Student
+from storage import INDEX_FILE, CsvStorage, SqliteStorage, copy_storage
+from student_manager import StudentManager
+from waitlist import CourseWaitlists
+
+
+def time_call(function, repeat):
+    """
+    Call a function repeat times and return the total time in seconds.
+
+    Author: [Humza Khan]
+    Date: [Dec 14]
+    """
+    start = time.perf_counter()
+    for i in range(repeat):
+        function(i)
+    return time.perf_counter() - start
+
+
+def make_empty_directory():
+    """
+    Change into a new temporary directory with no data files.
+
+    Managers created afterwards start empty instead of loading the real
+    csv files.
+
+    Returns:
+        str: The directory that was current before the change
+
+    Author: [Humza Khan]
+    Date: [Dec 14]
+    """
+    previous = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="registration_bench_"))
+    return previous
+
+
+def benchmark_course_lookup(course_total=10000, lookups=2000):
+    """
+    Compare a linear course code scan with the course code index.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 14]
+    """
+    previous = make_empty_directory()
+    try:
+        manager = CourseManager()
+        for i in range(course_total):
+            manager.courses.append(Course(f"BENCH{i:05d}", f"Course {i}", "Dr. Bench", 3, 30))
+        manager._rebuild_course_index()
+
+        codes = [f"bench{(i * 7919) % course_total:05d}" for i in range(lookups)]
+
+        def linear_lookup(i):
+            code = codes[i].upper()
+            for course in manager.courses:
+                if course.course_code.upper() == code:
+                    return course
+            return None
+
+        def indexed_lookup(i):
+            return manager.find_course_by_code(codes[i])
+
+        linear_time = time_call(linear_lookup, lookups)
+        indexed_time = time_call(indexed_lookup, lookups)
+    finally:
+        os.chdir(previous)
+
+    print(f"Course lookup ({course_total} courses, {lookups} lookups)")
+    print(f"  Linear scan:  {linear_time:.4f} s")
+    print(f"  Code index:   {indexed_time:.4f} s")
+    print(f"  Speedup:      {linear_time / indexed_time:.0f}x")
+    print()
+
+
+def make_enrollment_rows(row_total):
+    """
+    Generate enrollment rows by splitting csv lines, so every value is a
+    new string just like when enrollments.csv is read.
+
+    Author: [Humza Khan]
+    Date: [Dec 16]
+    """
+    grades = ["A", "B+", "C", ""]
+    semesters = ["Fall2024", "Winter2025", "Spring2025"]
+    for i in range(row_total):
+        line = f"{2023000000 + (i * 7) % 900000},CPRG{100 + i % 400},{semesters[i % 3]},{grades[i % 4]}"
+        parts = line.split(",")
+        yield int(parts[0]), parts[1], parts[2], parts[3]
+
+
+def measure_memory(build):
+    """
+    Return the bytes still allocated by build() once it has returned.
+
+    Author: [Humza Khan]
+    Date: [Dec 16]
+    """
+    tracemalloc.start()
+    result = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return used
+
+
+def benchmark_enrollment_memory(row_total=500000):
+    """
+    Compare the memory used by enrollment dictionaries and by the columnar
+    EnrollmentTable for the same rows.
+
+    Author: [Humza Khan]
+    Date: [Dec 16]
+    """
+    def build_dicts():
+        enrollments = []
+        for student_id, course_code, semester, grade in make_enrollment_rows(row_total):
+            enrollments.append({
+                "student_id": student_id,
+                "course_code": course_code,
+                "semester": semester,
+                "grade": grade
+            })
+        return enrollments
+
+    def build_table():
+        table = EnrollmentTable()
+        for student_id, course_code, semester, grade in make_enrollment_rows(row_total):
+            table.append_row(student_id, course_code, semester, grade)
+        return table
+
+    dict_bytes = measure_memory(build_dicts)
+    table_bytes = measure_memory(build_table)
+
+    print(f"Enrollment storage memory ({row_total} rows)")
+    print(f"  List of dicts:    {dict_bytes / 1048576:8.1f} MB ({dict_bytes / row_total:.0f} bytes/row)")
+    print(f"  EnrollmentTable:  {table_bytes / 1048576:8.1f} MB ({table_bytes / row_total:.0f} bytes/row)")
+    print(f"  Reduction:        {dict_bytes / table_bytes:.1f}x")
+    print()
+
+
+def write_students_file(student_total):
+    """
+    Write a students.csv with student_total rows in the current directory.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 17]
+    """
+    with open("students.csv", "w") as file:
+        file.write("student_id,first_name,last_name,email,program,year\n")
+        for i in range(student_total):
+            file.write(f"{2000000000 + i},First{i},Last{i},student{i}@mystudent.ca,Software Development,{i % 4 + 1}\n")
+
+
+def benchmark_student_loading(student_total=500000):
+    """
+    Compare building students through the constructor and property setters
+    with the trusted Student.from_trusted() factory, and time a full
+    StudentManager load.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 17]
+    """
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        rows = []
+        with open("students.csv", "r") as file:
+            file.readline()
+            for line in file:
+                parts = line.strip().split(",")
+                rows.append((int(parts[0]), parts[1], parts[2], parts[3], parts[4], int(parts[5])))
+
+        start = time.perf_counter()
+        for row in rows:
+            Student(*row)
+        constructor_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for row in rows:
+            Student.from_trusted(*row)
+        trusted_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        manager = StudentManager()
+        load_time = time.perf_counter() - start
+        loaded = manager.get_student_count()
+    finally:
+        os.chdir(previous)
+
+    print(f"Student construction ({student_total} students)")
+    print(f"  Constructor:      {constructor_time:.3f} s")
+    print(f"  from_trusted():   {trusted_time:.3f} s")
+    print(f"  Speedup:          {constructor_time / trusted_time:.1f}x")
+    print(f"  StudentManager load of students.csv: {load_time:.3f} s ({loaded} students)")
+    print()
+
+
+def write_courses_file(course_total):
+    """
+    Write a courses.csv with course_total rows in the current directory.
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    with open("courses.csv", "w") as file:
+        file.write("course_code,course_name,instructor,credits,capacity\n")
+        for i in range(course_total):
+            file.write(f"BENCH{i:05d},Course {i},Dr. Bench,3,500\n")
+
+
+def write_enrollments_file(enrollment_total, student_total, course_total):
+    """
+    Write an enrollments.csv with enrollment_total rows in the current
+    directory, using the students and courses written above.
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    semesters = ["Fall2024", "Winter2025", "Spring2025"]
+    with open("enrollments.csv", "w") as file:
+        file.write("student_id,course_code,semester,grade\n")
+        for i in range(enrollment_total):
+            file.write(f"{2000000000 + i % student_total},BENCH{(i * 31) % course_total:05d},{semesters[i % 3]},B\n")
+
+
+def time_startup():
+    """
+    Create a RegistrationSystem with its output hidden.
+
+    Returns:
+        float: Seconds taken
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        RegistrationSystem()
+    return time.perf_counter() - start
+
+
+def benchmark_startup(student_total=200000, course_total=2000, enrollment_total=1000000):
+    """
+    Compare start-up from the csv files with start-up from the snapshot.
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        write_courses_file(course_total)
+        write_enrollments_file(enrollment_total, student_total, course_total)
+
+        csv_time = time_startup()
+        snapshot_time = time_startup()
+        snapshot_size = os.path.getsize(SNAPSHOT_FILE)
+    finally:
+        os.chdir(previous)
+
+    print(f"Start-up ({student_total} students, {course_total} courses, {enrollment_total} enrollments)")
+    print(f"  From csv files (and saving snapshot): {csv_time:.3f} s")
+    print(f"  From snapshot:                        {snapshot_time:.3f} s")
+    print(f"  Snapshot size:                        {snapshot_size / 1048576:.1f} MB")
+    print()
+
+
+def time_storage_engine(storage, operations, student_total, course_total):
+    """
+    Load all managers from a storage engine, then register operations
+    students, committing after every registration (the default flush
+    policy).
+
+    Returns:
+        tuple: (load seconds, seconds per registration)
+
+    Author: [Ali Alimarah]
+    Date: [Dec 19]
+    """
+    start = time.perf_counter()
+    students = StudentManager(storage=storage)
+    courses = CourseManager(storage=storage)
+    enrollments = EnrollmentManager(students, courses, storage=storage)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(operations):
+        row = (2000000000 + (i * 13) % student_total, f"BENCH{i % course_total:05d}", "Summer2025", "")
+        enrollments._add_enrollment(*row)
+        storage.insert_enrollment(row)
+        enrollments._tracker.mark_dirty()
+    operation_time = (time.perf_counter() - start) / operations
+    storage.close()
+    return load_time, operation_time
+
+
+def benchmark_storage_engines(student_total=50000, course_total=2000, enrollment_total=200000,
+                              operations=500):
+    """
+    Compare the csv files (with and without the enrollment journal) with
+    the SQLite storage engine, for loading and for single registrations.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 19]
+    """
+    results = []
+    for name, make_storage in (("CSV, full rewrite", lambda: CsvStorage(use_journal=False)),
+                               ("CSV + journal", CsvStorage),
+                               ("SQLite (WAL)", lambda: SqliteStorage())):
+        previous = make_empty_directory()
+        try:
+            write_students_file(student_total)
+            write_courses_file(course_total)
+            write_enrollments_file(enrollment_total, student_total, course_total)
+            storage = make_storage()
+            if isinstance(storage, SqliteStorage):
+                copy_storage(CsvStorage(), storage)
+            results.append((name,) + time_storage_engine(storage, operations, student_total, course_total))
+        finally:
+            os.chdir(previous)
+
+    print(f"Storage engines ({enrollment_total} enrollments, {operations} registrations)")
+    print(f"  {'Engine':<20}{'Load':>10}{'Per registration':>20}")
+    for name, load_time, operation_time in results:
+        print(f"  {name:<20}{load_time:>8.3f} s{operation_time * 1000:>17.3f} ms")
+    print()
+
+
+def benchmark_api_throughput(student_total=20000, course_total=500, operations=20000):
+    """
+    Measure how many register and drop calls per second the programmatic
+    API handles, with changes written once at the end.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 19]
+    """
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        write_courses_file(course_total)
+        policy = FlushPolicy(ON_EXIT)
+        students = StudentManager(policy)
+        courses = CourseManager(policy)
+        enrollments = EnrollmentManager(students, courses, flush_policy=policy)
+
+        start = time.perf_counter()
+        for i in range(operations):
+            enrollments.register(2000000000 + i % student_total, f"BENCH{i % course_total:05d}", "Fall2024")
+        register_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(operations):
+            enrollments.drop(2000000000 + i % student_total, f"BENCH{i % course_total:05d}")
+        drop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        enrollments.flush()
+        flush_time = time.perf_counter() - start
+    finally:
+        os.chdir(previous)
+
+    print(f"Programmatic API ({operations} registrations, then {operations} drops)")
+    print(f"  register(): {operations / register_time:10.0f} operations/s")
+    print(f"  drop():     {operations / drop_time:10.0f} operations/s")
+    print(f"  Final flush of the journal: {flush_time:.3f} s")
+    print()
+
+
+def benchmark_bulk_import(student_total=20000, course_total=500, row_total=50000, single_rows=1000):
+    """
+    Compare importing a registration file in bulk with registering the
+    same rows one at a time, each saved immediately.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        write_courses_file(course_total)
+        with open("batch.csv", "w") as file:
+            file.write("student_id,course_code,semester\n")
+            for i in range(row_total):
+                file.write(f"{2000000000 + i % student_total},BENCH{(i + i // student_total) % course_total:05d},Fall2024\n")
+
+        students = StudentManager()
+        courses = CourseManager()
+        enrollments = EnrollmentManager(students, courses)
+        start = time.perf_counter()
+        for i in range(single_rows):
+            enrollments.register(2000000000 + i % student_total, f"BENCH{(i + i // student_total) % course_total:05d}", "Fall2024")
+        single_time = (time.perf_counter() - start) / single_rows * row_total
+
+        for filename in ("enrollments.csv", "enrollments.journal"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(filename)
+        students = StudentManager()
+        courses = CourseManager()
+        enrollments = EnrollmentManager(students, courses)
+        start = time.perf_counter()
+        result = enrollments.import_enrollments("batch.csv", "rejected.csv")
+        import_time = time.perf_counter() - start
+    finally:
+        os.chdir(previous)
+
+    print(f"Bulk enrollment import ({row_total} rows)")
+    print(f"  One register() per row, estimated from {single_rows} rows: {single_time:.3f} s")
+    print(f"  import_enrollments():                          {import_time:.3f} s ({result.message})")
+    print(f"  Speedup:                                       {single_time / import_time:.0f}x")
+    print()
+
+
+def stress_test_concurrent_registration(thread_total=32, capacity=50, prefilled=40,
+                                        attempts_per_thread=100, student_total=5000):
+    """
+    Hammer one nearly full course from many threads and check that it is
+    never oversold.
+
+    All threads start together. Every thread keeps registering its own
+    students in the busy course and dropping them again, so seats are
+    always opening up and being fought over, and registers the same
+    students in a course of its own at the same time. The thread switch
+    interval is made tiny so the threads interleave as much as possible.
+
+    Raises:
+        AssertionError: If the course is oversold or a count is wrong
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    previous_interval = sys.getswitchinterval()
+    try:
+        write_students_file(student_total)
+        with open("courses.csv", "w") as file:
+            file.write("course_code,course_name,instructor,credits,capacity\n")
+            file.write(f"BUSY,Busy Course,Dr. Bench,3,{capacity}\n")
+            for t in range(thread_total):
+                file.write(f"OWN{t:03d},Own Course {t},Dr. Bench,3,{attempts_per_thread}\n")
+        with open("enrollments.csv", "w") as file:
+            file.write("student_id,course_code,semester,grade\n")
+            for i in range(prefilled):
+                file.write(f"{2000000000 + i},BUSY,Fall2024,\n")
+
+        policy = FlushPolicy(EVERY_N_OPERATIONS, operations=100)
+        students = StudentManager(policy)
+        courses = CourseManager(policy)
+        enrollments = EnrollmentManager(students, courses, flush_policy=policy)
+        busy = courses.find_course_by_code("BUSY")
+
+        registered = [0] * thread_total
+        dropped = [0] * thread_total
+        oversold = []
+        barrier = threading.Barrier(thread_total)
+
+        def worker(t):
+            barrier.wait()
+            for a in range(attempts_per_thread):
+                student_id = 2000000000 + prefilled + t * attempts_per_thread + a
+                if enrollments.register(student_id, "BUSY", "Fall2024"):
+                    registered[t] += 1
+                    if busy.enrolled_count > capacity:
+                        oversold.append(busy.enrolled_count)
+                    if enrollments.drop(student_id, "BUSY"):
+                        dropped[t] += 1
+                enrollments.register(student_id, f"OWN{t:03d}", "Fall2024")
+
+        sys.setswitchinterval(1e-6)
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(thread_total)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        sys.setswitchinterval(previous_interval)
+        enrollments.flush()
+
+        expected = prefilled + sum(registered) - sum(dropped)
+        assert not oversold, f"Course oversold: {max(oversold)} / {capacity}"
+        assert busy.enrolled_count <= capacity
+        assert busy.enrolled_count == expected == enrollments.get_enrollment_count_for_course("BUSY")
+        for t in range(thread_total):
+            assert courses.find_course_by_code(f"OWN{t:03d}").enrolled_count == attempts_per_thread
+
+        reloaded_courses = CourseManager()
+        EnrollmentManager(StudentManager(), reloaded_courses)
+        assert reloaded_courses.find_course_by_code("BUSY").enrolled_count == expected
+    finally:
+        sys.setswitchinterval(previous_interval)
+        os.chdir(previous)
+
+    print(f"Concurrent registration stress test ({thread_total} threads, course capacity {capacity})")
+    print(f"  Registrations in busy course: {sum(registered)}, drops: {sum(dropped)}")
+    print(f"  Final enrollment: {expected} / {capacity} (never oversold)")
+    print(f"  Time: {elapsed:.3f} s")
+    print()
+
+
+def benchmark_server(clients=50, requests_per_client=200, student_total=5000, course_total=200):
+    """
+    Start the registration server on a free port, run the load generator
+    against it, and check that what was saved matches memory.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    async def serve_and_load():
+        with contextlib.redirect_stdout(io.StringIO()):
+            server = create_server(port=0)
+        await server.start()
+        try:
+            report = await run_load_test(server.host, server.port, clients, requests_per_client)
+        finally:
+            await server.close()
+        return server, report
+
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        write_courses_file(course_total)
+        write_enrollments_file(student_total, student_total, course_total)
+        server, report = asyncio.run(serve_and_load())
+
+        saved_courses = CourseManager()
+        EnrollmentManager(StudentManager(), saved_courses)
+        for course in server.system.course_manager.courses:
+            assert saved_courses.find_course_by_code(course.course_code).enrolled_count == course.enrolled_count
+    finally:
+        os.chdir(previous)
+
+    print_report(report, clients)
+    print(f"  Disk writes:  {server.flush_count:10d} (one per batch of changes)")
+    print()
+
+
+def benchmark_server_flush(write_delay=1.0, student_total=2000, course_total=50):
+    """
+    Slow the enrollment write down and check that the server keeps
+    serving while a flush is writing: a 10 ms sleep on the event loop and
+    a schedule request are both timed during the write. The register
+    that started the flush is answered only after the write (durable).
+    Then one write fails: its client must get flush_failed, and the next
+    write must save both changes.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    async def measure(server):
+        await server.start()
+        try:
+            student_id = server.system.student_manager.students[0].student_id
+            register = await asyncio.open_connection(server.host, server.port, limit=STREAM_LIMIT)
+            read = await asyncio.open_connection(server.host, server.port, limit=STREAM_LIMIT)
+            start = time.perf_counter()
+            register_answer = asyncio.create_task(send_request(*register, {
+                "id": 1, "op": "register", "student_id": student_id,
+                "course_code": "FLUSH1", "semester": "Spring2025"}))
+            await asyncio.sleep(write_delay / 4)
+
+            sleep_start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            sleep_time = time.perf_counter() - sleep_start
+            read_start = time.perf_counter()
+            schedule = await send_request(*read, {"id": 2, "op": "schedule", "student_id": student_id})
+            read_time = time.perf_counter() - read_start
+
+            registered = await register_answer
+            register_time = time.perf_counter() - start
+
+            storage._write_enrollment_changes = failing_write
+            failed = await send_request(*register, {
+                "id": 3, "op": "drop", "student_id": student_id, "course_code": "FLUSH1"})
+            storage._write_enrollment_changes = write_changes
+            retried = await send_request(*register, {
+                "id": 4, "op": "register", "student_id": student_id + 1,
+                "course_code": "FLUSH1", "semester": "Spring2025"})
+            for reader, writer in (register, read):
+                writer.close()
+        finally:
+            await server.close()
+        assert schedule["ok"] and registered["ok"], (schedule, registered)
+        assert failed["error"] == FLUSH_FAILED and retried["ok"], (failed, retried)
+        return sleep_time, read_time, register_time
+
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        write_courses_file(course_total)
+        write_enrollments_file(student_total, student_total, course_total)
+        with contextlib.redirect_stdout(io.StringIO()):
+            server = create_server(port=0)
+        server.system.course_manager.create_course("FLUSH1", "Flush", "Dr F", 3, 10)
+        storage = server.system.storage
+        write_changes = storage._write_enrollment_changes
+
+        def slow_write(*args):
+            time.sleep(write_delay)
+            write_changes(*args)
+
+        def failing_write(*args):
+            raise OSError("No space left on device")
+
+        storage._write_enrollment_changes = slow_write
+        sleep_time, read_time, register_time = asyncio.run(measure(server))
+        saved = EnrollmentManager(StudentManager(), CourseManager())
+        student_id = server.system.student_manager.students[0].student_id
+        assert not saved.is_student_enrolled_in_course(student_id, "FLUSH1", "Spring2025")
+        assert saved.is_student_enrolled_in_course(student_id + 1, "FLUSH1", "Spring2025")
+    finally:
+        os.chdir(previous)
+
+    assert sleep_time < write_delay / 4 and read_time < write_delay / 4
+    assert register_time >= write_delay
+    print(f"Server during a slow flush ({write_delay:.1f} s disk write)")
+    print(f"  10 ms sleep on the event loop: {sleep_time * 1000:8.1f} ms")
+    print(f"  schedule request:              {read_time * 1000:8.1f} ms")
+    print(f"  register (answered after the write): {register_time:.2f} s")
+    print()
+
+
+NAME_SYLLABLES = ("al", "an", "ber", "ca", "der", "el", "fa", "gen", "ha", "is", "jo", "ka",
+                  "lee", "ma", "nor", "ol", "pa", "qui", "ro", "sa", "ton", "u", "vi", "wen",
+                  "xa", "ya", "zo")
+
+
+def make_named_student_rows(student_total, seed=216):
+    """
+    Generate student rows with made-up names built from NAME_SYLLABLES,
+    so names share trigrams the way real names do.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    random_source = random.Random(seed)
+
+    def name(parts):
+        return "".join(random_source.choice(NAME_SYLLABLES) for i in range(parts)).capitalize()
+
+    rows = []
+    for i in range(student_total):
+        first = name(random_source.randint(2, 3))
+        last = name(random_source.randint(2, 4))
+        rows.append((2000000000 + i, first, last, f"{first}.{last}{i % 100}@mystudent.ca".lower(),
+                     "Software Development", i % 4 + 1))
+    return rows
+
+
+def benchmark_name_search(student_totals=(10000, 500000), searches=200):
+    """
+    Compare the old lower-case-and-test-every-student name search with the
+    trigram index, and check both return the same students.
+
+    Search terms are pieces of real names, like a search-as-you-type box
+    sends. Two-character terms have no trigrams and are timed separately.
+    The index is built at the first search, which is not timed here; the
+    build time is printed on its own.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        print(f"Student name search (average of {searches} searches)")
+        print(f"  {'Students':>9}  {'Term length':>11}  {'Linear scan':>13}  {'Trigram index':>13}  {'Speedup':>7}")
+        for student_total in student_totals:
+            rows = make_named_student_rows(student_total)
+            manager = StudentManager(load_from_file=False)
+            manager.load_students(rows)
+
+            random_source = random.Random(student_total)
+            for shortest, longest in ((2, 2), (3, 6)):
+                terms = []
+                for i in range(searches):
+                    name = random_source.choice(rows)[random_source.choice((1, 2))].lower()
+                    length = random_source.randint(shortest, longest)
+                    start = random_source.randint(0, max(0, len(name) - length))
+                    terms.append(name[start:start + length])
+
+                def linear_search(i):
+                    term = terms[i]
+                    return [student for student in manager.students
+                            if term in student.first_name.lower() or term in student.last_name.lower()]
+
+                def indexed_search(i):
+                    return manager.find_students_by_name(terms[i])
+
+                for i in range(0, searches, 20):
+                    assert linear_search(i) == indexed_search(i)
+                linear_time = time_call(linear_search, searches)
+                indexed_time = time_call(indexed_search, searches)
+                print(f"  {student_total:>9}  {f'{shortest}-{longest}':>11}  "
+                      f"{linear_time / searches * 1000:>10.3f} ms  {indexed_time / searches * 1000:>10.3f} ms  "
+                      f"{linear_time / indexed_time:>6.1f}x")
+
+            def build_index():
+                index = TrigramIndex(lambda student: (student.first_name, student.last_name))
+                index.reset(manager.students)
+                index.build()
+                return index
+
+            start = time.perf_counter()
+            build_index()
+            build_time = time.perf_counter() - start
+            index_memory = measure_memory(build_index)
+            print(f"  {student_total:>9}  name index: built in {build_time:.2f} s, "
+                  f"{index_memory / 1048576:.1f} MB")
+    finally:
+        os.chdir(previous)
+    print()
+
+
+def benchmark_autocomplete(key_total=200000, completions=2000, limit=10):
+    """
+    Time complete_course_code() and complete_last_name() against scanning
+    and sorting every record, with prefixes of 1 to 5 characters.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        departments = ("CPRG", "COMP", "DATA", "MATH", "NETW", "SODV", "ITSC", "BUSI")
+        courses = CourseManager(load_from_file=False)
+        courses.load_courses([(f"{departments[i % len(departments)]}{i // len(departments):05d}",
+                               f"Course {i}", "Dr. Bench", 3, 30) for i in range(key_total)])
+        students = StudentManager(load_from_file=False)
+        students.load_students(make_named_student_rows(key_total))
+
+        random_source = random.Random(key_total)
+        code_prefixes = []
+        name_prefixes = []
+        for i in range(completions):
+            code = random_source.choice(courses.courses).course_code
+            code_prefixes.append(code[:random_source.randint(1, 5)].lower())
+            name = random_source.choice(students.students).last_name
+            name_prefixes.append(name[:random_source.randint(1, 5)].lower())
+
+        def scan_codes(i):
+            prefix = code_prefixes[i]
+            matches = [c for c in courses.courses if c.course_code.lower().startswith(prefix)]
+            matches.sort(key=lambda c: c.course_code.lower())
+            return matches[:limit]
+
+        def scan_names(i):
+            prefix = name_prefixes[i]
+            matches = [s for s in students.students if s.last_name.lower().startswith(prefix)]
+            matches.sort(key=lambda s: s.last_name.lower())
+            return matches[:limit]
+
+        def complete_codes(i):
+            return courses.complete_course_code(code_prefixes[i], limit)
+
+        def complete_names(i):
+            return students.complete_last_name(name_prefixes[i], limit)
+
+        start = time.perf_counter()
+        complete_codes(0)
+        complete_names(0)
+        build_time = time.perf_counter() - start
+
+        def build_trie():
+            trie = PrefixTrie(lambda student: student.last_name)
+            trie.reset(students.students)
+            trie.build()
+            return trie
+
+        trie_memory = measure_memory(build_trie)
+
+        scanned = min(completions, 50)
+        for i in range(scanned):
+            assert [c.course_code for c in complete_codes(i)] == [c.course_code for c in scan_codes(i)]
+            assert [s.last_name for s in complete_names(i)] == [s.last_name for s in scan_names(i)]
+        code_scan_time = time_call(scan_codes, scanned) / scanned
+        name_scan_time = time_call(scan_names, scanned) / scanned
+        code_trie_time = time_call(complete_codes, completions) / completions
+        name_trie_time = time_call(complete_names, completions) / completions
+    finally:
+        os.chdir(previous)
+
+    print(f"Autocomplete ({key_total} course codes and {key_total} last names, first {limit} matches)")
+    print(f"  {'':<14}{'Scan and sort':>15}{'Prefix trie':>15}")
+    print(f"  {'Course codes':<14}{code_scan_time * 1000:>12.3f} ms{code_trie_time * 1000:>12.3f} ms")
+    print(f"  {'Last names':<14}{name_scan_time * 1000:>12.3f} ms{name_trie_time * 1000:>12.3f} ms")
+    print(f"  Both tries built in {build_time:.2f} s; last name trie uses {trie_memory / 1048576:.1f} MB")
+    print()
+
+
+def add_typo(word, random_source):
+    """
+    Change, delete, insert or swap one character of a word.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    position = random_source.randrange(len(word) - 1)
+    kind = random_source.randrange(4)
+    letter = random_source.choice("abcdefghijklmnopqrstuvwxyz")
+    if kind == 0:
+        return word[:position] + letter + word[position + 1:]
+    if kind == 1:
+        return word[:position] + word[position + 1:]
+    if kind == 2:
+        return word[:position] + letter + word[position:]
+    return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+
+
+def benchmark_fuzzy_search(student_total=200000, searches=200, scanned=5, limit=20):
+    """
+    Time fuzzy_find_students() against computing the edit distance to
+    every student's names, for last names with one or two typos, and
+    check both rank the same students. Words with repeated bigrams
+    ("lalalala") are checked against the edit distance too.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        students = StudentManager(load_from_file=False)
+        students.load_students(make_named_student_rows(student_total))
+
+        random_source = random.Random(student_total)
+        terms = []
+        for i in range(searches):
+            term = random_source.choice(students.students).last_name
+            for typo in range(1 if len(term) < 6 else random_source.randint(1, 2)):
+                term = add_typo(term, random_source)
+            terms.append(term)
+
+        def scan(i):
+            search_word = terms[i].lower()
+            limit_typos = max_typos(search_word)
+            ranked = []
+            for position, student in enumerate(students.students):
+                words = WORD_PATTERN.findall(f"{student.first_name} {student.last_name}".lower())
+                distances = [edit_distance(search_word, word, limit_typos) for word in words]
+                distances = [typos for typos in distances if typos is not None]
+                if distances:
+                    ranked.append((min(distances), position, student))
+            ranked.sort(key=lambda entry: entry[:2])
+            return [(student, typos) for typos, position, student in ranked[:limit]]
+
+        def indexed(i):
+            return students.fuzzy_find_students(terms[i], limit)
+
+        start = time.perf_counter()
+        indexed(0)
+        build_time = time.perf_counter() - start
+
+        def build_index():
+            index = FuzzyIndex(lambda student: (student.first_name, student.last_name))
+            index.reset(students.students)
+            index.build()
+            return index
+
+        index_memory = measure_memory(build_index)
+
+        for i in range(scanned):
+            assert indexed(i) == scan(i)
+
+        # Words with repeated bigrams have fewer distinct bigrams than
+        # their length, and the bigram filter must still let them through
+        repeated_words = ["aaaaaaaaaa", "lalalalala", "abababab", "mississippi", "banana", "aaaa"]
+        repeated = FuzzyIndex(lambda word: (word,))
+        repeated.reset(repeated_words)
+        assert repeated.search("aaaaaaaaa") == [("aaaaaaaaaa", 1)]
+        assert repeated.search("lalalalal") == [("lalalalala", 1)]
+        for word in repeated_words * 20:
+            term = add_typo(add_typo(word, random_source), random_source)
+            expected = {close for close in repeated_words
+                        if edit_distance(term, close, max_typos(term)) is not None}
+            assert {close for close, typos in repeated.close_words(term)} == expected, term
+
+        scan_time = time_call(scan, scanned) / scanned
+        indexed_time = time_call(indexed, searches) / searches
+        found = sum(1 for i in range(searches) if indexed(i))
+    finally:
+        os.chdir(previous)
+
+    print(f"Fuzzy name search ({student_total} students, last names with 1-2 typos, best {limit})")
+    print(f"  Edit distance to every name: {scan_time * 1000:10.1f} ms")
+    print(f"  Fuzzy index:                 {indexed_time * 1000:10.3f} ms  ({scan_time / indexed_time:.0f}x)")
+    print(f"  Searches with results: {found} / {searches}")
+    print(f"  Index built in {build_time:.2f} s, {index_memory / 1048576:.1f} MB")
+    print()
+
+
+class CountingSink(io.RawIOBase):
+    """
+    Output that discards everything but counts write calls, which on a
+    terminal are system calls.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes += 1
+        return len(data)
+
+
+def benchmark_listing(student_total=100000):
+    """
+    Time display_students_list() against the old print() per row, with
+    standard output line buffered as it is on a terminal, and the first
+    page of a paged listing.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        students = StudentManager(load_from_file=False)
+        students.load_students(make_named_student_rows(student_total))
+
+        def print_per_row():
+            print("=" * 84)
+            for student in students.students:
+                program = student.program if student.program is not None else ""
+                print(f"{student.student_id:<12}{student.get_full_name():<25}{student.email:<30}"
+                      f"{program[:14]:<15}{student.year:<4}")
+            print(f"Total Students: {len(students.students)}")
+
+        results = []
+        for label, listing in (("print() per row", print_per_row),
+                               ("TableListing", students.display_students_list),
+                               ("First page", lambda: students.display_students_list(limit=PAGE_SIZE))):
+            sink = CountingSink()
+            terminal = io.TextIOWrapper(io.BufferedWriter(sink), line_buffering=True)
+            with contextlib.redirect_stdout(terminal):
+                start = time.perf_counter()
+                listing()
+                elapsed = time.perf_counter() - start
+            terminal.flush()
+            results.append((label, elapsed, sink.writes))
+    finally:
+        os.chdir(previous)
+
+    print(f"Student listing ({student_total} students, line-buffered output)")
+    print(f"  {'':<16}{'Time':>10}  {'Writes':>8}")
+    for label, seconds, writes in results:
+        print(f"  {label:<16}{seconds * 1000:7.1f} ms  {writes:>8}")
+    print()
+
+
+def benchmark_statistics(course_total=100000, screens=200, adjustments=200000):
+    """
+    Compare finding the most-enrolled course by scanning every course, as
+    the statistics screen used to, with EnrollmentStats, and measure what
+    keeping the statistics costs each registration or drop.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        manager = CourseManager(load_from_file=False)
+        manager.load_courses([(f"BENCH{i:06d}", f"Course {i}", "Dr. Bench", 3, 60)
+                              for i in range(course_total)])
+        random_source = random.Random(course_total)
+        for course in manager.courses:
+            course.set_enrolled_count(random_source.randint(0, 50))
+        manager.stats.reset(manager.courses)
+        codes = [random_source.choice(manager.courses).course_code for i in range(adjustments)]
+
+        def scan(i):
+            top_course = None
+            for course in manager.courses:
+                if top_course is None or course.enrolled_count > top_course.enrolled_count:
+                    top_course = course
+            return top_course
+
+        def kept(i):
+            return manager.stats.top(5)
+
+        assert scan(0).enrolled_count == kept(0)[0].enrolled_count
+        scan_time = time_call(scan, screens) / screens
+        kept_time = time_call(kept, screens) / screens
+
+        def adjust_only(i):
+            course = manager.find_course_by_code(codes[i])
+            course.set_enrolled_count(course.enrolled_count + (1 if i % 2 == 0 else -1))
+
+        def adjust_with_stats(i):
+            manager.adjust_enrollment_count(codes[i], 1 if i % 2 == 0 else -1)
+
+        adjust_time = time_call(adjust_only, adjustments) / adjustments
+        manager.stats.reset(manager.courses)
+        stats_time = time_call(adjust_with_stats, adjustments) / adjustments
+    finally:
+        os.chdir(previous)
+
+    print(f"Statistics screen ({course_total} courses)")
+    print(f"  Scan for top course:   {scan_time * 1000:9.3f} ms")
+    print(f"  EnrollmentStats top 5: {kept_time * 1000:9.3f} ms")
+    print(f"  Count change: {adjust_time * 1e6:.2f} us before, {stats_time * 1e6:.2f} us with statistics")
+    print()
+
+
+def benchmark_grade_analytics(row_total=2000000, student_total=900000):
+    """
+    Compute mean GPAs by course, semester and program with a loop over
+    enrollment dictionaries, and with GradeAnalytics over the columns of
+    an EnrollmentTable (numpy if installed, else the plain Python
+    fallback).
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    programs = {2023000000 + i: f"Program {i % 12}" for i in range(student_total)}
+    dictionaries = [{"student_id": s, "course_code": c, "semester": t, "grade": g}
+                    for s, c, t, g in make_enrollment_rows(row_total)]
+    table = EnrollmentTable()
+    for row in make_enrollment_rows(row_total):
+        table.append_row(*row)
+
+    def dictionary_loops():
+        totals = {}
+        for e in dictionaries:
+            points = GRADE_POINTS.get(e["grade"])
+            if points is None:
+                continue
+            for key in (("course", e["course_code"]), ("semester", e["semester"]),
+                        ("program", programs.get(e["student_id"]))):
+                total = totals.setdefault(key, [0, 0.0])
+                total[0] += 1
+                total[1] += points
+        return totals
+
+    def analytics():
+        result = GradeAnalytics(table, programs)
+        return result.course_means(), result.semester_trends(), result.program_means(), result
+
+    start = time.perf_counter()
+    totals = dictionary_loops()
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    course_means, trends, program_means, result = analytics()
+    analytics_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result.course_distributions()
+    distribution_time = time.perf_counter() - start
+
+    for code, (mean, graded) in course_means.items():
+        if graded > 0:
+            assert graded == totals[("course", code)][0]
+            assert abs(mean - totals[("course", code)][1] / graded) < 1e-9
+
+    engine = "numpy" if numpy is not None else "plain Python fallback"
+    print(f"Grade analytics ({row_total} enrollments, {engine})")
+    print(f"  Loop over dictionaries:      {loop_time:8.2f} s")
+    print(f"  GradeAnalytics (all means):  {analytics_time:8.2f} s  ({loop_time / analytics_time:.0f}x)")
+    print(f"  Course grade distributions:  {distribution_time:8.2f} s")
+    print()
+
+
+def benchmark_transcripts(student_total=25000, courses_each=20, course_total=400, checks=200000,
+                          grades=2000):
+    """
+    Compare working out a student's GPA from their enrollments every time
+    with the EnrollmentManager's cached transcripts, including the cost of
+    rebuilding the entries that grade changes and a credit edit throw away.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    previous = make_empty_directory()
+    try:
+        courses = CourseManager(load_from_file=False)
+        courses.load_courses([(f"CPRG{100 + i}", f"Course {i}", "Dr. Bench", 1 + i % 4, 100000)
+                              for i in range(course_total)])
+        enrollments = EnrollmentManager(StudentManager(load_from_file=False), courses,
+                                        flush_policy=FlushPolicy(ON_EXIT), load_from_file=False)
+        random_source = random.Random(student_total)
+        semesters = ["Fall2023", "Winter2024", "Fall2024", "Winter2025", "Fall2025"]
+        grade_choices = list(GRADE_POINTS) + [""]
+        student_ids = [2023000000 + i for i in range(student_total)]
+        enrollments.load_enrollments(
+            (student_id, f"CPRG{100 + random_source.randrange(course_total)}",
+             semesters[j % len(semesters)], random_source.choice(grade_choices))
+            for student_id in student_ids for j in range(courses_each))
+        asked = [random_source.choice(student_ids) for i in range(checks)]
+
+        def naive_gpa(i):
+            points = 0.0
+            credits = 0
+            for e in enrollments.get_student_enrollments(asked[i]):
+                course = courses.find_course_by_code(e["course_code"])
+                if course is not None and e["grade"] in GRADE_POINTS:
+                    points += GRADE_POINTS[e["grade"]] * course.credits
+                    credits += course.credits
+            return points / credits if credits else None
+
+        def cached_gpa(i):
+            return enrollments.get_gpa(asked[i])
+
+        naive_time = time_call(naive_gpa, checks) / checks
+        first_time = time_call(cached_gpa, checks) / checks
+        cached_time = time_call(cached_gpa, checks) / checks
+        for i in range(0, checks, checks // 100):
+            naive = naive_gpa(i)
+            assert naive is None or abs(cached_gpa(i) - naive) < 1e-9
+
+        graded = [random_source.choice(enrollments.get_student_enrollments(s)) for s in asked[:grades]]
+        start = time.perf_counter()
+        for e in graded:
+            enrollments.set_grade(e["student_id"], e["course_code"], "B")
+        grade_time = (time.perf_counter() - start) / grades
+        cached_before = len(enrollments._transcripts)
+        courses.update_course("CPRG100", credits=4 if courses.find_course_by_code("CPRG100").credits != 4 else 1)
+        dropped = cached_before - len(enrollments._transcripts)
+    finally:
+        os.chdir(previous)
+
+    print(f"Student GPA ({student_total} students x {courses_each} enrollments, {checks} checks)")
+    print(f"  Recomputed every time: {naive_time * 1e6:8.2f} us")
+    print(f"  First pass (builds):   {first_time * 1e6:8.2f} us")
+    print(f"  Cached check:          {cached_time * 1e6:8.2f} us  ({naive_time / cached_time:.0f}x)")
+    print(f"  Grade change: {grade_time * 1e6:.1f} us, clears 1 transcript")
+    print(f"  Credit edit of CPRG100: clears {dropped} of {cached_before} transcripts")
+    print()
+
+
+def benchmark_waitlist(waiting_total=100000, promotions=5000, student_total=20000, drops=5000):
+    """
+    Compare promoting the next waiting student from a heap (CourseWaitlists)
+    with scanning a list for the highest priority, while half of the
+    waiting students cancel, then time drops that each promote a student
+    through the EnrollmentManager.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    random_source = random.Random(waiting_total)
+    years = [random_source.randint(1, 4) for i in range(waiting_total)]
+    cancelled = set(random_source.sample(range(waiting_total), waiting_total // 2))
+
+    def build_heap():
+        waitlists = CourseWaitlists()
+        for student_id in range(waiting_total):
+            waitlists.add(student_id, "BENCH", "Fall2024", years[student_id])
+        for student_id in cancelled:
+            waitlists.remove(student_id, "BENCH")
+        return waitlists
+
+    def build_list():
+        return [(-years[student_id], student_id) for student_id in range(waiting_total)
+                if student_id not in cancelled]
+
+    start = time.perf_counter()
+    waitlists = build_heap()
+    heap_build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    heap_order = [waitlists.pop("BENCH")[0] for i in range(promotions)]
+    heap_time = (time.perf_counter() - start) / promotions
+
+    waiting = build_list()
+    start = time.perf_counter()
+    list_order = []
+    for i in range(promotions):
+        best = min(waiting)
+        waiting.remove(best)
+        list_order.append(best[1])
+    list_time = (time.perf_counter() - start) / promotions
+    assert heap_order == list_order
+
+    previous = make_empty_directory()
+    try:
+        students = StudentManager(load_from_file=False)
+        students.load_students([(2023000000 + i, "First", f"Last{i}", f"s{i}@example.com", "Bench",
+                                 1 + i % 4) for i in range(student_total)])
+        courses = CourseManager(load_from_file=False)
+        courses.load_courses([("BENCH100", "Bench Course", "Dr. Bench", 3, drops)])
+        enrollments = EnrollmentManager(students, courses, flush_policy=FlushPolicy(ON_EXIT),
+                                        load_from_file=False)
+        student_ids = [student.student_id for student in students.students]
+        for student_id in student_ids[:drops]:
+            enrollments.register(student_id, "BENCH100", "Fall2024")
+        for student_id in student_ids[drops:]:
+            enrollments.join_waitlist(student_id, "BENCH100", "Fall2024")
+
+        start = time.perf_counter()
+        for student_id in student_ids[:drops]:
+            enrollments.drop(student_id, "BENCH100")
+        drop_time = (time.perf_counter() - start) / drops
+        assert courses.find_course_by_code("BENCH100").enrolled_count == drops
+        remaining = enrollments.waitlists.length("BENCH100")
+    finally:
+        os.chdir(previous)
+
+    print(f"Waitlist ({waiting_total} requests, {len(cancelled)} cancelled, {promotions} promotions)")
+    print(f"  Heap build with cancellations: {heap_build_time:8.3f} s")
+    print(f"  List scan promotion:  {list_time * 1e6:10.1f} us")
+    print(f"  Heap promotion:       {heap_time * 1e6:10.1f} us  ({list_time / heap_time:.0f}x)")
+    print(f"  Drop + promotion ({student_total - drops} waiting): {drop_time * 1e6:.1f} us per drop, "
+          f"{remaining} still waiting")
+    print()
+
+
+def make_meeting_rows(student_total, courses_each, random_source):
+    """
+    Make (student_id, semester, start, end, course_code) rows: each student
+    takes courses_each courses in one semester, each meeting twice a week
+    for 90 minutes at a random hour between 08:00 and 20:00.
+    """
+    rows = []
+    for student_id in range(student_total):
+        for number in range(courses_each):
+            course_code = f"C{number:03d}"
+            for day in random_source.sample(range(5), 2):
+                start = day * 1440 + random_source.randrange(8 * 60, 20 * 60, 30)
+                rows.append((student_id, "Fall2024", start, start + 90, course_code))
+    return rows
+
+
+def benchmark_schedule_conflicts(student_total=50000, courses_each=6, busy_courses=40, checks=20000):
+    """
+    Compare the sorted sweep of find_conflicts() with comparing every pair
+    of each student's meetings, then compare a ScheduleIndex registration
+    check with scanning a busy student's meetings.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    random_source = random.Random(student_total)
+    rows = make_meeting_rows(student_total, courses_each, random_source)
+
+    def pairwise():
+        groups = {}
+        for student_id, semester, start, end, course_code in rows:
+            groups.setdefault((student_id, semester), []).append((start, end, course_code))
+        conflicts = set()
+        for (student_id, semester), meetings in groups.items():
+            for i, (start, end, course_code) in enumerate(meetings):
+                for other_start, other_end, other_code in meetings[i + 1:]:
+                    if start < other_end and other_start < end and course_code != other_code:
+                        pair = tuple(sorted((course_code, other_code)))
+                        conflicts.add((student_id, semester) + pair)
+        return sorted(conflicts)
+
+    start = time.perf_counter()
+    swept = find_conflicts(rows)
+    sweep_time = time.perf_counter() - start
+    start = time.perf_counter()
+    compared = pairwise()
+    pairwise_time = time.perf_counter() - start
+    assert swept == compared
+
+    # One student with many non-clashing meetings, checked against new courses
+    busy = [(day * 1440 + 8 * 60 + slot * 20, day * 1440 + 8 * 60 + slot * 20 + 15, f"B{slot:03d}")
+            for day in range(5) for slot in range(busy_courses)]
+    index = ScheduleIndex()
+    index.reset((1, "Fall2024", start, end, code) for start, end, code in busy)
+    candidates = []
+    for i in range(checks):
+        start = random_source.randrange(5) * 1440 + random_source.randrange(8 * 60, 21 * 60)
+        candidates.append(((start, start + 10),))
+
+    def scan(slots):
+        return [code for start, end in slots for other_start, other_end, code in busy
+                if start < other_end and other_start < end]
+
+    start = time.perf_counter()
+    indexed = [index.conflicts(1, "Fall2024", slots) for slots in candidates]
+    index_time = (time.perf_counter() - start) / checks
+    start = time.perf_counter()
+    scanned = [scan(slots) for slots in candidates]
+    scan_time = (time.perf_counter() - start) / checks
+    assert [sorted(found) for found in indexed] == [sorted(found) for found in scanned]
+
+    print(f"Schedule conflicts ({student_total} students, {len(rows)} meetings, {len(swept)} clashes)")
+    print(f"  Pairwise comparison:  {pairwise_time:8.3f} s")
+    print(f"  Sorted sweep:         {sweep_time:8.3f} s  ({pairwise_time / sweep_time:.1f}x)")
+    print(f"  Registration check against {len(busy)} meetings:")
+    print(f"    Linear scan:        {scan_time * 1e6:10.1f} us")
+    print(f"    ScheduleIndex:      {index_time * 1e6:10.1f} us  ({scan_time / index_time:.0f}x)")
+    print()
+
+
+def benchmark_term_loading(student_total=50000, course_total=500, years=4, rows_per_term=100000):
+    """
+    Compare start-up reading every term with start-up reading only the
+    active term (through enrollments.index, and by scanning a file without
+    the index), then compare compacting every term with compacting only
+    the loaded ones.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    semesters = [f"{season}{2020 + year}" for year in range(years) for season in ("Winter", "Spring", "Fall")]
+    semesters.sort(key=semester_sort_key)
+    previous = make_empty_directory()
+    try:
+        write_students_file(student_total)
+        write_courses_file(course_total)
+        rows = [(2000000000 + (i * 7) % student_total, f"BENCH{(i * 31) % course_total:05d}", semester, "B")
+                for semester in semesters for i in range(rows_per_term)]
+        CsvStorage().save_enrollments(rows)
+        students = StudentManager()
+        del rows
+
+        def start():
+            courses = CourseManager()
+            start_time = time.perf_counter()
+            enrollments = EnrollmentManager(students, courses)
+            return enrollments, time.perf_counter() - start_time
+
+        def start_all():
+            courses = CourseManager()
+            start_time = time.perf_counter()
+            enrollments = EnrollmentManager(students, courses, load_from_file=False)
+            enrollments.load_enrollments(CsvStorage().load_enrollments())
+            return enrollments, time.perf_counter() - start_time
+
+        full, full_time = start_all()
+        lazy, lazy_time = start()
+        assert lazy.active_semester == semesters[-1] == full.active_semester
+        assert all(course.enrolled_count == full.course_manager.find_course_by_code(course.course_code).enrolled_count
+                   for course in lazy.course_manager.courses)
+
+        start_time = time.perf_counter()
+        older = lazy.get_enrollment_count_for_course("BENCH00000", semesters[0])
+        older_time = time.perf_counter() - start_time
+        assert older == full.get_enrollment_count_for_course("BENCH00000", semesters[0])
+
+        # One registration, then compaction, with every term and with one loaded
+        assert full.register(2000000001, "BENCH00001", semesters[-1])
+        start_time = time.perf_counter()
+        full.compact_enrollments()
+        full_compact = time.perf_counter() - start_time
+        lazy = start()[0]
+        assert lazy.register(2000000002, "BENCH00001", semesters[-1])
+        start_time = time.perf_counter()
+        lazy.compact_enrollments()
+        lazy_compact = time.perf_counter() - start_time
+        expected = sorted(list(full.enrollment_rows()) + [(2000000002, "BENCH00001", semesters[-1], "")])
+        assert sorted(CsvStorage().load_enrollments()) == expected
+
+        os.remove(INDEX_FILE)
+        scanned, scan_time = start()
+        assert len(scanned.loaded_semesters()) == 1
+    finally:
+        os.chdir(previous)
+
+    row_total = len(semesters) * rows_per_term
+    print(f"Term loading ({row_total} enrollments in {len(semesters)} terms, {rows_per_term} per term)")
+    print(f"  Start-up, every term:              {full_time:8.3f} s")
+    print(f"  Start-up, active term (index):     {lazy_time:8.3f} s  ({full_time / lazy_time:.1f}x)")
+    print(f"  Start-up, active term (no index):  {scan_time:8.3f} s  ({full_time / scan_time:.1f}x)")
+    print(f"  Reading one older term on demand:  {older_time:8.3f} s")
+    print(f"  Compaction, every term:            {full_compact:8.3f} s")
+    print(f"  Compaction, loaded terms:          {lazy_compact:8.3f} s  ({full_compact / lazy_compact:.1f}x)")
+    print()
+
+
+def main():
+    """
+    Run all benchmarks.
+    """
+    print("=" * 70)
+    print("COURSE REGISTRATION SYSTEM BENCHMARKS")
+    print("=" * 70)
+    print()
+    benchmark_course_lookup()
+    benchmark_enrollment_memory()
+    benchmark_student_loading()
+    benchmark_startup()
+    benchmark_storage_engines()
+    benchmark_api_throughput()
+    benchmark_bulk_import()
+    stress_test_concurrent_registration()
+    benchmark_server()
+    benchmark_server_flush()
+    benchmark_name_search()
+    benchmark_autocomplete()
+    benchmark_fuzzy_search()
+    benchmark_listing()
+    benchmark_statistics()
+    benchmark_grade_analytics()
+    benchmark_transcripts()
+    benchmark_waitlist()
+    benchmark_schedule_conflicts()
+    benchmark_term_loading()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,28 +12,40 @@ Represents a single course in the system with course information,
 instructor details, and capacity limits.
 
 RESPONSIBILITIES:
-- Store course information (code, name, instructor, credits, capacity)
+- Store course information (code, name, instructor, credits, capacity,
+  meeting times)
 - Provide access to course data through properties
 - Format course information for display and file storage
 - Track enrollment count
 - Validate course data
 
 DATA FILE FORMAT (courses.csv):
-course_code,course_name,instructor,credits,capacity
-CPRG216,Python Programming,Dr. Anderson,3,30
+course_code,course_name,instructor,credits,capacity,meeting_times
+CPRG216,Python Programming,Dr. Anderson,3,30,Mon 09:00-10:30; Wed 09:00-10:30
+
+The meeting_times column may be empty or missing (older files); see
+meeting_times.py for its format.
+
+FILE DEPENDENCIES:
+- meeting_times.py (parse_meeting_times, format_meeting_times)
 
 """
 
+from meeting_times import format_meeting_times, parse_meeting_times
+
 
 class Course:
+    __slots__ = ("_course_code", "_course_name", "_instructor", "_credits",
+                 "_capacity", "_enrolled_count", "_meeting_times")
+
     def __init__(self, course_code=None, course_name=None, instructor=None,
-                 credits=None, capacity=None):
+                 credits=None, capacity=None, meeting_times=None):
         """
         Initialize a Course object.
 
         Author: [Humza Khan]
         Date: [Dec 07]
-        Version: 1.0
+        Version: 1.2
         """
         self._course_code = None
         self._course_name = None
@@ -41,12 +53,43 @@ class Course:
         self._credits = None
         self._capacity = None
         self._enrolled_count = 0
+        self._meeting_times = ()
 
         self.course_code = course_code
         self.course_name = course_name
         self.instructor = instructor
         self.credits = credits
         self.capacity = capacity
+        self.meeting_times = meeting_times
+
+    @classmethod
+    def from_trusted(cls, course_code, course_name, instructor, credits, capacity, meeting_times=""):
+        """
+        Create a Course from already-parsed file data without the setters.
+
+        Used for bulk loading. credits and capacity must already be ints;
+        both are range-checked together in one test. meeting_times is the
+        text from the file.
+
+        Raises:
+            ValueError: If credits or capacity is out of range, or the
+                meeting times are invalid
+
+        Author: [Humza Khan]
+        Date: [Dec 17]
+        """
+        if not (1 <= credits <= 4 and capacity >= 0):
+            raise ValueError(f"Invalid credits or capacity for course {course_code}")
+
+        course = object.__new__(cls)
+        course._course_code = course_code.upper()
+        course._course_name = course_name
+        course._instructor = instructor
+        course._credits = credits
+        course._capacity = capacity
+        course._enrolled_count = 0
+        course._meeting_times = parse_meeting_times(meeting_times) if meeting_times else ()
+        return course
 
     @property
     def course_code(self):
@@ -177,6 +220,54 @@ class Course:
             raise ValueError("Capacity must be 0 or greater")
         self._capacity = value
 
+    @property
+    def meeting_times(self):
+        """
+        Get the weekly meeting times.
+
+        Returns:
+            tuple: (start, end) pairs of minutes since Monday 00:00, empty
+                if the course has no meeting times
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self._meeting_times
+
+    @meeting_times.setter
+    def meeting_times(self, value):
+        """
+        Set the weekly meeting times.
+
+        Parameters:
+            value (str or tuple): Text such as "Mon 09:00-10:30; Wed
+                09:00-10:30", or (start, end) pairs; None or "" for none
+
+        Raises:
+            ValueError: If the text is not valid meeting times
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if not value:
+            self._meeting_times = ()
+        elif isinstance(value, str):
+            self._meeting_times = parse_meeting_times(value)
+        else:
+            self._meeting_times = tuple(sorted((int(start), int(end)) for start, end in value))
+
+    def meeting_times_text(self):
+        """
+        Get the meeting times as text, e.g. "Mon 09:00-10:30; Wed 09:00-10:30".
+
+        Returns:
+            str: Meeting times, "" if there are none
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return format_meeting_times(self._meeting_times)
+
     @property
     def enrolled_count(self):
         """
@@ -254,7 +345,8 @@ class Course:
         Author: [Ali Alimarah]
         Date: [Dec 10]
         """
-        return f"{self.course_code},{self.course_name},{self.instructor},{self.credits},{self.capacity}"
+        return (f"{self.course_code},{self.course_name},{self.instructor},{self.credits},{self.capacity},"
+                f"{self.meeting_times_text()}")
 
 
 # ==============================================================================
@@ -25,25 +25,106 @@ FILE DEPENDENCIES:
 - courses.csv (data file)
 - course.py (Course class)
 - enrollments.csv (to count enrollments)
+- persistence.py (flush policy)
+- storage.py (CsvStorage / SqliteStorage storage engines)
+- operation_result.py (OperationResult class)
+- search_index.py (TrigramIndex class)
+- prefix_index.py (PrefixTrie class)
+- fuzzy_index.py (FuzzyIndex class)
+- listing.py (TableListing class)
+- enrollment_stats.py (EnrollmentStats class)
+- meeting_times.py (format of the meeting times prompt)
 
 """
 
 from course import Course
+from enrollment_stats import EnrollmentStats
+from fuzzy_index import FuzzyIndex
+from listing import TableListing
+from meeting_times import MEETING_TIMES_EXAMPLE
+from operation_result import COURSE_EXISTS, COURSE_NOT_FOUND, INVALID_VALUE, OperationResult
+from persistence import DirtyTracker, without_garbage_collection
+from prefix_index import PrefixTrie
+from search_index import TrigramIndex
+from storage import CsvStorage
+
+COURSE_HEADER = (f"{'Code':<10}{'Course Name':<30}{'Instructor':<18}{'Credits':<9}"
+                 f"{'Enrolled':<9}{'Capacity':<9}{'Status':<8}")
 
 
 class CourseManager:
-    def __init__(self):
+    def __init__(self, flush_policy=None, load_from_file=True, storage=None):
         """
         Initialize the CourseManager.
 
         Creates an empty list of courses and loads data from courses.csv file.
 
+        Parameters:
+            flush_policy (FlushPolicy): When changes are written to
+                courses.csv (after every change if None)
+            load_from_file (bool): Read courses.csv now; pass False when
+                the data will come from load_courses() instead
+            storage (CsvStorage or SqliteStorage): Where courses are
+                stored (the csv files if None)
+
+        The _course_index dictionary maps each upper-case course code to its
+        Course object so lookups by code do not have to scan the list, and
+        _name_index (a TrigramIndex, built at the first search) does the
+        same for name searches. _code_trie and _name_trie (PrefixTries,
+        built when first used) complete partly typed codes and names, and
+        _fuzzy_index finds names and instructors despite typos.
+
+        stats (an EnrollmentStats) keeps the course count, total enrolled
+        and most-enrolled courses up to date as counts change.
+
+        _change_listeners are called with a course code whenever a course
+        is added, removed or has its name, credits or meeting times
+        changed (and with
+        None when every course is replaced), so caches built from course
+        details, such as the EnrollmentManager's transcripts, can drop
+        just the affected entries. _seat_listeners are called with a
+        course code when its capacity changes, so waiting students can be
+        given any new seats.
+
         Author: [Ali Alimarah]
         Date: [Dec 10]
-        Version: 1.0
+        Version: 2.1
         """
+        if storage is None:
+            storage = CsvStorage()
+        self.storage = storage
         self._courses = []
-        self.read_courses_file()
+        self._course_index = {}
+        self._name_index = TrigramIndex(_course_name)
+        self._code_trie = PrefixTrie(_code_key)
+        self._name_trie = PrefixTrie(_name_key)
+        self._fuzzy_index = FuzzyIndex(_course_name_and_instructor)
+        self.stats = EnrollmentStats()
+        self._change_listeners = []
+        self._seat_listeners = []
+        self._tracker = DirtyTracker(self._commit_changes, flush_policy)
+        if load_from_file:
+            self.read_courses_file()
+
+    def add_change_listener(self, listener):
+        """
+        Call listener(course_code) after a course is added, removed or has
+        its name, credits or meeting times changed, and listener(None)
+        after all courses are replaced.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._change_listeners.append(listener)
+
+    def add_seat_listener(self, listener):
+        """
+        Call listener(course_code) after a course's capacity is changed.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._seat_listeners.append(listener)
 
     @property
     def courses(self):
@@ -58,51 +139,69 @@ class CourseManager:
         """
         return self._courses
 
+    @without_garbage_collection
     def read_courses_file(self):
         """
-        Read course data from courses.csv and populate the courses list.
+        Read course data from the storage engine (courses.csv by default)
+        and populate the courses list.
 
         Author: [Humza Khan]
         Date: [Dec 10]
         """
-        self._courses = []
-        try:
-            with open("courses.csv", "r") as file:
-                header = file.readline()
-                for line in file:
-                    line = line.strip()
-                    if line == "":
-                        continue
+        self.load_courses(self.storage.load_courses())
 
-                    parts = line.split(",")
-                    if len(parts) != 5:
-                        continue
+    @without_garbage_collection
+    def load_courses(self, rows):
+        """
+        Replace all courses with already-validated rows, e.g. from a snapshot.
 
-                    course_code = parts[0]
-                    course_name = parts[1]
-                    instructor = parts[2]
-                    credits = int(parts[3])
-                    capacity = int(parts[4])
+        Enrollment counts start at 0 until the EnrollmentManager recounts them.
 
-                    course = Course(course_code, course_name, instructor, credits, capacity)
-                    self._courses.append(course)
+        Parameters:
+            rows (iterable): (course_code, course_name, instructor, credits,
+                capacity, meeting_times) tuples; meeting_times may be left
+                out
 
-        except FileNotFoundError:
-            self._courses = []
+        Author: [Humza Khan]
+        Date: [Dec 18]
+        """
+        self._courses = [Course.from_trusted(*row) for row in rows]
+        self._rebuild_course_index()
+
+    def course_rows(self):
+        """
+        Get every course as a plain tuple, the format load_courses() takes.
+
+        Returns:
+            list: (course_code, course_name, instructor, credits, capacity,
+                meeting_times) tuples
+
+        Author: [Humza Khan]
+        Date: [Dec 18]
+        """
+        return [_course_row(c) for c in self._courses]
 
     def write_courses_to_file(self):
         """
-        Write all course data to courses.csv file.
+        Write all course data to the storage engine (courses.csv by
+        default), replacing what is stored.
 
-        Writes header line followed by all courses in CSV format.
+        The csv file is replaced atomically, so it is never left half written.
 
         Author: [Humza Khan]
         Date: [Dec 11]
         """
-        with open("courses.csv", "w") as file:
-            file.write("course_code,course_name,instructor,credits,capacity\\n")
-            for course in self._courses:
-                file.write(course.to_csv_format() + "\n")
+        self.storage.save_courses(self.course_rows())
+        self._tracker.mark_clean()
+
+    def flush(self):
+        """
+        Write any unsaved course changes to courses.csv now.
+
+        Author: [Humza Khan]
+        Date: [Dec 15]
+        """
+        self._tracker.flush()
 
     def add_course(self):
         """
@@ -116,20 +215,52 @@ class CourseManager:
         instructor = input("Enter instructor name: ").strip()
         credits_text = input("Enter number of credits (1-4): ").strip()
         capacity_text = input("Enter course capacity: ").strip()
+        meeting_text = input(f"Enter meeting times (e.g., {MEETING_TIMES_EXAMPLE}) "
+                             "or press Enter for none: ").strip()
+
+        print(self.create_course(code, name, instructor, credits_text, capacity_text, meeting_text).message)
+
+    def create_course(self, course_code, course_name, instructor, credits, capacity, meeting_times=""):
+        """
+        Add a new course and save it.
 
+        Parameters:
+            course_code, course_name, instructor (str): Course details
+            credits (int or str): Credits, 1-4
+            capacity (int or str): Maximum number of students
+            meeting_times (str): Weekly meetings, e.g.
+                "Mon 09:00-10:30; Wed 09:00-10:30" (none if empty)
+
+        Returns:
+            OperationResult: The new Course as value on success
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        code = str(course_code).strip().upper()
         if self.find_course_by_code(code) is not None:
-            print(f"Error: Course code {code} already exists.")
-            return
+            return OperationResult.failed(COURSE_EXISTS, f"Error: Course code {code} already exists.")
 
         try:
-            credits = int(credits_text)
-            capacity = int(capacity_text)
-            course = Course(code, name, instructor, credits, capacity)
-            self._courses.append(course)
-            self.write_courses_to_file()
-            print(f"Course [{code}] added successfully.")
-        except ValueError:
-            print("Error: Invalid credits or capacity. Course not added.")
+            course = Course(code, course_name, instructor, int(credits), int(capacity))
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_VALUE, "Error: Invalid credits or capacity. Course not added.")
+        try:
+            course.meeting_times = meeting_times
+        except (TypeError, ValueError) as error:
+            return OperationResult.failed(INVALID_VALUE, f"Error: {error}. Course not added.")
+
+        self._courses.append(course)
+        self._course_index[course.course_code] = course
+        self._name_index.add(course)
+        self._code_trie.add(course)
+        self._name_trie.add(course)
+        self._fuzzy_index.add(course)
+        self.stats.add_course(course)
+        self.storage.insert_course(_course_row(course))
+        self._tracker.mark_dirty()
+        self._course_changed(course.course_code)
+        return OperationResult.ok(f"Course [{code}] added successfully.", course)
 
     def remove_course(self):
         """
@@ -139,14 +270,35 @@ class CourseManager:
         Date: [Dec 11]
         """
         code = input("Enter course code to remove: ").strip().upper()
+        print(self.delete_course(code).message)
+
+    def delete_course(self, course_code):
+        """
+        Remove a course from the system and save the change.
+
+        Returns:
+            OperationResult: The removed Course as value on success
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        code = str(course_code).strip().upper()
         course = self.find_course_by_code(code)
         if course is None:
-            print(f"Error: No course found with code {code}")
-            return
+            return OperationResult.failed(COURSE_NOT_FOUND, f"Error: No course found with code {code}")
 
         self._courses.remove(course)
-        self.write_courses_to_file()
-        print(f"Course {course.course_code} - {course.course_name} removed successfully.")
+        if self._course_index.get(course.course_code) is course:
+            del self._course_index[course.course_code]
+        self._name_index.remove(course)
+        self._code_trie.remove(course)
+        self._name_trie.remove(course)
+        self._fuzzy_index.remove(course)
+        self.stats.remove_course(course)
+        self.storage.delete_course(course.course_code)
+        self._tracker.mark_dirty()
+        self._course_changed(course.course_code)
+        return OperationResult.ok(f"Course {course.course_code} - {course.course_name} removed successfully.", course)
 
     def search_course_by_code(self):
         """
@@ -162,6 +314,9 @@ class CourseManager:
             return course
 
         print(f"Error: No course found with code {code}")
+        suggestions = self.complete_course_code(code, 5)
+        if suggestions:
+            print("Did you mean: " + ", ".join(c.course_code for c in suggestions))
         return None
 
     def search_courses_by_name(self):
@@ -169,31 +324,90 @@ class CourseManager:
         Search for courses by name and display results.
 
         Searches for partial matches in course names (case-insensitive).
+        If nothing matches, the closest course names and instructors
+        allowing for typos are shown instead.
 
         Author: [Humza Khan]
         Date: [Dec 11]
         """
         term = input("Enter course name to search: ").strip().lower()
-        matches = []
-        for course in self._courses:
-            if term in course.course_name.lower():
-                matches.append(course)
+        matches = self.find_courses_by_name(term)
 
         if len(matches) == 0:
-            print(f"No courses found matching '{term}'")
-            return
+            matches = [course for course, typos in self.fuzzy_find_courses(term)]
+            if len(matches) == 0:
+                print(f"No courses found matching '{term}'")
+                return
+            print(f"No courses found matching '{term}'. Closest matches:")
 
         print("\n" + "=" * 92)
         print("COURSE SEARCH RESULTS")
         print("=" * 92)
-        print(f"{'Code':<10}{'Course Name':<30}{'Instructor':<18}{'Credits':<9}{'Enrolled':<9}{'Capacity':<9}{'Status':<8}")
+        print(COURSE_HEADER)
         print("-" * 92)
-        for course in matches:
-            status = "Full" if course.is_full() else "Open"
-            print(f"{course.course_code:<10}{course.course_name:<30}{course.instructor:<18}{course.credits:<9}{course.enrolled_count:<9}{course.capacity:<9}{status:<8}")
+        print("\n".join(_course_line(course) for course in matches))
         print("=" * 92)
         print(f"Matches: {len(matches)}")
 
+    def find_courses_by_name(self, term):
+        """
+        Find courses whose name contains term (case-insensitive).
+
+        Returns:
+            list: Matching Course objects, in list order
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        return self._name_index.search(term.strip())
+
+    def fuzzy_find_courses(self, term, limit=20):
+        """
+        Find courses whose name or instructor is close to term, allowing
+        a few typos in each word (e.g. "Programing" finds "Programming").
+
+        Parameters:
+            term (str): One or more words
+            limit (int): Maximum number of courses to return
+
+        Returns:
+            list: (Course, typos) tuples, fewest typos first
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self._fuzzy_index.search(term, limit)
+
+    def complete_course_code(self, prefix, limit=10):
+        """
+        Find courses whose code starts with prefix (case-insensitive),
+        for autocompletion, e.g. "CPRG2".
+
+        Parameters:
+            prefix (str): Start of the course code
+            limit (int): Maximum number of courses to return
+
+        Returns:
+            list: Course objects, sorted by code
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self._code_trie.complete(str(prefix).strip(), limit)
+
+    def complete_course_name(self, prefix, limit=10):
+        """
+        Find courses whose name starts with prefix (case-insensitive),
+        for autocompletion.
+
+        Returns:
+            list: Course objects, sorted by name
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self._name_trie.complete(prefix.strip(), limit)
+
     def edit_course_info(self):
         """
         Edit an existing course's information.
@@ -202,35 +416,90 @@ class CourseManager:
         Date: [Dec 11]
         """
         code = input("Enter course code to edit: ").strip().upper()
-        course = self.find_course_by_code(code)
-        if course is None:
+        if self.find_course_by_code(code) is None:
             print(f"Error: No course found with code {code}")
             return
 
-        new_name = input("Enter new course name (or press Enter to skip): ")
-        if new_name.strip() != "":
-            course.course_name = new_name.strip()
+        new_name = input("Enter new course name (or press Enter to skip): ").strip()
+        new_instructor = input("Enter new instructor (or press Enter to skip): ").strip()
+        new_credits = input("Enter new credits 1-4 (or press Enter to skip): ").strip()
+        new_capacity = input("Enter new capacity (or press Enter to skip): ").strip()
+        new_meetings = input("Enter new meeting times, - for none (or press Enter to skip): ").strip()
+        if new_meetings == "-":
+            new_meetings = ""
+        elif new_meetings == "":
+            new_meetings = None
+
+        result = self.update_course(code, new_name or None, new_instructor or None,
+                                    new_credits or None, new_capacity or None, new_meetings)
+        for warning in result.warnings:
+            print(warning)
+        print(result.message)
+
+    def update_course(self, course_code, course_name=None, instructor=None, credits=None,
+                      capacity=None, meeting_times=None):
+        """
+        Change a course's details and save the change.
 
-        new_instructor = input("Enter new instructor (or press Enter to skip): ")
-        if new_instructor.strip() != "":
-            course.instructor = new_instructor.strip()
+        Fields left as None are not changed. Invalid credits, capacity or
+        meeting times are ignored and reported in the result's warnings;
+        the other fields are still updated.
 
-        new_credits = input("Enter new credits 1-4 (or press Enter to skip): ")
-        if new_credits.strip() != "":
-            try:
-                course.credits = int(new_credits.strip())
-            except ValueError:
-                print("Error: Invalid credits. Credits not updated.")
+        Parameters:
+            course_code (str): Code of the course to change
+            credits (int or str): New credits, 1-4
+            capacity (int or str): New maximum number of students
+            meeting_times (str): New weekly meetings ("" for none)
 
-        new_capacity = input("Enter new capacity (or press Enter to skip): ")
-        if new_capacity.strip() != "":
-            try:
-                course.capacity = int(new_capacity.strip())
-            except ValueError:
-                print("Error: Invalid capacity. Capacity not updated.")
+        Returns:
+            OperationResult: The Course as value on success
 
-        self.write_courses_to_file()
-        print(f"Course {course.course_code} updated successfully!")
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        code = str(course_code).strip().upper()
+        course = self.find_course_by_code(code)
+        if course is None:
+            return OperationResult.failed(COURSE_NOT_FOUND, f"Error: No course found with code {code}")
+
+        if course_name is not None:
+            course.course_name = course_name
+            self._name_index.update(course)
+            self._name_trie.update(course)
+        if instructor is not None:
+            course.instructor = instructor
+        if course_name is not None or instructor is not None:
+            self._fuzzy_index.update(course)
+
+        warnings = []
+        old_credits = course.credits
+        old_capacity = course.capacity
+        old_meeting_times = course.meeting_times
+        if credits is not None:
+            try:
+                course.credits = int(credits)
+            except (TypeError, ValueError):
+                warnings.append("Error: Invalid credits. Credits not updated.")
+        if capacity is not None:
+            try:
+                course.capacity = int(capacity)
+            except (TypeError, ValueError):
+                warnings.append("Error: Invalid capacity. Capacity not updated.")
+        if meeting_times is not None:
+            try:
+                course.meeting_times = meeting_times
+            except (TypeError, ValueError) as error:
+                warnings.append(f"Error: {error}. Meeting times not updated.")
+
+        self.storage.update_course(_course_row(course))
+        self._tracker.mark_dirty()
+        if (course_name is not None or course.credits != old_credits
+                or course.meeting_times != old_meeting_times):
+            self._course_changed(course.course_code)
+        if course.capacity != old_capacity:
+            for listener in self._seat_listeners:
+                listener(course.course_code)
+        return OperationResult.ok(f"Course {course.course_code} updated successfully!", course, warnings)
 
     def display_course_info(self, course):
         """
@@ -248,28 +517,28 @@ class CourseManager:
         print(f"Instructor:   {course.instructor}")
         print(f"Credits:      {course.credits}")
         print(f"Capacity:     {course.capacity}")
+        print(f"Meets:        {course.meeting_times_text() or '-'}")
         print(f"Enrolled:     {course.enrolled_count}")
         print(f"Available:    {course.get_available_seats()}")
         print(f"Status:       {status}")
         print("=" * 42)
 
-    def display_courses_list(self):
+    def display_courses_list(self, offset=0, limit=None, page_size=None):
         """
-        Display all courses in a formatted table.
+        Display courses in a formatted table, written a page at a time
+        (see listing.py).
+
+        Parameters:
+            offset (int): Number of courses to skip
+            limit (int): Maximum number of courses to show (all if None)
+            page_size (int): Courses per page, asking before each next
+                page (one table without questions if None)
 
         Author: [Humza Khan]
         Date: [Dec 11]
         """
-        print("=" * 92)
-        print("COURSE LIST")
-        print("=" * 92)
-        print(f"{'Code':<10}{'Course Name':<30}{'Instructor':<18}{'Credits':<9}{'Enrolled':<9}{'Capacity':<9}{'Status':<8}")
-        print("-" * 92)
-        for course in self._courses:
-            status = "Full" if course.is_full() else "Open"
-            print(f"{course.course_code:<10}{course.course_name:<30}{course.instructor:<18}{course.credits:<9}{course.enrolled_count:<9}{course.capacity:<9}{status:<8}")
-        print("=" * 92)
-        print(f"Total Courses: {len(self._courses)}")
+        listing = TableListing("COURSE LIST", 92, COURSE_HEADER, _course_line, "Total Courses")
+        listing.render(self._courses, len(self._courses), offset, limit, page_size)
 
     def get_course_count(self):
         """
@@ -293,22 +562,145 @@ class CourseManager:
         Author: [Ali Alimarah]
         Date: [Dec 11]
         """
-        code = str(course_code).upper()
+        return self._course_index.get(str(course_code).upper())
+
+    def _rebuild_course_index(self):
+        """
+        Rebuild the course code index and statistics from the courses
+        list. The name search index and the tries are rebuilt when next
+        used.
+
+        If the file contains the same code twice, the first course wins,
+        matching the order a linear search would find them in.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 14]
+        """
+        self._course_index = {}
+        self._name_index.reset(self._courses)
+        self._code_trie.reset(self._courses)
+        self._name_trie.reset(self._courses)
+        self._fuzzy_index.reset(self._courses)
+        self.stats.reset(self._courses)
         for course in self._courses:
-            if course.course_code.upper() == code:
-                return course
-        return None
+            if course.course_code is not None:
+                self._course_index.setdefault(course.course_code.upper(), course)
+        self._course_changed(None)
 
     def update_enrollment_counts(self, enrollment_manager):
         """
         Update enrollment counts for all courses based on actual enrollments.
 
+        Each course is counted in the enrollment manager's active term.
+        This is a full recount, used when enrollments are loaded or the
+        active term changes. Single registrations and drops use
+        adjust_enrollment_count() instead.
+
         Author: [Ali Alimarah]
         Date: [Dec 11]
         """
         for course in self._courses:
             count = enrollment_manager.get_enrollment_count_for_course(course.course_code)
             course.set_enrolled_count(count)
+        self.stats.reset(self._courses)
+
+    def adjust_enrollment_count(self, course_code, change):
+        """
+        Add change (+1 or -1) to one course's enrollment count.
+
+        Parameters:
+            course_code (str): Course code
+            change (int): Amount to add to the count
+
+        Author: [Ali Alimarah]
+        Date: [Dec 14]
+        """
+        course = self.find_course_by_code(course_code)
+        if course is not None:
+            course.set_enrolled_count(course.enrolled_count + change)
+            self.stats.count_changed(course)
+
+    def _course_changed(self, course_code):
+        """
+        Tell the change listeners that a course changed (None: all of them).
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        for listener in self._change_listeners:
+            listener(course_code)
+
+    def _commit_changes(self):
+        """
+        Make reported course changes durable in the storage engine.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self.storage.commit_courses(self.course_rows)
+
+
+def _course_row(course):
+    """
+    Convert a Course to the row tuple used by the storage engines.
+
+    Author: [Humza Khan]
+    Date: [Dec 19]
+    """
+    return (course.course_code, course.course_name, course.instructor,
+            course.credits, course.capacity, course.meeting_times_text())
+
+
+def _course_line(course):
+    """
+    Format a Course as a line of the course tables.
+
+    Author: [Humza Khan]
+    Date: [Dec 11]
+    """
+    status = "Full" if course.is_full() else "Open"
+    return (f"{course.course_code:<10}{course.course_name:<30}{course.instructor:<18}{course.credits:<9}"
+            f"{course.enrolled_count:<9}{course.capacity:<9}{status:<8}")
+
+
+def _course_name(course):
+    """
+    Get the field searched by find_courses_by_name().
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return (course.course_name,)
+
+
+def _code_key(course):
+    """
+    Get the key completed by complete_course_code().
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return course.course_code
+
+
+def _name_key(course):
+    """
+    Get the key completed by complete_course_name().
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return course.course_name
+
+
+def _course_name_and_instructor(course):
+    """
+    Get the fields searched by fuzzy_find_courses().
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return (course.course_name, course.instructor)
 
 
 # ==============================================================================
@@ -0,0 +1,115 @@
+"""
+EnrollmentList Class - Course Registration System
+==================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Stores enrollment dictionaries in the order they were added, like a list,
+but removes a row in O(1) instead of scanning and comparing every row.
+
+RESPONSIBILITIES:
+- Append rows and remember each row's position by identity
+- Mark removed rows as deleted (the slot is set to None)
+- Compact the list once at least half of its slots are deleted
+- Iterate over and count the rows that are not deleted, all of them or
+  one semester's
+
+NOTE: unlike EnrollmentTable.compact(), compacting does not change the
+rows themselves, so the manager's indexes stay valid.
+
+"""
+
+
+class EnrollmentList:
+    def __init__(self):
+        """
+        Initialize an empty EnrollmentList.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self._rows = []
+        self._positions = {}
+        self._deleted_count = 0
+
+    def append(self, row):
+        """
+        Add a row at the end.
+
+        Parameters:
+            row (dict): Enrollment dictionary
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._positions[id(row)] = len(self._rows)
+        self._rows.append(row)
+
+    def remove(self, row):
+        """
+        Remove a row, found by identity rather than by comparing rows.
+
+        Parameters:
+            row (dict): Enrollment dictionary stored in this list
+
+        Raises:
+            ValueError: If the row is not in the list
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        position = self._positions.pop(id(row), None)
+        if position is None:
+            raise ValueError("Row is not in the list")
+        self._rows[position] = None
+        self._deleted_count += 1
+        if self._deleted_count * 2 >= len(self._rows):
+            self.compact()
+
+    def compact(self):
+        """
+        Drop the slots of deleted rows and renumber the positions.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._rows = [row for row in self._rows if row is not None]
+        self._positions = {id(row): position for position, row in enumerate(self._rows)}
+        self._deleted_count = 0
+
+    def __len__(self):
+        """
+        Get the number of rows that are not deleted.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return len(self._rows) - self._deleted_count
+
+    def __iter__(self):
+        """
+        Iterate over the rows that are not deleted, in the order they were
+        added.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        for row in self._rows:
+            if row is not None:
+                yield row
+
+    def rows_in_semester(self, semester):
+        """
+        Iterate over the rows of one semester that are not deleted, in the
+        order they were added.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        for row in self._rows:
+            if row is not None and row["semester"] == semester:
+                yield row
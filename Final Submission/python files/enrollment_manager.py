@@ -14,12 +14,19 @@ data and provides operations for registering/dropping students from courses.
 RESPONSIBILITIES:
 - Load enrollment data from enrollments.csv file
 - Save enrollment data back to enrollments.csv file
-- Register students in courses (with validation)
+- Register students in courses (with validation, including clashing
+  meeting times), with seats and duplicates counted per term
 - Drop students from courses
 - Display student schedules
 - Display course rosters
 - Check enrollment status
 - Assign/update grades
+- Import files of registrations in bulk
+- Keep waitlists for full courses and register waiting students as
+  seats free up
+- Find every clash of meeting times among the enrollments
+- Keep registrations correct when several threads use the manager
+- Read only the current term at start-up and older terms when needed
 
 DATA FILE FORMAT (enrollments.csv):
 student_id,course_code,semester,grade
@@ -28,77 +35,321 @@ student_id,course_code,semester,grade
 
 NOTE: grade field is empty until assigned
 
+Changes are journalled to enrollments.journal by default. The file is
+written grouped by semester and enrollments.index records where each
+semester starts, so one term can be read without the rest; see
+storage.py.
+
 FILE DEPENDENCIES:
 - enrollments.csv (data file)
+- enrollments.index (where each semester is in enrollments.csv)
 - student_manager.py (StudentManager class)
 - course_manager.py (CourseManager class)
+- persistence.py (flush policy)
+- storage.py (CsvStorage / SqliteStorage storage engines)
+- operation_result.py (OperationResult class)
+- locks.py (LockTable class)
+- enrollment_list.py (EnrollmentList class)
+- enrollment_table.py (EnrollmentTable class, for columnar storage)
+- listing.py (TableListing class)
+- grade_analytics.py (GradeAnalytics class)
+- semesters.py (semester_sort_key, is_valid_semester)
+- transcript.py (Transcript class)
+- waitlist.py (CourseWaitlists class), saved in waitlist.csv
+- schedule_index.py (ScheduleIndex class, find_conflicts)
 
 """
 
+import contextlib
+import threading
+from itertools import islice
+
+from enrollment_list import EnrollmentList
+from enrollment_table import EnrollmentTable
+from grade_analytics import GradeAnalytics
+from listing import TableListing
+from locks import LockTable
+from operation_result import (ALREADY_ENROLLED, ALREADY_WAITLISTED, COURSE_FULL, COURSE_NOT_FOUND,
+                              FILE_NOT_FOUND, INVALID_GRADE, INVALID_ROW, INVALID_SEMESTER, INVALID_STUDENT_ID,
+                              NOT_ENROLLED, NOT_WAITLISTED, SEATS_AVAILABLE, STUDENT_NOT_FOUND,
+                              TIME_CONFLICT, OperationResult)
+from persistence import DirtyTracker, without_garbage_collection
+from schedule_index import ScheduleIndex, find_conflicts
+from semesters import is_valid_semester, semester_sort_key
+from storage import CsvStorage
+from transcript import Transcript
+from waitlist import DEFAULT_PRIORITY, CourseWaitlists
+
+VALID_GRADES = ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D", "F"]
+
 
 class EnrollmentManager:
-    def __init__(self, student_manager, course_manager):
+    def __init__(self, student_manager, course_manager, flush_policy=None,
+                 columnar=False, load_from_file=True, storage=None,
+                 waitlist_priority=DEFAULT_PRIORITY, active_semester=None):
         """
         Initialize the EnrollmentManager.
 
+        Enrollments are stored in _enrollments, either as an EnrollmentList
+        of dictionaries or, with columnar=True, as an EnrollmentTable whose
+        rows are read and written the same way (e["grade"]) but take much
+        less memory. Both remove a row in O(1) and reclaim the space
+        later. Besides _enrollments, three indexes point at the same
+        enrollments:
+        - _by_student: student ID -> list of enrollments
+        - _by_course: course code -> EnrollmentList of enrollments, so a
+          drop does not scan the whole course
+        - _by_key: (student ID, course code, semester) -> enrollment
+
+        _transcripts caches each student's Transcript (GPA and standing)
+        once asked for. Registering, dropping or grading removes only that
+        student's entry; a course's name or credits changing removes the
+        entries of the students enrolled in it (the CourseManager reports
+        these changes to _course_changed()).
+
+        _schedule (a ScheduleIndex) holds the meeting times of every
+        student's courses per semester, so a registration is checked for
+        clashes in O(log n). It is kept up to date with the other indexes
+        and re-indexes a course whose meeting times change.
+
+        waitlists (a CourseWaitlists) holds the students waiting for a
+        seat in a full course. When a student drops, or a course's
+        capacity is raised, the next waiting students are registered
+        (_promote_waitlisted()).
+
+        Terms: a course's capacity applies to each semester separately,
+        and a student may take a course again in a later semester.
+        _term_counts holds the number of enrollments per (course code,
+        semester); a course's enrolled_count is its count in
+        active_semester. The active term is the one given to the
+        constructor, or else the latest valid term with enrollments when
+        they are first loaded (the first registration's term if there
+        are none yet). It is never moved by a later registration. Only
+        the active term is read at start-up. _semesters holds the terms
+        read so far; the others are read from the storage engine the first
+        time something names them (_load_semesters()), e.g. a registration
+        in that term, and a transcript or listing over all terms reads
+        them all (_load_all()). Drops, grades and lookups without a
+        semester use the active term.
+
+        Thread safety: registrations, drops and grades hold the lock of
+        their course and student (in _locks) while they check and change
+        data, so threads working on different courses run side by side.
+        _data_lock is held only for the short moment the shared store,
+        indexes, storage engine and flush tracker are changed; flush()
+        writes to disk after releasing it. _flush_lock keeps writes in
+        order and is always taken after _data_lock, never before.
+
+        Parameters:
+            student_manager (StudentManager): Used to look up students
+            course_manager (CourseManager): Used to look up courses
+            flush_policy (FlushPolicy): When changes are written to disk
+                (after every change if None)
+            columnar (bool): Store enrollments in an EnrollmentTable
+            load_from_file (bool): Read enrollments.csv now; pass False when
+                the data will come from load_enrollments() instead
+            storage (CsvStorage or SqliteStorage): Where enrollments are
+                stored (enrollments.csv plus enrollments.journal if None)
+            waitlist_priority (tuple): Waitlist order, as key names from
+                waitlist.PRIORITY_KEYS
+            active_semester (str): Semester whose enrollments are shown
+                in enrolled_count (the latest stored semester if None)
+
         Author: [Humza Khan]
         Date: [Dec 11]
-        Version: 1.0
+        Version: 2.1
         """
+        if storage is None:
+            storage = CsvStorage()
         self.student_manager = student_manager
         self.course_manager = course_manager
-        self._enrollments = []
-        self.read_enrollments_file()
-        self.course_manager.update_enrollment_counts(self)
-
+        self.storage = storage
+        self.columnar = columnar
+        self._tracker = DirtyTracker(self._commit_changes, flush_policy)
+        self._enrollments = EnrollmentList()
+        self._by_student = {}
+        self._by_course = {}
+        self._by_key = {}
+        self._transcripts = {}
+        self._schedule = ScheduleIndex()
+        self._term_counts = {}
+        self.active_semester = active_semester
+        self._semesters = set()
+        self._all_semesters_loaded = False
+        self.waitlists = CourseWaitlists(waitlist_priority)
+        self._locks = LockTable()
+        self._data_lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        course_manager.add_change_listener(self._course_changed)
+        course_manager.add_seat_listener(self._promote_waitlisted)
+        if load_from_file:
+            self.read_enrollments_file()
+            self.read_waitlist_file()
+
+    @without_garbage_collection
     def read_enrollments_file(self):
         """
-        Read enrollment data from enrollments.csv.
+        Read enrollment data from the storage engine (enrollments.csv plus
+        enrollments.journal by default) and recount every course.
+
+        Only the active term is read, plus any term that was read before
+        (so reading again after another program's change keeps them).
 
         Author: [Humza Khan]
         Date: [Dec 11]
         """
-        self._enrollments = []
-        try:
-            with open("enrollments.csv", "r") as file:
-                header = file.readline()
-                for line in file:
-                    line = line.strip()
-                    if line == "":
-                        continue
+        with self._data_lock:
+            stored = self.storage.enrollment_semesters()
+            if self._all_semesters_loaded:
+                semesters = None
+            else:
+                active = self.active_semester if self.active_semester is not None else _latest_semester(stored)
+                semesters = self._semesters | {active} if active is not None else set(self._semesters)
+                if semesters.issuperset(stored):
+                    semesters = None
+            self.load_enrollments(self.storage.load_enrollments(semesters), semesters)
+
+    @without_garbage_collection
+    def load_enrollments(self, rows, semesters=None):
+        """
+        Replace all enrollments with already-validated rows, e.g. from a
+        snapshot, and recount every course.
 
-                    parts = line.split(",")
-                    if len(parts) < 4:
-                        continue
+        Parameters:
+            rows (iterable): (student_id, course_code, semester, grade) tuples
+            semesters (iterable): The semesters the rows cover; the others
+                are read from the storage engine when needed (None if the
+                rows cover every semester)
 
-                    student_id = int(parts[0])
-                    course_code = parts[1].strip().upper()
-                    semester = parts[2].strip()
-                    grade = parts[3].strip()
-
-                    enrollment = {
-                        "student_id": student_id,
-                        "course_code": course_code,
-                        "semester": semester,
-                        "grade": grade
-                    }
-                    self._enrollments.append(enrollment)
-        except FileNotFoundError:
-            self._enrollments = []
+        Author: [Humza Khan]
+        Date: [Dec 18]
+        """
+        with self._data_lock:
+            self._enrollments = self._new_enrollment_store()
+            for row in rows:
+                self._store_enrollment(*row)
+            self._rebuild_enrollment_indexes()
+            self._all_semesters_loaded = semesters is None
+            self._semesters = set(semesters) if semesters is not None else set()
+            if self.active_semester is None:
+                self.active_semester = _latest_semester({semester for code, semester in self._term_counts})
+            elif not self._all_semesters_loaded:
+                self._load_semesters((self.active_semester,))
+            self._transcripts = {}
+            self._rebuild_schedule()
+            self.course_manager.update_enrollment_counts(self)
+
+    def loaded_semesters(self):
+        """
+        Get the semesters whose enrollments are in memory.
+
+        Returns:
+            set or None: Semesters, None if every semester is loaded
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._data_lock:
+            if self._all_semesters_loaded:
+                return None
+            return set(self._semesters)
+
+    def read_waitlist_file(self):
+        """
+        Read the waitlist from the storage engine (waitlist.csv by default).
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.load_waitlist(self.storage.load_waitlist())
+
+    def load_waitlist(self, rows):
+        """
+        Replace every waitlist with already-validated rows.
+
+        Parameters:
+            rows (iterable): (student_id, course_code, semester,
+                request_number) tuples
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        years = {s.student_id: s.year for s in self.student_manager.students}
+        with self._data_lock:
+            self.waitlists.reset(rows, years)
+
+    def waitlist_rows(self):
+        """
+        Get every waitlist entry as a plain tuple, the format
+        load_waitlist() takes.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return list(self.waitlists.rows())
+
+    def enrollment_rows(self):
+        """
+        Generate every loaded enrollment as a plain tuple, the format
+        load_enrollments() takes (see loaded_semesters()).
+
+        Yields:
+            tuple: (student_id, course_code, semester, grade)
+
+        Author: [Humza Khan]
+        Date: [Dec 18]
+        """
+        for e in self._enrollments:
+            yield (e["student_id"], e["course_code"], e["semester"], e["grade"])
 
     def write_enrollments_to_file(self):
         """
-        Write all enrollment data to enrollments.csv file.
+        Write all enrollment data to the storage engine (enrollments.csv
+        by default), replacing what is stored.
 
-        Writes header line followed by all enrollments.
+        The csv file is replaced atomically, so it is never left half written.
 
         Author: [Humza Khan]
         Date: [Dec 11]
         """
-        with open("enrollments.csv", "w") as file:
-            file.write("student_id,course_code,semester,grade\n")
-            for e in self._enrollments:
-                file.write(f"{e['student_id']},{e['course_code']},{e['semester']},{e['grade']}\n")
+        with self._data_lock, self._flush_lock:
+            self._load_all()
+            self.storage.save_enrollments(self.enrollment_rows())
+
+    def flush(self):
+        """
+        Write any unsaved enrollment changes to disk now.
+
+        The data lock is held only while the changes are taken from the
+        storage engine (_prepare_commit()); the disk write runs after it
+        is released, so other threads keep registering and reading
+        meanwhile. Writes run one at a time, in the order their changes
+        were taken (_flush_lock). If the write fails, the changes stay
+        pending for the next flush and the error is raised.
+
+        Author: [Humza Khan]
+        Date: [Dec 15]
+        """
+        with self._data_lock:
+            pending = self._tracker.pending
+            if pending == 0:
+                return
+            self._flush_lock.acquire()
+            try:
+                write = self._prepare_commit()
+            except BaseException:
+                self._flush_lock.release()
+                raise
+            self._tracker.mark_clean()
+
+        try:
+            write()
+        except BaseException:
+            self._flush_lock.release()
+            with self._data_lock:
+                self._tracker.mark_unwritten(pending)
+            raise
+        self._flush_lock.release()
 
     def register_student_in_course(self):
         """
@@ -111,40 +362,217 @@ class EnrollmentManager:
         course_code = input("Enter course code: ").strip().upper()
         semester = input("Enter semester (e.g., Fall2024): ").strip()
 
+        result = self.register(student_id_text, course_code, semester)
+        print(result.message)
+        if result.error == COURSE_FULL:
+            answer = input("Add the student to the waitlist? (y/n): ").strip().lower()
+            if answer == "y":
+                print(self.join_waitlist(student_id_text, course_code, semester).message)
+
+    def register(self, student_id, course_code, semester):
+        """
+        Register a student in a course and save the change.
+
+        The student and course must exist, the student must not already be
+        enrolled in the course that semester or taking another course that
+        semester at the same time, and the course must not be full that
+        semester.
+
+        Parameters:
+            student_id (int or str): Student ID
+            course_code (str): Course code
+            semester (str): Semester, e.g. Fall2024
+
+        Returns:
+            OperationResult: The new enrollment as value on success
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
         try:
-            student_id = int(student_id_text)
-        except ValueError:
-            print("Error: Invalid student ID")
-            return
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+        course_code = str(course_code).strip().upper()
+        semester = str(semester).strip()
+
+        result = self._register_row(student_id, course_code, semester, "")
+        if not result:
+            return result
+        student, course, enrollment = result.value
+
+        with self._data_lock:
+            self._tracker.mark_dirty()
+        return OperationResult.ok(
+            f"Student {student.get_full_name()} successfully registered in {course.course_name}", enrollment)
+
+    def join_waitlist(self, student_id, course_code, semester):
+        """
+        Put a student on a full course's waitlist and save the change.
+
+        The student and course must exist, the student must not already be
+        enrolled or waiting, and the course must be full.
+
+        Parameters:
+            student_id (int or str): Student ID
+            course_code (str): Course code
+            semester (str): Semester to register in when promoted
+
+        Returns:
+            OperationResult: The waitlist row as value on success
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        try:
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+        course_code = str(course_code).strip().upper()
+        semester = str(semester).strip()
+
+        with self._registration_locks(student_id, course_code):
+            check = self._check_registration(student_id, course_code, semester)
+            if check:
+                return OperationResult.failed(SEATS_AVAILABLE, "Error: Course has seats available")
+            if check.error != COURSE_FULL:
+                return check
+
+            student = self.student_manager.find_student_by_id(student_id)
+            course = self.course_manager.find_course_by_code(course_code)
+            with self._data_lock:
+                if self.waitlists.contains(student_id, course_code):
+                    return OperationResult.failed(ALREADY_WAITLISTED,
+                                                  "Error: Student is already on the waitlist for this course")
+                row = self.waitlists.add(student_id, course_code, semester, student.year)
+                self.storage.insert_waitlist(row)
+                self._tracker.mark_dirty()
+                waiting = self.waitlists.length(course_code)
+
+        return OperationResult.ok(
+            f"Student {student.get_full_name()} added to the waitlist for {course.course_name} "
+            f"({waiting} waiting)", row)
+
+    def leave_waitlist(self, student_id, course_code):
+        """
+        Take a student off a course's waitlist and save the change.
+
+        Returns:
+            OperationResult: The student's position before leaving as value
+                on success
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        try:
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+        course_code = str(course_code).strip().upper()
+
+        with self._data_lock:
+            position = self.waitlists.position(student_id, course_code)
+            if position is None:
+                return OperationResult.failed(NOT_WAITLISTED, "Error: Student is not on the waitlist for this course")
+            self.waitlists.remove(student_id, course_code)
+            self.storage.delete_waitlist(student_id, course_code)
+            self._tracker.mark_dirty()
 
         student = self.student_manager.find_student_by_id(student_id)
-        if student is None:
-            print("Error: Student does not exist in system")
-            return
+        student_name = student.get_full_name() if student else str(student_id)
+        return OperationResult.ok(f"Student {student_name} removed from the waitlist for {course_code}", position)
 
-        course = self.course_manager.find_course_by_code(course_code)
-        if course is None:
-            print("Error: Course does not exist in system")
-            return
+    def import_enrollments_from_file(self):
+        """
+        Import a file of registrations through user input.
 
-        if self.is_student_enrolled_in_course(student_id, course_code):
-            print("Error: Student is already enrolled in this course")
-            return
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        filename = input("Enter file to import: ").strip()
+        reject_filename = input("Enter file for rejected rows (or press Enter for none): ").strip()
 
-        if course.is_full():
-            print("Error: Course is full")
-            return
+        print(self.import_enrollments(filename, reject_filename or None).message)
 
-        enrollment = {
-            "student_id": student_id,
-            "course_code": course_code,
-            "semester": semester,
-            "grade": ""
-        }
-        self._enrollments.append(enrollment)
-        self.course_manager.update_enrollment_counts(self)
-        self.write_enrollments_to_file()
-        print(f"Student {student.get_full_name()} successfully registered in {course.course_name}")
+    @without_garbage_collection
+    def import_enrollments(self, filename, reject_filename=None):
+        """
+        Register every valid row of a csv file and save once at the end.
+
+        The file has the same columns as enrollments.csv (the header line
+        and the grade column are optional). Each row is checked like
+        register(): the student and course must exist, the student must not
+        already be enrolled in the course (in the data or earlier in the
+        file), and the course must have a free seat. A grade, if given, must
+        be one of VALID_GRADES. Valid rows are added as they are read;
+        the rest are written to reject_filename with the reason.
+
+        Reject file format:
+        line_number,error,message,original_line
+
+        Parameters:
+            filename (str): File to import
+            reject_filename (str): Where rejected rows are written
+                (optional)
+
+        Returns:
+            OperationResult: {"imported": n, "rejected": n} as value;
+                fails only if the file cannot be read
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        imported = 0
+        rejects = []
+        try:
+            with open(filename, "r") as file:
+                for line_number, line in enumerate(file, 1):
+                    line = line.strip()
+                    if line == "" or (line_number == 1 and line.startswith("student_id")):
+                        continue
+
+                    parts = line.split(",")
+                    failure = None
+                    if len(parts) < 3 or len(parts) > 4:
+                        failure = OperationResult.failed(INVALID_ROW, "Error: Row does not have 3 or 4 columns")
+                    else:
+                        course_code = parts[1].strip().upper()
+                        semester = parts[2].strip()
+                        grade = parts[3].strip().upper() if len(parts) == 4 else ""
+                        try:
+                            student_id = int(parts[0])
+                        except ValueError:
+                            failure = OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+                        else:
+                            if grade != "" and grade not in VALID_GRADES:
+                                failure = OperationResult.failed(INVALID_GRADE, "Error: Invalid grade format")
+                            else:
+                                result = self._register_row(student_id, course_code, semester, grade)
+                                if not result:
+                                    failure = result
+
+                    if failure is not None:
+                        rejects.append(f"{line_number},{failure.error},{failure.message},{line}")
+                        continue
+                    imported += 1
+        except FileNotFoundError:
+            return OperationResult.failed(FILE_NOT_FOUND, f"Error: File {filename} not found")
+
+        if imported > 0:
+            with self._data_lock:
+                self._commit_changes()
+                self._tracker.mark_clean()
+
+        if reject_filename is not None:
+            with open(reject_filename, "w") as file:
+                file.write("line_number,error,message,original_line\n")
+                for reject in rejects:
+                    file.write(reject + "\n")
+
+        message = f"Imported {imported} enrollments, rejected {len(rejects)}"
+        if reject_filename is not None and len(rejects) > 0:
+            message += f" (see {reject_filename})"
+        return OperationResult.ok(message, {"imported": imported, "rejected": len(rejects)})
 
     def drop_student_from_course(self):
         """
@@ -155,33 +583,66 @@ class EnrollmentManager:
         """
         student_id_text = input("Enter student ID: ").strip()
         course_code = input("Enter course code: ").strip().upper()
+        semester = self._input_semester()
 
-        try:
-            student_id = int(student_id_text)
-        except ValueError:
-            print("Error: Invalid student ID")
-            return
+        print(self.drop(student_id_text, course_code, semester).message)
 
-        found = None
-        for e in self._enrollments:
-            if e["student_id"] == student_id and e["course_code"].upper() == course_code:
-                found = e
-                break
+    def drop(self, student_id, course_code, semester=None):
+        """
+        Drop a student from a course and save the change.
 
-        if found is None:
-            print("Student is not enrolled in this course")
-            return
+        The freed seat goes to the next student on the course's waitlist.
+        A student who is not enrolled but waiting is taken off the
+        waitlist instead.
+
+        Parameters:
+            student_id (int or str): Student ID
+            course_code (str): Course code
+            semester (str): Semester to drop (the active semester if
+                None); other terms are never dropped without being named
 
+        Returns:
+            OperationResult: The removed enrollment, as a dictionary, as
+                value on success
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        try:
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+        course_code = str(course_code).strip().upper()
+        if semester is not None:
+            semester = str(semester).strip()
+
+        with self._registration_locks(student_id, course_code):
+            found = self._find_enrollment(student_id, course_code, semester)
+            if found is None:
+                if self.waitlists.contains(student_id, course_code):
+                    return self.leave_waitlist(student_id, course_code)
+                return OperationResult.failed(NOT_ENROLLED, "Student is not enrolled in this course")
+
+            # Copy the row first: a columnar row view is invalid once removed
+            removed = {"student_id": student_id, "course_code": course_code,
+                       "semester": found["semester"], "grade": found["grade"]}
+            with self._data_lock:
+                self._remove_enrollment(found)
+                self.storage.delete_enrollment(student_id, course_code, removed["semester"])
+                self._tracker.mark_dirty()
+
+        promoted = self._promote_waitlisted(course_code)
         student = self.student_manager.find_student_by_id(student_id)
         course = self.course_manager.find_course_by_code(course_code)
 
-        self._enrollments.remove(found)
-        self.course_manager.update_enrollment_counts(self)
-        self.write_enrollments_to_file()
-
         student_name = student.get_full_name() if student else str(student_id)
         course_name = course.course_name if course else course_code
-        print(f"Student {student_name} dropped from {course_name}")
+        message = f"Student {student_name} dropped from {course_name}"
+        for promoted_id in promoted:
+            promoted_student = self.student_manager.find_student_by_id(promoted_id)
+            promoted_name = promoted_student.get_full_name() if promoted_student else str(promoted_id)
+            message += f"\nStudent {promoted_name} registered in {course_name} from the waitlist"
+        return OperationResult.ok(message, removed)
 
     def display_student_schedule(self):
         """
@@ -207,18 +668,19 @@ class EnrollmentManager:
         print("=" * 42)
         print(f"SCHEDULE FOR: {student.get_full_name()}")
         print("=" * 42)
-        print(f"{'Code':<10}{'Course Name':<25}{'Semester':<12}{'Grade':<5}")
+        print(f"{'Code':<10}{'Course Name':<25}{'Semester':<12}{'Grade':<7}{'Meets'}")
         print("-" * 54)
 
         total_credits = 0
         for e in enrollments:
             course = self.course_manager.find_course_by_code(e["course_code"])
             course_name = course.course_name if course else ""
+            meets = course.meeting_times_text() if course else ""
             grade = e["grade"]
             if grade == "":
                 grade = "-"
             semester = e["semester"]
-            print(f"{e['course_code']:<10}{course_name:<25}{semester:<12}{grade:<5}")
+            print(f"{e['course_code']:<10}{course_name:<25}{semester:<12}{grade:<7}{meets or '-'}")
 
             if course:
                 total_credits += course.credits
@@ -227,9 +689,79 @@ class EnrollmentManager:
         print(f"Total Courses: {len(enrollments)}")
         print(f"Total Credits: {total_credits}")
 
+    def display_student_transcript(self):
+        """
+        Display a student's transcript, GPA and academic standing.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        student_id_text = input("Enter student ID: ").strip()
+        try:
+            student_id = int(student_id_text)
+        except ValueError:
+            print("Error: Invalid student ID")
+            return
+
+        student = self.student_manager.find_student_by_id(student_id)
+        if student is None:
+            print("Error: Student does not exist in system")
+            return
+
+        transcript = self.get_transcript(student_id)
+
+        print("=" * 42)
+        print(f"TRANSCRIPT FOR: {student.get_full_name()}")
+        print("=" * 42)
+        print(f"{'Semester':<12}{'Code':<10}{'Course Name':<25}{'Credits':<9}{'Grade':<5}")
+        print("-" * 61)
+
+        for course_code, course_name, semester, credits, grade in transcript.entries:
+            print(f"{semester:<12}{course_code:<10}{course_name:<25}{credits:<9}{grade or '-':<5}")
+
+        gpa = f"{transcript.gpa:.2f}" if transcript.gpa is not None else "-"
+        print("=" * 42)
+        print(f"Credits Earned:      {transcript.earned_credits}")
+        print(f"Credits In Progress: {transcript.credits_in_progress}")
+        print(f"GPA:                 {gpa}")
+        print(f"Standing:            {transcript.standing()}")
+
+    def display_waitlist(self):
+        """
+        Display the students waiting for a seat in a course, next in line
+        first.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        course_code = input("Enter course code: ").strip().upper()
+        course = self.course_manager.find_course_by_code(course_code)
+        if course is None:
+            print("Error: Course does not exist in system")
+            return
+
+        with self._data_lock:
+            entries = self.waitlists.entries(course_code)
+
+        print("=" * 42)
+        print(f"WAITLIST FOR: {course.course_code} - {course.course_name}")
+        print("=" * 42)
+        print(f"{'Position':<10}{'Student ID':<14}{'Name':<25}{'Year':<6}{'Semester':<10}")
+        print("-" * 65)
+
+        for position, (student_id, code, semester, request_number) in enumerate(entries, 1):
+            student = self.student_manager.find_student_by_id(student_id)
+            name = student.get_full_name() if student else ""
+            year = student.year if student else ""
+            print(f"{position:<10}{student_id:<14}{name:<25}{year:<6}{semester:<10}")
+
+        print("=" * 42)
+        print(f"Waiting: {len(entries)}")
+        print(f"Enrolled: {course.enrolled_count} / {course.capacity}")
+
     def display_course_roster(self):
         """
-        Display all students enrolled in a course.
+        Display all students enrolled in a course in the active term.
 
         Author: [Humza Khan]
         Date: [Dec 12]
@@ -240,10 +772,11 @@ class EnrollmentManager:
             print("Error: Course does not exist in system")
             return
 
-        enrollments = self.get_course_enrollments(course_code)
+        semester = self.active_semester
+        enrollments = self.get_course_enrollments(course_code, semester)
 
         print("=" * 42)
-        print(f"ROSTER FOR: {course.course_code} - {course.course_name}")
+        print(f"ROSTER FOR: {course.course_code} - {course.course_name} ({semester or '-'})")
         print("=" * 42)
         print(f"{'Student ID':<14}{'Name':<25}{'Year':<6}{'Grade':<5}")
         print("-" * 54)
@@ -269,54 +802,90 @@ class EnrollmentManager:
         """
         student_id_text = input("Enter student ID: ").strip()
         course_code = input("Enter course code: ").strip().upper()
+        semester = self._input_semester()
         grade = input("Enter grade (A, A-, B+, B, B-, C+, C, C-, D, F): ").strip().upper()
 
-        try:
-            student_id = int(student_id_text)
-        except ValueError:
-            print("Error: Invalid student ID")
-            return
+        print(self.set_grade(student_id_text, course_code, grade, semester).message)
 
-        valid_grades = ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D", "F"]
-        if grade not in valid_grades:
-            print("Error: Invalid grade format")
-            return
+    def _input_semester(self):
+        """
+        Ask for a semester, offering the active term as the default.
 
-        enrollment = None
-        for e in self._enrollments:
-            if e["student_id"] == student_id and e["course_code"].upper() == course_code:
-                enrollment = e
-                break
+        Returns:
+            str or None: The semester, None for the active term
 
-        if enrollment is None:
-            print("Error: Enrollment does not exist")
-            return
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self.active_semester is None:
+            semester = input("Enter semester (e.g., Fall2024): ").strip()
+        else:
+            semester = input(f"Enter semester (or press Enter for {self.active_semester}): ").strip()
+        return semester or None
+
+    def set_grade(self, student_id, course_code, grade, semester=None):
+        """
+        Assign or update a student's grade in a course and save the change.
 
-        enrollment["grade"] = grade
-        self.write_enrollments_to_file()
+        Parameters:
+            student_id (int or str): Student ID
+            course_code (str): Course code
+            grade (str): One of VALID_GRADES
+            semester (str): Semester of the enrollment (the active
+                semester if None)
+
+        Returns:
+            OperationResult: The enrollment as value on success
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        try:
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+        course_code = str(course_code).strip().upper()
+        grade = str(grade).strip().upper()
+
+        if grade not in VALID_GRADES:
+            return OperationResult.failed(INVALID_GRADE, "Error: Invalid grade format")
+        if semester is not None:
+            semester = str(semester).strip()
+
+        with self._registration_locks(student_id, course_code):
+            enrollment = self._find_enrollment(student_id, course_code, semester)
+            if enrollment is None:
+                return OperationResult.failed(NOT_ENROLLED, "Error: Enrollment does not exist")
+
+            with self._data_lock:
+                enrollment["grade"] = grade
+                self._transcripts.pop(student_id, None)
+                self.storage.update_grade(student_id, enrollment["course_code"], enrollment["semester"], grade)
+                self._tracker.mark_dirty()
 
         student = self.student_manager.find_student_by_id(student_id)
         course = self.course_manager.find_course_by_code(course_code)
 
         student_name = student.get_full_name() if student else str(student_id)
         course_name = course.course_name if course else course_code
-        print(f"Grade {grade} assigned to {student_name} for {course_name}")
+        return OperationResult.ok(f"Grade {grade} assigned to {student_name} for {course_name}", enrollment)
 
-    def is_student_enrolled_in_course(self, student_id, course_code):
+    def is_student_enrolled_in_course(self, student_id, course_code, semester=None):
         """
         Check if a student is enrolled in a specific course.
 
+        Parameters:
+            student_id (int): Student ID
+            course_code (str): Course code
+            semester (str): Semester (the active semester if None)
+
         Returns:
             bool: True if enrolled, False otherwise
 
         Author: [Ali Alimarah]
         Date: [Dec 12]
         """
-        code = str(course_code).upper()
-        for e in self._enrollments:
-            if e["student_id"] == student_id and e["course_code"].upper() == code:
-                return True
-        return False
+        return self._find_enrollment(student_id, course_code, semester) is not None
 
     def get_student_enrollments(self, student_id):
         """
@@ -328,35 +897,52 @@ class EnrollmentManager:
         Author: [Humza Khan]
         Date: [Dec 12]
         """
-        matches = []
-        for e in self._enrollments:
-            if e["student_id"] == student_id:
-                matches.append(e)
-        return matches
+        with self._data_lock:
+            self._load_all()
+            return list(self._by_student.get(student_id, []))
 
-    def get_course_enrollments(self, course_code):
+    def get_course_enrollments(self, course_code, semester=None):
         """
         Get all enrollments for a specific course.
 
+        Parameters:
+            course_code (str): Course code
+            semester (str): Only this semester (every semester if None)
+
         Returns:
             list: List of enrollment dictionaries for this course
 
         Author: [Humza Khan]
         Date: [Dec 12]
         """
-        code = str(course_code).upper()
-        matches = []
-        for e in self._enrollments:
-            if e["course_code"].upper() == code:
-                matches.append(e)
-        return matches
+        with self._data_lock:
+            if semester is None:
+                self._load_all()
+                return list(self._by_course.get(str(course_code).upper(), []))
+            self._load_semesters((semester,))
+            return [e for e in self._by_course.get(str(course_code).upper(), []) if e["semester"] == semester]
+
+    def get_enrollment_count(self):
+        """
+        Get the total number of enrollments in the system.
+
+        Returns:
+            int: Number of enrollments
 
-    def get_enrollment_count_for_course(self, course_code):
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
         """
-        Count how many students are enrolled in a course.
+        with self._data_lock:
+            self._load_all()
+            return len(self._enrollments)
+
+    def get_enrollment_count_for_course(self, course_code, semester=None):
+        """
+        Count how many students are enrolled in a course in one semester.
 
         Parameters:
             course_code (str): Course code
+            semester (str): Semester (the active semester if None)
 
         Returns:
             int: Number of students enrolled
@@ -364,30 +950,686 @@ class EnrollmentManager:
         Author: [Ali Alimarah]
         Date: [Dec 12]
         """
-        return len(self.get_course_enrollments(course_code))
+        if semester is None:
+            semester = self.active_semester
+        else:
+            self._load_semesters((semester,))
+        return self._term_counts.get((str(course_code).upper(), semester), 0)
+
+    def get_transcript(self, student_id):
+        """
+        Get a student's transcript, building it only if it is not cached.
+
+        Parameters:
+            student_id (int): Student ID
+
+        Returns:
+            Transcript: The student's courses, GPA and credits (empty if
+                the student has no enrollments)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        with self._data_lock:
+            transcript = self._transcripts.get(student_id)
+            if transcript is None:
+                self._load_all()
+                transcript = Transcript(student_id, self._by_student.get(student_id, []),
+                                        self.course_manager.find_course_by_code)
+                self._transcripts[student_id] = transcript
+            return transcript
+
+    def get_gpa(self, student_id):
+        """
+        Get a student's credit-weighted GPA.
+
+        Returns:
+            float or None: GPA, None if no course is graded yet
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return self.get_transcript(student_id).gpa
 
-    def display_all_enrollments(self):
+    def get_academic_standing(self, student_id):
         """
-        Display all enrollments in the system.
+        Get a student's academic standing from their GPA.
+
+        Returns:
+            str: "Dean's List", "Good Standing", "Academic Probation" or
+                "No Grades Yet"
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return self.get_transcript(student_id).standing()
+
+    def grade_analytics(self):
+        """
+        Prepare grade analytics for the current enrollments.
+
+        With columnar storage the columns are copied straight from the
+        EnrollmentTable; otherwise the enrollments are encoded first.
+
+        Returns:
+            GradeAnalytics: Analytics over a copy of the enrollments
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        programs = {s.student_id: s.program for s in self.student_manager.students}
+        with self._data_lock:
+            self._load_all()
+            if self.columnar:
+                return GradeAnalytics(self._enrollments, programs)
+            return GradeAnalytics.from_rows(self.enrollment_rows(), programs)
+
+    def find_schedule_conflicts(self):
+        """
+        Find every pair of courses a student takes in the same semester
+        whose meeting times overlap, e.g. rows imported before meeting
+        times were set.
+
+        All enrollments are sorted and swept once (O(n log n)) rather
+        than comparing each pair of a student's courses.
+
+        Returns:
+            list: Sorted (student_id, semester, course_code, other_code)
+                tuples
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        with self._data_lock:
+            self._load_all()
+            meetings = list(self._meeting_rows())
+        return find_conflicts(meetings)
+
+    def display_all_enrollments(self, offset=0, limit=None, page_size=None):
+        """
+        Display enrollments in the system.
+
+        Students and courses are looked up only for the rows shown, and
+        the table is written a page at a time (see listing.py). Every term
+        is listed, oldest first; older terms are read if they are not
+        loaded yet. Rows are taken from the store one term at a time as
+        they are printed, so no sorted copy of the enrollments is made,
+        and the total comes from the per-term counts.
+
+        Parameters:
+            offset (int): Number of enrollments to skip
+            limit (int): Maximum number of enrollments to show (all if None)
+            page_size (int): Enrollments per page, asking before each next
+                page (one table without questions if None)
 
         Author: [Ali Alimarah]
         Date: [Dec 12]
         """
-        print("=" * 89)
-        print("ALL ENROLLMENTS")
-        print("=" * 89)
-        print(f"{'Student ID':<14}{'Student Name':<22}{'Course Code':<13}{'Course Name':<22}{'Semester':<10}")
-        print("-" * 89)
+        header = f"{'Student ID':<14}{'Student Name':<22}{'Course Code':<13}{'Course Name':<22}{'Semester':<10}"
+        listing = TableListing("ALL ENROLLMENTS", 89, header, self._enrollment_line, "Total Enrollments")
+        with self._data_lock:
+            self._load_all()
+            semester_counts = {}
+            for (code, semester), count in self._term_counts.items():
+                semester_counts[semester] = semester_counts.get(semester, 0) + count
+        semesters = sorted(semester_counts.items(), key=lambda entry: semester_sort_key(entry[0]))
+        total = sum(semester_counts.values())
+        listing.render(self._enrollments_by_term(semesters), total, offset, limit, page_size)
+
+    def _enrollments_by_term(self, semesters):
+        """
+        Generate the enrollments of each semester in turn, each in the
+        order they were added. A semester's scan of the store stops once
+        its count has been reached.
+
+        Parameters:
+            semesters (list): (semester, enrollment count) tuples, in the
+                order to list them
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        for semester, count in semesters:
+            yield from islice(self._enrollments.rows_in_semester(semester), count)
+
+    def _enrollment_line(self, e):
+        """
+        Format an enrollment as a line of the enrollments table.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 12]
+        """
+        student = self.student_manager.find_student_by_id(e["student_id"])
+        course = self.course_manager.find_course_by_code(e["course_code"])
+        student_name = student.get_full_name() if student else ""
+        course_name = course.course_name if course else ""
+        return f"{e['student_id']:<14}{student_name:<22}{e['course_code']:<13}{course_name:<22}{e['semester']:<10}"
+
+    def compact_enrollments(self):
+        """
+        Fold logged changes back into the main data.
+
+        With the csv files this rewrites enrollments.csv from memory (terms
+        that are not loaded are copied from the old file) and then deletes
+        the journal. Replaying the journal is safe to repeat,
+        so a crash between the two steps loses nothing.
+
+        Author: [Humza Khan]
+        Date: [Dec 14]
+        """
+        with self._data_lock, self._flush_lock:
+            self.storage.compact_enrollments(self.enrollment_rows(), self.loaded_semesters())
+            self.storage.commit_waitlist(self.waitlist_rows)
+            self._tracker.mark_clean()
+
+    @contextlib.contextmanager
+    def _registration_locks(self, student_id, course_code):
+        """
+        Hold the locks of one course and one student.
+
+        Compacting an EnrollmentTable renumbers every row view, including
+        those of other courses, so with columnar=True the data lock is held
+        as well and registrations run one at a time.
+
+        Parameters:
+            student_id (int): Student ID
+            course_code (str): Upper-case course code
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        with self._locks.holding(("course", course_code), ("student", student_id)):
+            if self.columnar:
+                with self._data_lock:
+                    yield
+            else:
+                yield
+
+    def _register_row(self, student_id, course_code, semester, grade):
+        """
+        Check and add one registration while holding its course and student
+        locks, and report it to the storage engine.
+
+        The flush tracker is not told; callers mark the change themselves.
+
+        Returns:
+            OperationResult: (Student, Course, enrollment) as value on
+                success, otherwise the reason from _check_registration()
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        with self._registration_locks(student_id, course_code):
+            check = self._check_registration(student_id, course_code, semester)
+            if not check:
+                return check
+            student, course = check.value
+
+            with self._data_lock:
+                enrollment = self._add_enrollment(student_id, course_code, semester, grade)
+                self.storage.insert_enrollment((student_id, course_code, semester, grade))
+                if self.waitlists.remove(student_id, course_code):
+                    self.storage.delete_waitlist(student_id, course_code)
+        return OperationResult.ok("", (student, course, enrollment))
+
+    def _promote_waitlisted(self, course_code):
+        """
+        Register waiting students in a course, next in line first, while
+        it has free seats, and save the change.
+
+        Waiting students who can no longer be registered (removed from the
+        system, already enrolled, or now taking a course at the same
+        time) are taken off the waitlist and skipped. Each promotion is
+        one heap pop, O(log n). Seats are counted per semester: students
+        waiting for a semester that is still full keep their place (see
+        CourseWaitlists.pop()), and the loop stops once no waiting
+        student's semester has a seat.
+
+        Parameters:
+            course_code (str): Upper-case course code
+
+        Returns:
+            list: IDs of the students who were registered
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        promoted = []
+        changed = False
+        with self._locks.holding(("course", course_code)):
+            while True:
+                with self._data_lock:
+                    if not any(self._has_free_seat(course_code, semester)
+                               for semester in self.waitlists.semesters(course_code)):
+                        break
+                    row = self.waitlists.pop(course_code, lambda row: self._has_free_seat(row[1], row[2]))
+                if row is None:
+                    break
+
+                student_id, code, semester, request_number = row
+                with self._locks.holding(("student", student_id)), self._data_lock:
+                    self.storage.delete_waitlist(student_id, course_code)
+                    changed = True
+                    if self._check_registration(student_id, course_code, semester):
+                        self._add_enrollment(student_id, course_code, semester, "")
+                        self.storage.insert_enrollment((student_id, course_code, semester, ""))
+                        promoted.append(student_id)
+
+        if changed:
+            with self._data_lock:
+                self._tracker.mark_dirty()
+        return promoted
+
+    def _check_registration(self, student_id, course_code, semester):
+        """
+        Check whether a student can be registered in a course.
+
+        Parameters:
+            student_id (int): Student ID
+            course_code (str): Upper-case course code
+            semester (str): Semester, checked for clashing meeting times
+
+        Returns:
+            OperationResult: (Student, Course) as value if registration is
+                allowed, otherwise the reason it is not
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        student = self.student_manager.find_student_by_id(student_id)
+        if student is None:
+            return OperationResult.failed(STUDENT_NOT_FOUND, "Error: Student does not exist in system")
+
+        course = self.course_manager.find_course_by_code(course_code)
+        if course is None:
+            return OperationResult.failed(COURSE_NOT_FOUND, "Error: Course does not exist in system")
+
+        if not is_valid_semester(semester):
+            return OperationResult.failed(INVALID_SEMESTER,
+                                          "Error: Semester must be a season and year, e.g. Fall2024")
+
+        if self.is_student_enrolled_in_course(student_id, course_code, semester):
+            return OperationResult.failed(ALREADY_ENROLLED,
+                                          "Error: Student is already enrolled in this course for this semester")
+
+        clashes = self._schedule.conflicts(student_id, semester, course.meeting_times, course_code)
+        if clashes:
+            return OperationResult.failed(TIME_CONFLICT,
+                                          f"Error: Meeting times conflict with {', '.join(clashes)}")
+
+        if self._term_counts.get((course_code, semester), 0) >= course.capacity:
+            return OperationResult.failed(COURSE_FULL, "Error: Course is full")
+
+        return OperationResult.ok("", (student, course))
+
+    def _has_free_seat(self, course_code, semester):
+        """
+        Check whether a course has a free seat in a semester, reading that
+        semester if it is not loaded.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        course = self.course_manager.find_course_by_code(course_code)
+        if course is None:
+            return False
+        self._load_semesters((semester,))
+        return self._term_counts.get((course_code, semester), 0) < course.capacity
+
+    def _find_enrollment(self, student_id, course_code, semester=None):
+        """
+        Find a student's enrollment in a course in one semester.
+
+        A semester that is not loaded is read first, so an older term is
+        only read when a caller names it.
+
+        Parameters:
+            student_id (int): Student ID
+            course_code (str): Course code
+            semester (str): Semester (the active semester if None)
+
+        Returns:
+            dict or None: The matching enrollment, None if not enrolled
+
+        Author: [Ali Alimarah]
+        Date: [Dec 14]
+        """
+        code = str(course_code).upper()
+        if semester is None:
+            semester = self.active_semester
+        with self._data_lock:
+            if semester is not None:
+                self._load_semesters((semester,))
+            return self._by_key.get((student_id, code, semester))
+
+    @without_garbage_collection
+    def _load_semesters(self, semesters):
+        """
+        Read terms that are not loaded yet from the storage engine and add
+        their enrollments to the store and indexes.
+
+        Course counts are not changed: the active term is always loaded.
+
+        Parameters:
+            semesters (iterable): Semesters that are needed
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._data_lock:
+            if self._all_semesters_loaded:
+                return
+            missing = set(semesters) - self._semesters
+            if len(missing) == 0:
+                return
+            self._semesters |= missing
+            for row in self.storage.load_more_enrollments(missing):
+                self._index_enrollment(self._store_enrollment(*row))
+
+    def _load_all(self):
+        """
+        Read every term that is not loaded yet.
 
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._data_lock:
+            if self._all_semesters_loaded:
+                return
+            self._load_semesters(self.storage.enrollment_semesters())
+            self._all_semesters_loaded = True
+
+    def _add_enrollment(self, student_id, course_code, semester, grade):
+        """
+        Create an enrollment and add it to the list and all indexes.
+
+        In the active term the course's enrollment count is increased by
+        one instead of recounting every course. Only if there is no active
+        term yet (no enrollments were loaded) does the registration's term
+        become the active one, and every course is recounted.
+
+        Returns:
+            dict: The new enrollment
+
+        Author: [Humza Khan]
+        Date: [Dec 14]
+        """
+        enrollment = self._store_enrollment(student_id, str(course_code).upper(), semester, grade)
+        self._index_enrollment(enrollment)
+        if semester == self.active_semester:
+            self.course_manager.adjust_enrollment_count(enrollment["course_code"], 1)
+        elif self.active_semester is None and is_valid_semester(semester):
+            self.active_semester = semester
+            self.course_manager.update_enrollment_counts(self)
+        return enrollment
+
+    def _remove_enrollment(self, enrollment):
+        """
+        Remove an enrollment from the store and all indexes.
+
+        In the active term the course's enrollment count is decreased by
+        one.
+
+        Author: [Humza Khan]
+        Date: [Dec 14]
+        """
+        active = enrollment["semester"] == self.active_semester
+        self._enrollments.remove(enrollment)
+        self._unindex_enrollment(enrollment)
+        if active:
+            self.course_manager.adjust_enrollment_count(enrollment["course_code"], -1)
+
+        # Reclaim deleted rows; the indexes hold views of the old row numbers
+        if self.columnar and self._enrollments.needs_compaction():
+            self._enrollments.compact()
+            self._rebuild_enrollment_indexes()
+
+    def _new_enrollment_store(self):
+        """
+        Create an empty enrollment store of the configured kind.
+
+        Returns:
+            EnrollmentList or EnrollmentTable: Empty store
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        if self.columnar:
+            return EnrollmentTable()
+        return EnrollmentList()
+
+    def _store_enrollment(self, student_id, course_code, semester, grade):
+        """
+        Append an enrollment to the store without indexing it.
+
+        Returns:
+            dict or EnrollmentRow: The stored enrollment
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        if self.columnar:
+            return self._enrollments.append_row(student_id, course_code, semester, grade)
+
+        enrollment = {
+            "student_id": student_id,
+            "course_code": course_code,
+            "semester": semester,
+            "grade": grade
+        }
+        self._enrollments.append(enrollment)
+        return enrollment
+
+    def _index_enrollment(self, enrollment):
+        """
+        Add one enrollment to the student, course, key and term count
+        indexes.
+
+        Grades are not part of any key, so assigning a grade to an
+        enrollment never requires an index update.
+
+        Author: [Humza Khan]
+        Date: [Dec 14]
+        """
+        self._by_student.setdefault(enrollment["student_id"], []).append(enrollment)
+        course_list = self._by_course.get(enrollment["course_code"])
+        if course_list is None:
+            course_list = self._by_course[enrollment["course_code"]] = EnrollmentList()
+        course_list.append(enrollment)
+        key = (enrollment["student_id"], enrollment["course_code"], enrollment["semester"])
+        if self._by_key.setdefault(key, enrollment) is enrollment:
+            self._schedule.add(key[0], key[2], key[1], self._meeting_times(key[1]))
+        term = (key[1], key[2])
+        self._term_counts[term] = self._term_counts.get(term, 0) + 1
+        self._transcripts.pop(enrollment["student_id"], None)
+
+    def _unindex_enrollment(self, enrollment):
+        """
+        Remove one enrollment from the student, course, key and term count
+        indexes.
+
+        Author: [Humza Khan]
+        Date: [Dec 14]
+        """
+        student_id = enrollment["student_id"]
+        course_code = enrollment["course_code"]
+        semester = enrollment["semester"]
+        self._transcripts.pop(student_id, None)
+
+        term = (course_code, semester)
+        self._term_counts[term] -= 1
+        if self._term_counts[term] == 0:
+            del self._term_counts[term]
+
+        student_list = self._by_student[student_id]
+        student_list.remove(enrollment)
+        if len(student_list) == 0:
+            del self._by_student[student_id]
+
+        course_list = self._by_course[course_code]
+        course_list.remove(enrollment)
+        if len(course_list) == 0:
+            del self._by_course[course_code]
+
+        # A duplicate row for the same key may still be in the file
+        key = (student_id, course_code, semester)
+        for e in student_list:
+            if e["course_code"] == course_code and e["semester"] == semester:
+                self._by_key[key] = e
+                return
+        self._by_key.pop(key, None)
+        self._schedule.remove(student_id, semester, course_code)
+
+    def _rebuild_enrollment_indexes(self):
+        """
+        Rebuild all enrollment indexes from the _enrollments list.
+
+        Does the same as calling _index_enrollment() for every enrollment,
+        written as one loop because it runs over the whole table at load time.
+
+        Author: [Humza Khan]
+        Date: [Dec 14]
+        """
+        by_student = {}
+        by_course = {}
+        by_key = {}
+        term_counts = {}
         for e in self._enrollments:
-            student = self.student_manager.find_student_by_id(e["student_id"])
-            course = self.course_manager.find_course_by_code(e["course_code"])
-            student_name = student.get_full_name() if student else ""
-            course_name = course.course_name if course else ""
-            print(f"{e['student_id']:<14}{student_name:<22}{e['course_code']:<13}{course_name:<22}{e['semester']:<10}")
+            student_id = e["student_id"]
+            course_code = e["course_code"]
+            semester = e["semester"]
+            student_list = by_student.get(student_id)
+            if student_list is None:
+                by_student[student_id] = [e]
+            else:
+                student_list.append(e)
+            course_list = by_course.get(course_code)
+            if course_list is None:
+                course_list = by_course[course_code] = EnrollmentList()
+            course_list.append(e)
+            by_key.setdefault((student_id, course_code, semester), e)
+            term = (course_code, semester)
+            term_counts[term] = term_counts.get(term, 0) + 1
+
+        self._by_student = by_student
+        self._by_course = by_course
+        self._by_key = by_key
+        self._term_counts = term_counts
+
+    def _rebuild_schedule(self):
+        """
+        Rebuild the ScheduleIndex from the key index and current meeting
+        times.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._schedule.reset(self._meeting_rows())
 
-        print("=" * 89)
-        print(f"Total Enrollments: {len(self._enrollments)}")
+    def _meeting_rows(self):
+        """
+        Generate one (student_id, semester, start, end, course_code) tuple
+        per meeting of every enrollment, a duplicate row counting once.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        slots_by_code = {}
+        for student_id, course_code, semester in self._by_key:
+            slots = slots_by_code.get(course_code)
+            if slots is None:
+                slots = slots_by_code[course_code] = self._meeting_times(course_code)
+            for start, end in slots:
+                yield (student_id, semester, start, end, course_code)
+
+    def _meeting_times(self, course_code):
+        """
+        Get a course's meetings, none if it is not in the system.
+
+        Returns:
+            tuple: (start, end) minute pairs
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        course = self.course_manager.find_course_by_code(course_code)
+        return course.meeting_times if course else ()
+
+    def _course_changed(self, course_code):
+        """
+        Forget the cached transcripts and re-index the meeting times of a
+        course that was added, removed or changed. None means every
+        course changed.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        with self._data_lock:
+            if course_code is None:
+                self._transcripts = {}
+                self._rebuild_schedule()
+                return
+            slots = self._meeting_times(course_code)
+            reindexed = set()
+            for e in self._by_course.get(course_code, []):
+                self._transcripts.pop(e["student_id"], None)
+                key = (e["student_id"], e["semester"])
+                if key not in reindexed:
+                    reindexed.add(key)
+                    self._schedule.remove(key[0], key[1], course_code)
+                    self._schedule.add(key[0], key[1], course_code, slots)
+
+    def _commit_changes(self):
+        """
+        Make reported enrollment changes durable in the storage engine,
+        while holding the data lock.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._flush_lock:
+            self._prepare_commit()()
+
+    def _prepare_commit(self):
+        """
+        Take the reported enrollment and waitlist changes from the storage
+        engine, with the data lock held, and return the function that
+        writes them to disk.
+
+        Returns:
+            function: Writes the changes
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        write_enrollments = self.storage.prepare_enrollment_commit(self.enrollment_rows,
+                                                                   self.loaded_semesters())
+        write_waitlist = self.storage.prepare_waitlist_commit(self.waitlist_rows)
+
+        def write():
+            try:
+                write_enrollments()
+            finally:
+                write_waitlist()
+        return write
+
+
+def _latest_semester(semesters):
+    """
+    Get the latest of some semesters in time order. Names that are not a
+    season and year (see is_valid_semester()) are skipped.
+
+    Parameters:
+        semesters (iterable): Semesters
+
+    Returns:
+        str or None: The latest semester, None if there are none
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    valid = [semester for semester in semesters if semester is not None and is_valid_semester(semester)]
+    return max(valid, key=semester_sort_key, default=None)
 
 
 # ==============================================================================
@@ -0,0 +1,164 @@
+"""
+EnrollmentStats Class - Course Registration System
+===================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Keeps the numbers shown on the statistics screen up to date as courses
+are added and removed and students register and drop, so the screen can
+be shown without looking at every course.
+
+RESPONSIBILITIES:
+- Keep the number of courses and the total of their enrollment counts
+- Keep the courses grouped by enrollment count, so the most-enrolled
+  courses can be listed without sorting
+
+COUNT BUCKETS:
+_buckets maps each enrollment count to the courses with that count, in
+the order they reached it:
+{0: {id(c1): c1}, 2: {id(c2): c2, id(c3): c3}}
+A registration or drop moves one course to the next or previous bucket,
+and _highest is the largest count that has a bucket. top(k) walks down
+from _highest, so its cost depends on k and the highest count, never on
+the number of courses or enrollments.
+
+The CourseManager calls these methods whenever it changes a course's
+count; registrations and drops already hold the EnrollmentManager's data
+lock at that point.
+
+"""
+
+
+class EnrollmentStats:
+    def __init__(self):
+        """
+        Initialize EnrollmentStats with no courses.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self.reset([])
+
+    def reset(self, courses):
+        """
+        Start again from a list of courses and their current counts.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._buckets = {}
+        self._counts = {}
+        self._highest = 0
+        self.course_count = 0
+        self.total_enrolled = 0
+        for course in courses:
+            self.add_course(course)
+
+    def add_course(self, course):
+        """
+        Start counting a course.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        count = course.enrolled_count
+        self._counts[id(course)] = count
+        self._buckets.setdefault(count, {})[id(course)] = course
+        self._highest = max(self._highest, count)
+        self.course_count += 1
+        self.total_enrolled += count
+
+    def remove_course(self, course):
+        """
+        Stop counting a course. Unknown courses are ignored.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        count = self._counts.pop(id(course), None)
+        if count is None:
+            return
+        self._take_from_bucket(course, count)
+        self.course_count -= 1
+        self.total_enrolled -= count
+
+    def count_changed(self, course):
+        """
+        Move a course whose enrolled_count changed to its new bucket.
+        Unknown courses are added.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        old_count = self._counts.get(id(course))
+        if old_count is None:
+            self.add_course(course)
+            return
+
+        new_count = course.enrolled_count
+        if new_count == old_count:
+            return
+        # Fill the new bucket first, so _highest stops there when the old
+        # bucket empties instead of walking down past it
+        self._counts[id(course)] = new_count
+        self._buckets.setdefault(new_count, {})[id(course)] = course
+        self._highest = max(self._highest, new_count)
+        self._take_from_bucket(course, old_count)
+        self.total_enrolled += new_count - old_count
+
+    def average_enrolled(self):
+        """
+        Get the average enrollment count per course.
+
+        Returns:
+            float: Average, 0 if there are no courses
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self.course_count == 0:
+            return 0
+        return self.total_enrolled / self.course_count
+
+    def top(self, k):
+        """
+        Get the k most-enrolled courses.
+
+        Returns:
+            list: Up to k Course objects, highest count first; courses with
+                the same count in the order they reached it
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        top_courses = []
+        count = self._highest
+        while len(top_courses) < k and count >= 0:
+            bucket = self._buckets.get(count)
+            if bucket:
+                for course in bucket.values():
+                    top_courses.append(course)
+                    if len(top_courses) == k:
+                        break
+            count -= 1
+        return top_courses
+
+    def _take_from_bucket(self, course, count):
+        """
+        Remove a course from the bucket of its old count, dropping the
+        bucket if it is empty and lowering _highest past empty counts.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        bucket = self._buckets[count]
+        del bucket[id(course)]
+        if len(bucket) > 0:
+            return
+        del self._buckets[count]
+        while self._highest > 0 and self._highest not in self._buckets:
+            self._highest -= 1
@@ -0,0 +1,377 @@
+"""
+EnrollmentTable Class - Course Registration System
+===================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Stores enrollments as parallel typed columns instead of one dictionary per
+row, which uses a fraction of the memory on large enrollment files.
+
+RESPONSIBILITIES:
+- Store student IDs in an array('q') column
+- Store course codes, semesters and grades as small integer codes, with a
+  lookup table (CodeTable) for each column
+- Hand out EnrollmentRow views that read and write a row like the
+  enrollment dictionaries used elsewhere (e["grade"], e["course_code"], ...)
+- Mark removed rows as deleted and compact the columns later
+
+NOTE: compact() renumbers the rows, so EnrollmentRow views created before a
+compaction must not be used afterwards.
+
+"""
+
+from array import array
+
+COLUMNS = ("student_id", "course_code", "semester", "grade")
+
+
+class CodeTable:
+    def __init__(self):
+        """
+        Initialize a CodeTable, which maps each distinct value to a small
+        integer code and back.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        Version: 1.0
+        """
+        self._values = []
+        self._codes = {}
+
+    def code_for(self, value):
+        """
+        Get the code for a value, adding the value if it is new.
+
+        Returns:
+            int: The value's code
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            self._codes[value] = code
+        return code
+
+    def value_for(self, code):
+        """
+        Get the value stored under a code.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        return self._values[code]
+
+    def find_code(self, value):
+        """
+        Get the code of a value without adding it.
+
+        Returns:
+            int or None: The value's code, None if the value is not stored
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self._codes.get(value)
+
+    def values(self):
+        """
+        Get every value, in code order (the value with code 0 first).
+
+        Returns:
+            list: Copy of the values
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return list(self._values)
+
+    def __len__(self):
+        """
+        Get the number of distinct values.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        return len(self._values)
+
+
+class EnrollmentRow:
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row):
+        """
+        Initialize a view of one row of an EnrollmentTable.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        Version: 1.0
+        """
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, column):
+        """
+        Get a column value, e.g. row["course_code"].
+
+        Raises:
+            KeyError: If the column does not exist
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        return self._table.get_value(self._row, column)
+
+    def __setitem__(self, column, value):
+        """
+        Set a column value, e.g. row["grade"] = "A".
+
+        Raises:
+            KeyError: If the column does not exist
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        self._table.set_value(self._row, column, value)
+
+    def get(self, column, default=None):
+        """
+        Get a column value, or default if the column does not exist.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        if column not in COLUMNS:
+            return default
+        return self[column]
+
+    def to_dict(self):
+        """
+        Copy the row into an enrollment dictionary.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        return {column: self[column] for column in COLUMNS}
+
+    def __eq__(self, other):
+        """
+        Two views are equal when they point at the same row of the same table.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        if not isinstance(other, EnrollmentRow):
+            return NotImplemented
+        return self._table is other._table and self._row == other._row
+
+    def __hash__(self):
+        """
+        Hash the view by its table and row number.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        return hash((id(self._table), self._row))
+
+    def __repr__(self):
+        """
+        Return the row in the same form as an enrollment dictionary.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 16]
+        """
+        return repr(self.to_dict())
+
+
+class EnrollmentTable:
+    def __init__(self):
+        """
+        Initialize an empty EnrollmentTable.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        Version: 1.0
+        """
+        self._student_ids = array("q")
+        self._course_ids = array("I")
+        self._semester_ids = array("H")
+        self._grade_ids = array("H")
+        self._deleted = bytearray()
+        self._deleted_count = 0
+        self._course_codes = CodeTable()
+        self._semesters = CodeTable()
+        self._grades = CodeTable()
+
+    def append_row(self, student_id, course_code, semester, grade):
+        """
+        Add a row to the end of the table.
+
+        Returns:
+            EnrollmentRow: A view of the new row
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        self._student_ids.append(student_id)
+        self._course_ids.append(self._course_codes.code_for(course_code))
+        self._semester_ids.append(self._semesters.code_for(semester))
+        self._grade_ids.append(self._grades.code_for(grade))
+        self._deleted.append(0)
+        return EnrollmentRow(self, len(self._student_ids) - 1)
+
+    def remove(self, row):
+        """
+        Mark a row as deleted. The space is reclaimed by compact().
+
+        Parameters:
+            row (EnrollmentRow): View of the row to remove
+
+        Raises:
+            ValueError: If the row is not a live row of this table
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        if row._table is not self or self._deleted[row._row]:
+            raise ValueError("Row is not in the table")
+        self._deleted[row._row] = 1
+        self._deleted_count += 1
+
+    def get_value(self, row, column):
+        """
+        Get one column value of a row.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        if column == "student_id":
+            return self._student_ids[row]
+        if column == "course_code":
+            return self._course_codes.value_for(self._course_ids[row])
+        if column == "semester":
+            return self._semesters.value_for(self._semester_ids[row])
+        if column == "grade":
+            return self._grades.value_for(self._grade_ids[row])
+        raise KeyError(column)
+
+    def set_value(self, row, column, value):
+        """
+        Set one column value of a row.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        if column == "student_id":
+            self._student_ids[row] = value
+        elif column == "course_code":
+            self._course_ids[row] = self._course_codes.code_for(value)
+        elif column == "semester":
+            self._semester_ids[row] = self._semesters.code_for(value)
+        elif column == "grade":
+            self._grade_ids[row] = self._grades.code_for(value)
+        else:
+            raise KeyError(column)
+
+    def columns(self):
+        """
+        Get the stored columns for processing them all at once, e.g. with
+        numpy.frombuffer(), without building a view per row.
+
+        The arrays are the table's own, including deleted rows, and must
+        not be changed.
+
+        Returns:
+            dict: "student_id" -> array of IDs; "course_code", "semester"
+                and "grade" -> (array of codes, list of values by code);
+                "deleted" -> bytearray with 1 for each deleted row
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return {
+            "student_id": self._student_ids,
+            "course_code": (self._course_ids, self._course_codes.values()),
+            "semester": (self._semester_ids, self._semesters.values()),
+            "grade": (self._grade_ids, self._grades.values()),
+            "deleted": self._deleted
+        }
+
+    def needs_compaction(self):
+        """
+        Check whether at least half of the stored rows are deleted.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        return self._deleted_count > 0 and self._deleted_count * 2 >= len(self._student_ids)
+
+    def compact(self):
+        """
+        Drop deleted rows from the columns.
+
+        Rows are renumbered, so existing EnrollmentRow views become invalid.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        student_ids = array("q")
+        course_ids = array("I")
+        semester_ids = array("H")
+        grade_ids = array("H")
+        for row in range(len(self._student_ids)):
+            if not self._deleted[row]:
+                student_ids.append(self._student_ids[row])
+                course_ids.append(self._course_ids[row])
+                semester_ids.append(self._semester_ids[row])
+                grade_ids.append(self._grade_ids[row])
+
+        self._student_ids = student_ids
+        self._course_ids = course_ids
+        self._semester_ids = semester_ids
+        self._grade_ids = grade_ids
+        self._deleted = bytearray(len(student_ids))
+        self._deleted_count = 0
+
+    def __len__(self):
+        """
+        Get the number of rows that are not deleted.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        return len(self._student_ids) - self._deleted_count
+
+    def __iter__(self):
+        """
+        Iterate over views of the rows that are not deleted.
+
+        Author: [Humza Khan]
+        Date: [Dec 16]
+        """
+        deleted = self._deleted
+        for row in range(len(self._student_ids)):
+            if not deleted[row]:
+                yield EnrollmentRow(self, row)
+
+    def rows_in_semester(self, semester):
+        """
+        Iterate over views of the rows of one semester that are not
+        deleted. Only the semester column is read for the other rows, and
+        no view is made for them.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        code = self._semesters.find_code(semester)
+        if code is None:
+            return
+        deleted = self._deleted
+        for row, semester_id in enumerate(self._semester_ids):
+            if semester_id == code and not deleted[row]:
+                yield EnrollmentRow(self, row)
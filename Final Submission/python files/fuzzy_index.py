@@ -0,0 +1,410 @@
+"""
+FuzzyIndex Class - Course Registration System
+==============================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Finds records whose words are close to the words of a search term, so a
+typo such as "Martinze" still finds "Martinez", and ranks them by how
+many typos were needed.
+
+RESPONSIBILITIES:
+- Keep the distinct lower-case words of every record's text fields, and
+  which records use each word
+- Find the words within a small edit distance of each search word without
+  comparing the search word to every word
+- Rank records by the total number of typos, closest first
+
+HOW A SEARCH WORKS:
+Typos allowed per search word (max_typos()): none for 1-2 characters, 1 for
+3-5 characters, 2 for longer words. A typo is one inserted, deleted or
+changed character, or two neighbouring characters swapped.
+
+Candidate words are narrowed down in two steps before the edit distance
+is computed:
+1. Length filter: a word with k typos is at most k characters longer or
+   shorter, so only the words of those lengths are looked at.
+2. Bigram filter: words are padded ("^martinez$") and split into bigrams
+   ("^m", "ma", ..., "z$"). One typo changes at most 3 bigrams, so a word
+   within k typos shares at least (number of distinct bigrams - 3k) of
+   them with the search word, counting the distinct bigrams of either
+   word. Repeated bigrams ("lalala") count once, so each word's own
+   distinct count is kept. Shared bigrams are counted with a
+   bigram -> words index kept per word length.
+Only the words that pass both filters are compared with edit_distance(),
+which also gives up as soon as the distance is over the limit.
+
+A search term of several words (e.g. "jon smiht") matches the records that
+have a close word for every search word; their typos are added up.
+
+LAZY BUILDING:
+As with TrigramIndex, reset(items) only remembers the manager's list and
+the index is built at the first search.
+
+"""
+
+import re
+from collections import Counter
+from itertools import chain
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class FuzzyIndex:
+    def __init__(self, fields):
+        """
+        Initialize an empty FuzzyIndex.
+
+        Parameters:
+            fields (function): Returns the searchable text fields of a
+                record as a tuple (None counts as "")
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self._fields = fields
+        self.reset([])
+
+    def reset(self, items):
+        """
+        Replace every record with the given list, to be indexed at the
+        first search.
+
+        Parameters:
+            items (list): The manager's list of records, in order
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._unbuilt = items
+        self._items = []
+        self._words = []
+        self._positions = {}
+        self._removed = 0
+        self._records = {}
+        self._bigrams = {}
+        self._bigram_counts = {}
+
+    def build(self):
+        """
+        Index the records given to reset() now, if not done yet.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is None:
+            return
+        items = self._unbuilt
+        self._unbuilt = None
+        for item in items:
+            self._add(item)
+
+    def add(self, item):
+        """
+        Add a record.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is None:
+            self._add(item)
+
+    def update(self, item):
+        """
+        Re-index a record whose fields changed, keeping its place in the
+        result order. Unknown records are added.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is not None:
+            return
+        position = self._positions.get(id(item))
+        if position is None:
+            self._add(item)
+            return
+
+        old_words = set(self._words[position])
+        new_words = _record_words(self._fields(item))
+        for word in old_words - new_words:
+            self._unlink(word, position)
+        for word in new_words - old_words:
+            self._link(word, position)
+        self._words[position] = tuple(new_words)
+
+    def remove(self, item):
+        """
+        Remove a record. Unknown records are ignored.
+
+        When more records have been removed than are left, the index is
+        rebuilt so it does not keep growing.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is not None:
+            return
+        position = self._positions.pop(id(item), None)
+        if position is None:
+            return
+
+        for word in self._words[position]:
+            self._unlink(word, position)
+        self._items[position] = None
+        self._words[position] = None
+        self._removed += 1
+
+        if self._removed > len(self._positions):
+            self.reset([item for item in self._items if item is not None])
+            self.build()
+
+    def search(self, term, limit=20):
+        """
+        Find the records closest to term, allowing a few typos per word.
+
+        Parameters:
+            term (str): One or more words
+            limit (int): Maximum number of records to return
+
+        Returns:
+            list: (record, typos) tuples, fewest typos first; records with
+                the same number of typos in the order they were added
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.build()
+        search_words = WORD_PATTERN.findall(term.lower())
+        if len(search_words) == 0:
+            return []
+
+        totals = None
+        for search_word in search_words:
+            best = {}
+            for word, typos in self.close_words(search_word):
+                for position in self._records[word]:
+                    if typos < best.get(position, typos + 1):
+                        best[position] = typos
+            if totals is None:
+                totals = best
+            else:
+                totals = {position: totals[position] + typos
+                          for position, typos in best.items() if position in totals}
+            if len(totals) == 0:
+                return []
+
+        ranked = sorted(totals.items(), key=lambda entry: (entry[1], entry[0]))
+        return [(self._items[position], typos) for position, typos in ranked[:limit]]
+
+    def close_words(self, search_word):
+        """
+        Find the indexed words within max_typos(search_word) of a word.
+
+        Returns:
+            list: (word, typos) tuples
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.build()
+        search_word = search_word.lower()
+        limit = max_typos(search_word)
+        if limit == 0:
+            return [(search_word, 0)] if search_word in self._records else []
+
+        search_bigrams = _bigrams(search_word)
+        close = []
+        for length in range(max(1, len(search_word) - limit), len(search_word) + limit + 1):
+            by_bigram = self._bigrams.get(length)
+            if by_bigram is None:
+                continue
+
+            needed = len(search_bigrams) - 3 * limit
+            shared = Counter(chain.from_iterable(by_bigram.get(bigram, ()) for bigram in search_bigrams))
+            if needed <= 0:
+                candidates = set(chain.from_iterable(by_bigram.values()))
+            else:
+                candidates = [word for word, count in shared.items() if count >= needed]
+
+            for word in candidates:
+                # The same bound counted from the word's own distinct bigrams
+                if shared[word] < self._bigram_counts[word] - 3 * limit:
+                    continue
+                typos = edit_distance(search_word, word, limit)
+                if typos is not None:
+                    close.append((word, typos))
+        return close
+
+    def __len__(self):
+        """
+        Get the number of records in the index.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.build()
+        return len(self._positions)
+
+    def _add(self, item):
+        """
+        Index one record after the others.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        words = _record_words(self._fields(item))
+        position = len(self._items)
+        self._items.append(item)
+        self._words.append(tuple(words))
+        self._positions[id(item)] = position
+        for word in words:
+            self._link(word, position)
+
+    def _link(self, word, position):
+        """
+        Record that a record uses a word, indexing the word if it is new.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        positions = self._records.get(word)
+        if positions is not None:
+            positions.add(position)
+            return
+
+        self._records[word] = {position}
+        by_bigram = self._bigrams.setdefault(len(word), {})
+        bigrams = _bigrams(word)
+        self._bigram_counts[word] = len(bigrams)
+        for bigram in bigrams:
+            words = by_bigram.get(bigram)
+            if words is None:
+                by_bigram[bigram] = {word}
+            else:
+                words.add(word)
+
+    def _unlink(self, word, position):
+        """
+        Record that a record no longer uses a word, forgetting the word if
+        no record uses it.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        positions = self._records[word]
+        positions.discard(position)
+        if len(positions) > 0:
+            return
+
+        del self._records[word]
+        del self._bigram_counts[word]
+        by_bigram = self._bigrams[len(word)]
+        for bigram in _bigrams(word):
+            words = by_bigram[bigram]
+            words.discard(word)
+            if len(words) == 0:
+                del by_bigram[bigram]
+        if len(by_bigram) == 0:
+            del self._bigrams[len(word)]
+
+
+def max_typos(word):
+    """
+    Get the number of typos allowed in a search word of this length.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    if len(word) <= 2:
+        return 0
+    if len(word) <= 5:
+        return 1
+    return 2
+
+
+def edit_distance(first, second, limit):
+    """
+    Count the typos between two words: inserted, deleted or changed
+    characters, and swaps of two neighbouring characters (optimal string
+    alignment distance).
+
+    A path through the table that strays more than limit cells from the
+    diagonal already costs more than limit, so only that band of each row
+    is filled in, and the calculation stops as soon as every entry of a
+    row is over limit.
+
+    Parameters:
+        first, second (str): The words
+        limit (int): Largest distance of interest
+
+    Returns:
+        int or None: The distance, None if it is more than limit
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    length = len(second)
+    if abs(len(first) - length) > limit:
+        return None
+    if first == second:
+        return 0
+
+    over = limit + 1
+    before = None
+    previous = [j if j <= limit else over for j in range(length + 1)]
+    for i in range(1, len(first) + 1):
+        current = [over] * (length + 1)
+        if i <= limit:
+            current[0] = i
+        first_char = first[i - 1]
+        row_best = current[0]
+        for j in range(max(1, i - limit), min(length, i + limit) + 1):
+            value = previous[j - 1] if first_char == second[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (before is not None and j > 1 and first_char == second[j - 2]
+                    and first[i - 2] == second[j - 1] and before[j - 2] + 1 < value):
+                value = before[j - 2] + 1
+            if value > over:
+                value = over
+            current[j] = value
+            if value < row_best:
+                row_best = value
+        if row_best > limit:
+            return None
+        before = previous
+        previous = current
+
+    distance = previous[length]
+    return distance if distance <= limit else None
+
+
+def _record_words(texts):
+    """
+    Get the set of distinct lower-case words in a record's fields.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    words = set()
+    for text in texts:
+        if text:
+            words.update(WORD_PATTERN.findall(text.lower()))
+    return words
+
+
+def _bigrams(word):
+    """
+    Get the distinct bigrams of a word padded with "^" and "$".
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    padded = "^" + word + "$"
+    return {padded[start:start + 2] for start in range(len(padded) - 1)}
@@ -0,0 +1,297 @@
+"""
+GradeAnalytics Class - Course Registration System
+==================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Summarizes the letter grades in the enrollment data: how grades are
+distributed in each course, the mean GPA of each course, how the mean
+GPA changes from semester to semester and the mean GPA of each program.
+
+RESPONSIBILITIES:
+- Turn the grade, course, semester and student columns into integer
+  arrays once, instead of reading one enrollment dictionary at a time
+- Count grades per group (course, semester or program) in one pass
+- Work out distributions and mean GPAs from those counts
+
+HOW THE COUNTING WORKS:
+Each grade gets a slot: 0 for "A" up to 9 for "F", and UNGRADED (10) for
+an empty or unknown grade. Every enrollment also has a group number
+(its course, semester or program code), so
+
+    counts[group][slot] = number of enrollments with that group and grade
+
+is a single numpy.bincount() over group * SLOTS + slot. A mean GPA is the
+grade points weighted by these counts, so all the reports come from the
+same count tables.
+
+NUMPY:
+numpy is optional. Without it the counting falls back to a plain Python
+loop that gives the same counts, only much slower on millions of rows.
+
+FILE DEPENDENCIES:
+- enrollment_table.py (EnrollmentTable class, the column format read here)
+- semesters.py (semester_sort_key, for the semester trend)
+
+"""
+
+from array import array
+
+from enrollment_table import CodeTable, EnrollmentTable
+from semesters import semester_sort_key
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+GRADE_POINTS = {"A": 4.0, "A-": 3.7, "B+": 3.3, "B": 3.0, "B-": 2.7,
+                "C+": 2.3, "C": 2.0, "C-": 1.7, "D": 1.0, "F": 0.0}
+GRADES = tuple(GRADE_POINTS)
+UNGRADED = len(GRADES)
+SLOTS = UNGRADED + 1
+UNKNOWN_PROGRAM = "(unknown)"
+
+
+class GradeAnalytics:
+    def __init__(self, table, programs=None):
+        """
+        Prepare analytics for the live rows of an EnrollmentTable.
+
+        The columns are copied, so the table can keep changing afterwards.
+
+        Parameters:
+            table (EnrollmentTable): The enrollments
+            programs (dict): Student ID -> program, for program_means()
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        columns = table.columns()
+        course_ids, self.course_codes = columns["course_code"]
+        semester_ids, self.semesters = columns["semester"]
+        grade_ids, grade_values = columns["grade"]
+        slot_of_grade = [GRADES.index(value) if value in GRADE_POINTS else UNGRADED
+                         for value in grade_values]
+        self._programs = programs if programs is not None else {}
+
+        if numpy is not None:
+            live = None
+            if 1 in columns["deleted"]:
+                live = numpy.frombuffer(columns["deleted"], dtype=numpy.uint8) == 0
+            self._student_ids = _column_copy(columns["student_id"], live)
+            self._course_ids = _column_copy(course_ids, live)
+            self._semester_ids = _column_copy(semester_ids, live)
+            self._slots = numpy.array(slot_of_grade, dtype=numpy.int64)[_column_copy(grade_ids, live)]
+        else:
+            deleted = columns["deleted"]
+            rows = [row for row in range(len(deleted)) if not deleted[row]]
+            self._student_ids = [columns["student_id"][row] for row in rows]
+            self._course_ids = [course_ids[row] for row in rows]
+            self._semester_ids = [semester_ids[row] for row in rows]
+            self._slots = [slot_of_grade[grade_ids[row]] for row in rows]
+
+    @classmethod
+    def from_rows(cls, rows, programs=None):
+        """
+        Prepare analytics for enrollment tuples, e.g. from
+        EnrollmentManager.enrollment_rows().
+
+        Parameters:
+            rows (iterable): (student_id, course_code, semester, grade) tuples
+            programs (dict): Student ID -> program, for program_means()
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        table = EnrollmentTable()
+        for student_id, course_code, semester, grade in rows:
+            table.append_row(student_id, course_code, semester, grade)
+        return cls(table, programs)
+
+    def row_count(self):
+        """
+        Get the number of enrollments, graded or not.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return len(self._slots)
+
+    def overall(self):
+        """
+        Get the mean GPA over every graded enrollment.
+
+        Returns:
+            tuple: (mean GPA or None, number of graded enrollments)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if numpy is not None:
+            keys = numpy.zeros(len(self._slots), dtype=numpy.int64)
+        else:
+            keys = [0] * len(self._slots)
+        return _mean_of(self._grade_counts(keys, 1)[0])
+
+    def course_distributions(self):
+        """
+        Count each letter grade in each course.
+
+        Returns:
+            dict: Course code -> {grade: count} for every grade in GRADES,
+                plus "" -> number of ungraded enrollments
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        counts = self._grade_counts(self._course_ids, len(self.course_codes))
+        distributions = {}
+        for code, row in zip(self.course_codes, counts):
+            if sum(row) > 0:
+                distribution = dict(zip(GRADES, row))
+                distribution[""] = row[UNGRADED]
+                distributions[code] = distribution
+        return distributions
+
+    def course_means(self):
+        """
+        Get the mean GPA of each course.
+
+        Returns:
+            dict: Course code -> (mean GPA or None, number graded)
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        counts = self._grade_counts(self._course_ids, len(self.course_codes))
+        return {code: _mean_of(row) for code, row in zip(self.course_codes, counts) if sum(row) > 0}
+
+    def semester_trends(self):
+        """
+        Get the mean GPA of each semester, oldest semester first.
+
+        Returns:
+            list: (semester, mean GPA or None, number graded) tuples
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        counts = self._grade_counts(self._semester_ids, len(self.semesters))
+        trends = [(semester,) + _mean_of(row)
+                  for semester, row in zip(self.semesters, counts) if sum(row) > 0]
+        trends.sort(key=lambda trend: semester_sort_key(trend[0]))
+        return trends
+
+    def program_means(self):
+        """
+        Get the mean GPA of the students of each program.
+
+        Students missing from the programs given to the constructor are
+        counted under UNKNOWN_PROGRAM.
+
+        Returns:
+            dict: Program -> (mean GPA or None, number graded)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        keys, names = self._program_keys()
+        counts = self._grade_counts(keys, len(names))
+        return {name: _mean_of(row) for name, row in zip(names, counts) if sum(row) > 0}
+
+    def _program_keys(self):
+        """
+        Get the program code of every enrollment, looking up each student
+        once.
+
+        Returns:
+            tuple: (program code per enrollment, program names by code)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        names = CodeTable()
+        if numpy is not None:
+            student_ids, per_row = numpy.unique(self._student_ids, return_inverse=True)
+            codes = numpy.array([names.code_for(self._program_of(int(s))) for s in student_ids],
+                                dtype=numpy.int64)
+            return codes[per_row.reshape(-1)], names.values()
+
+        code_of_student = {}
+        keys = array("I")
+        for student_id in self._student_ids:
+            code = code_of_student.get(student_id)
+            if code is None:
+                code = code_of_student[student_id] = names.code_for(self._program_of(student_id))
+            keys.append(code)
+        return keys, names.values()
+
+    def _program_of(self, student_id):
+        """
+        Get a student's program, or UNKNOWN_PROGRAM.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        program = self._programs.get(student_id)
+        return program if program else UNKNOWN_PROGRAM
+
+    def _grade_counts(self, keys, key_count):
+        """
+        Count the enrollments of each group with each grade slot.
+
+        Parameters:
+            keys: Group code of every enrollment (0 to key_count - 1)
+            key_count (int): Number of groups
+
+        Returns:
+            list: key_count lists of SLOTS counts
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if numpy is not None:
+            combined = numpy.asarray(keys, dtype=numpy.int64) * SLOTS + self._slots
+            counts = numpy.bincount(combined, minlength=key_count * SLOTS)
+            return counts.reshape(key_count, SLOTS).tolist()
+
+        counts = [[0] * SLOTS for key in range(key_count)]
+        for key, slot in zip(keys, self._slots):
+            counts[key][slot] += 1
+        return counts
+
+
+def _mean_of(counts):
+    """
+    Get the mean GPA and number graded from one group's slot counts.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    graded = sum(counts[:UNGRADED])
+    if graded == 0:
+        return (None, 0)
+    points = sum(count * GRADE_POINTS[grade] for grade, count in zip(GRADES, counts))
+    return (points / graded, graded)
+
+
+def _column_copy(column, live):
+    """
+    Copy an array column into a numpy array, keeping only the live rows
+    if live is given. The copy stops numpy from holding on to the
+    column's buffer, which would stop the table from growing.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    if len(column) == 0:
+        return numpy.zeros(0, dtype=column.typecode)
+    values = numpy.frombuffer(column, dtype=column.typecode)
+    if live is None:
+        return values.copy()
+    return values[live]
@@ -0,0 +1,106 @@
+"""
+TableListing Class - Course Registration System
+================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Prints long tables (all students, all courses, all enrollments) without
+writing them one line at a time, and lets the user page through them.
+
+RESPONSIBILITIES:
+- Format rows only as they are printed, taking them one at a time from
+  whatever the manager passes in (a list or a generator), so a listing
+  never needs a second full copy of the data
+- Skip rows before an offset and stop after a limit
+- Write each page with a single write() call, and ask before printing
+  the next page when paging
+
+WHY:
+print() once per row costs a write to the terminal for every line, which
+takes seconds for 100,000 rows. Joining a page of lines first turns that
+into one write per page.
+
+"""
+
+import sys
+from itertools import islice
+
+PAGE_SIZE = 50
+ROWS_PER_WRITE = 1000
+NEXT_PAGE_PROMPT = "-- Press Enter for more, or q to stop: "
+
+
+class TableListing:
+    def __init__(self, title, width, header, format_row, total_label):
+        """
+        Initialize a TableListing.
+
+        Parameters:
+            title (str): Heading printed above the table
+            width (int): Width of the "=" and "-" rules
+            header (str): Column headings line
+            format_row (function): Turns one row into its printed line
+            total_label (str): Label of the total line, e.g. "Total Students"
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self.title = title
+        self.width = width
+        self.header = header
+        self.format_row = format_row
+        self.total_label = total_label
+
+    def render(self, rows, total, offset=0, limit=None, page_size=None, output=None):
+        """
+        Print the table.
+
+        Parameters:
+            rows (iterable): All rows, in order; only those printed are
+                formatted
+            total (int): Number of rows, for the total line
+            offset (int): Number of rows to skip
+            limit (int): Maximum number of rows to print (all if None)
+            page_size (int): Rows per page, asking before each next page
+                (no pages and no questions if None)
+            output (file): Where to write (sys.stdout if None)
+
+        Returns:
+            int: Number of rows printed
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if output is None:
+            output = sys.stdout
+        stop = None if limit is None else offset + limit
+        rows = iter(islice(rows, offset, stop))
+        rows_per_write = page_size if page_size else ROWS_PER_WRITE
+
+        lines = ["=" * self.width, self.title, "=" * self.width, self.header, "-" * self.width]
+        shown = 0
+        page = list(islice(rows, rows_per_write))
+        while page:
+            lines.extend(self.format_row(row) for row in page)
+            shown += len(page)
+            page = list(islice(rows, rows_per_write))
+            if not page:
+                break
+            output.write("\n".join(lines) + "\n")
+            lines = []
+            if page_size and input(NEXT_PAGE_PROMPT).strip().lower() == "q":
+                break
+
+        lines.append("=" * self.width)
+        lines.append(f"{self.total_label}: {total}")
+        if shown == 0 and total > 0:
+            lines.append("Showing: no rows")
+        elif shown < total:
+            lines.append(f"Showing: rows {offset + 1}-{offset + shown}")
+        output.write("\n".join(lines) + "\n")
+        output.flush()
+        return shown
@@ -0,0 +1,202 @@
+"""
+Load Generator - Course Registration System
+============================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Measures how the registration server (server.py) performs with many
+clients connected at once.
+
+RESPONSIBILITIES:
+- Open many client connections to a running server
+- Send a mix of register, drop, schedule, roster and search requests,
+  each client waiting for one answer before sending the next request
+- Report throughput and the 50th and 99th percentile latency
+
+HOW TO RUN:
+python server.py        (in one terminal)
+python load_client.py   (in another; --help lists the options)
+
+FILE DEPENDENCIES:
+- server.py (protocol, default host and port)
+
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from server import HOST, PORT, STREAM_LIMIT
+
+OPERATION_MIX = (("register", 40), ("drop", 30), ("schedule", 15), ("roster", 10), ("search", 5))
+
+
+async def send_request(reader, writer, request):
+    """
+    Send one request and wait for its response.
+
+    Returns:
+        dict: The response
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    writer.write((json.dumps(request) + "\n").encode())
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def fetch_test_data(host, port, student_limit=2000):
+    """
+    Ask the server for student IDs and course codes to use in requests.
+
+    Returns:
+        tuple: (list of student IDs, list of course codes)
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+    try:
+        students = await send_request(reader, writer, {"id": 0, "op": "search", "kind": "student",
+                                                       "term": "", "limit": student_limit})
+        courses = await send_request(reader, writer, {"id": 1, "op": "search", "kind": "course", "term": ""})
+    finally:
+        writer.close()
+    return ([s["student_id"] for s in students["data"]],
+            [c["course_code"] for c in courses["data"]])
+
+
+def make_request(request_id, random_source, student_ids, course_codes):
+    """
+    Build one random request following OPERATION_MIX.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    operations = [name for name, weight in OPERATION_MIX]
+    weights = [weight for name, weight in OPERATION_MIX]
+    operation = random_source.choices(operations, weights)[0]
+    student_id = random_source.choice(student_ids)
+    course_code = random_source.choice(course_codes)
+
+    request = {"id": request_id, "op": operation}
+    if operation == "register":
+        request.update(student_id=student_id, course_code=course_code, semester="Fall2024")
+    elif operation == "drop":
+        request.update(student_id=student_id, course_code=course_code)
+    elif operation == "schedule":
+        request.update(student_id=student_id)
+    elif operation == "roster":
+        request.update(course_code=course_code)
+    else:
+        request.update(kind="student", term="a", limit=20)
+    return request
+
+
+async def run_client(host, port, requests, seed, student_ids, course_codes, latencies, outcomes):
+    """
+    Send requests from one connection, one at a time, recording the
+    latency of each.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    random_source = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+    try:
+        for i in range(requests):
+            request = make_request(i, random_source, student_ids, course_codes)
+            start = time.perf_counter()
+            response = await send_request(reader, writer, request)
+            latencies.append(time.perf_counter() - start)
+            outcomes[response["ok"]] = outcomes.get(response["ok"], 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    """
+    Get the value below which the given fraction of sorted_values fall.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    if len(sorted_values) == 0:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run_load_test(host=HOST, port=PORT, clients=50, requests_per_client=200, seed=216):
+    """
+    Run the load test against a running server.
+
+    Returns:
+        dict: requests, seconds, throughput, p50 and p99 (seconds),
+            succeeded and failed counts
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    student_ids, course_codes = await fetch_test_data(host, port)
+    latencies = []
+    outcomes = {}
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, requests_per_client, seed + c,
+                                      student_ids, course_codes, latencies, outcomes)
+                           for c in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "succeeded": outcomes.get(True, 0),
+        "failed": outcomes.get(False, 0)
+    }
+
+
+def print_report(report, clients):
+    """
+    Print the results of run_load_test().
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    print(f"Load test ({clients} clients, {report['requests']} requests)")
+    print(f"  Throughput:   {report['throughput']:10.0f} requests/s")
+    print(f"  p50 latency:  {report['p50'] * 1000:10.2f} ms")
+    print(f"  p99 latency:  {report['p99'] * 1000:10.2f} ms")
+    print(f"  Succeeded / failed (e.g. course full, not enrolled): {report['succeeded']} / {report['failed']}")
+
+
+def main():
+    """
+    Run the load test with options from the command line.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    parser = argparse.ArgumentParser(description="Load test the registration server")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    arguments = parser.parse_args()
+
+    report = asyncio.run(run_load_test(arguments.host, arguments.port, arguments.clients, arguments.requests))
+    print_report(report, arguments.clients)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Lock Table - Course Registration System
+========================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Gives every course and every student its own lock, so threads that
+register students in different courses do not wait for each other.
+
+RESPONSIBILITIES:
+- Create a lock the first time a key is used
+- Acquire several keys at once, always in sorted order, so two threads
+  locking the same keys can never deadlock
+
+KEYS:
+Keys are tuples such as ("course", "CPRG216") and ("student", 2023047891).
+Sorting compares the first element first, so course keys are always taken
+before student keys.
+
+"""
+
+import contextlib
+import threading
+
+
+class LockTable:
+    def __init__(self):
+        """
+        Initialize an empty LockTable.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def lock_for(self, key):
+        """
+        Get the lock for a key, creating it if needed.
+
+        Returns:
+            threading.Lock: The key's lock
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, threading.Lock())
+        return lock
+
+    @contextlib.contextmanager
+    def holding(self, *keys):
+        """
+        Hold the locks for all given keys, e.g.
+        with locks.holding(("course", code), ("student", student_id)): ...
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        locks = [self.lock_for(key) for key in sorted(set(keys))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def __len__(self):
+        """
+        Get the number of keys that have a lock.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return len(self._locks)
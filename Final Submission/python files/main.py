@@ -22,37 +22,155 @@ FILE DEPENDENCIES:
 - student_manager.py (StudentManager class)
 - course_manager.py (CourseManager class)
 - enrollment_manager.py (EnrollmentManager class)
+- snapshot.py (binary snapshot cache for fast start-up)
+- storage.py (CsvStorage / SqliteStorage storage engines)
+- listing.py (TableListing class, page size of the long listings)
+- grade_analytics.py (grade letters shown in the grade report)
 
 """
 
 from student_manager import StudentManager
 from course_manager import CourseManager
 from enrollment_manager import EnrollmentManager
+from grade_analytics import GRADES
+from listing import PAGE_SIZE, TableListing
+from snapshot import load_managers_from_snapshot, load_snapshot, save_snapshot
+from storage import CsvStorage
+
+TOP_COURSES = 5
 
 
 class RegistrationSystem:
-    def __init__(self):
+    def __init__(self, flush_policy=None, use_snapshot=True, storage=None, active_semester=None):
         """
         Initialize the Registration System.
 
-        Creates all manager objects and links them together.
+        Creates all manager objects and links them together. If
+        registration.snapshot matches the current csv files, the data is
+        loaded from it; otherwise the csv files are parsed and a new
+        snapshot is saved for next time.
+
+        Parameters:
+            flush_policy (FlushPolicy): When the managers write changes to
+                disk (after every change if None). Whatever the policy,
+                everything is written when run() exits.
+            use_snapshot (bool): Load from and save to the snapshot cache
+                (csv storage only)
+            storage (CsvStorage or SqliteStorage): Storage engine shared by
+                all managers (the csv files if None)
+            active_semester (str): Term whose enrollments fill the courses'
+                seats (the latest term with enrollments if None)
 
         Author: [Ali Alimarah]
         Date: [Dec 12]
-        Version: 1.0
+        Version: 1.4
         """
         print("=" * 70)
         print("COURSE REGISTRATION SYSTEM")
         print("Initializing...")
         print("=" * 70)
 
-        self.student_manager = StudentManager()
-        self.course_manager = CourseManager()
-        self.enrollment_manager = EnrollmentManager(self.student_manager, self.course_manager)
+        if storage is None:
+            storage = CsvStorage()
+        self.storage = storage
+        self.use_snapshot = use_snapshot and isinstance(storage, CsvStorage)
+        snapshot = load_snapshot() if self.use_snapshot else None
+        load_from_file = snapshot is None
+
+        self.student_manager = StudentManager(flush_policy, load_from_file, storage)
+        self.course_manager = CourseManager(flush_policy, load_from_file, storage)
+        self.enrollment_manager = EnrollmentManager(self.student_manager, self.course_manager,
+                                                    flush_policy=flush_policy,
+                                                    load_from_file=load_from_file,
+                                                    storage=storage,
+                                                    active_semester=active_semester)
+
+        if snapshot is not None:
+            load_managers_from_snapshot(self.student_manager, self.course_manager,
+                                        self.enrollment_manager, snapshot)
+            self.storage.generations.update(snapshot["generations"])
+        else:
+            self.save_snapshot()
 
         print("✓ System initialized successfully!")
         print()
 
+    def save_snapshot(self):
+        """
+        Save the snapshot cache, if enabled.
+
+        The snapshot is only a cache, so failing to write it is not an error.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 18]
+        """
+        if not self.use_snapshot:
+            return
+        try:
+            save_snapshot(self.student_manager, self.course_manager, self.enrollment_manager,
+                          self.storage.generations)
+        except OSError:
+            pass
+
+    def shutdown(self):
+        """
+        Save everything before the program exits.
+
+        Writes anything the flush policy has held back, folds the
+        enrollment journal back into enrollments.csv, saves the snapshot
+        and closes the storage engine. The snapshot is skipped if another
+        program has changed the data, since memory no longer matches the
+        files.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.student_manager.flush()
+        self.course_manager.flush()
+        self.enrollment_manager.compact_enrollments()
+        if not self.storage.changed_tables():
+            self.save_snapshot()
+        self.storage.close()
+
+    def refresh(self):
+        """
+        Pick up changes another copy of the program (e.g. at another
+        registrar desk) has saved to the same files.
+
+        Unsaved changes are written first, merged with the other
+        program's changes by the storage engine, and then every changed
+        table is loaded again. Called before each menu choice is carried
+        out, so checks such as course capacity see the latest data.
+
+        Returns:
+            set: Names of the tables that were loaded again
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if not self.storage.changed_tables():
+            return set()
+
+        self.student_manager.flush()
+        self.course_manager.flush()
+        self.enrollment_manager.flush()
+        changed = self.storage.changed_tables()
+
+        if "students" in changed:
+            self.student_manager.read_students_file()
+        if "courses" in changed:
+            self.course_manager.read_courses_file()
+        if "enrollments" in changed:
+            self.enrollment_manager.read_enrollments_file()
+        elif "courses" in changed:
+            self.course_manager.update_enrollment_counts(self.enrollment_manager)
+        if "waitlist" in changed:
+            self.enrollment_manager.read_waitlist_file()
+
+        if changed:
+            print(f"Note: reloaded {', '.join(sorted(changed))} changed by another user.")
+        return changed
+
     def display_main_menu(self):
         """
         Display the main menu and handle user selection.
@@ -107,9 +225,10 @@ class RegistrationSystem:
             print("=" * 70)
 
             choice = input("Enter your choice (1-7): ").strip()
+            self.refresh()
 
             if choice == "1":
-                self.student_manager.display_students_list()
+                self.student_manager.display_students_list(page_size=PAGE_SIZE)
             elif choice == "2":
                 self.student_manager.search_student_by_id()
             elif choice == "3":
@@ -146,9 +265,10 @@ class RegistrationSystem:
             print("=" * 70)
 
             choice = input("Enter your choice (1-7): ").strip()
+            self.refresh()
 
             if choice == "1":
-                self.course_manager.display_courses_list()
+                self.course_manager.display_courses_list(page_size=PAGE_SIZE)
             elif choice == "2":
                 self.course_manager.search_course_by_code()
             elif choice == "3":
@@ -180,10 +300,14 @@ class RegistrationSystem:
             print("3 - Display student schedule")
             print("4 - Display course roster")
             print("5 - Assign grade")
-            print("6 - Return to main menu")
+            print("6 - Import enrollments from file")
+            print("7 - Display student transcript")
+            print("8 - Display course waitlist")
+            print("9 - Return to main menu")
             print("=" * 70)
 
-            choice = input("Enter your choice (1-6): ").strip()
+            choice = input("Enter your choice (1-9): ").strip()
+            self.refresh()
 
             if choice == "1":
                 self.enrollment_manager.register_student_in_course()
@@ -196,9 +320,15 @@ class RegistrationSystem:
             elif choice == "5":
                 self.enrollment_manager.assign_grade()
             elif choice == "6":
+                self.enrollment_manager.import_enrollments_from_file()
+            elif choice == "7":
+                self.enrollment_manager.display_student_transcript()
+            elif choice == "8":
+                self.enrollment_manager.display_waitlist()
+            elif choice == "9":
                 break
             else:
-                print("Invalid choice. Please enter a number from 1 to 6.")
+                print("Invalid choice. Please enter a number from 1 to 9.")
 
     def display_reports_menu(self):
         """
@@ -213,24 +343,37 @@ class RegistrationSystem:
             print("=" * 70)
             print("1 - All enrollments")
             print("2 - System statistics")
-            print("3 - Return to main menu")
+            print("3 - Grade analytics")
+            print("4 - Schedule conflicts")
+            print("5 - Return to main menu")
             print("=" * 70)
 
-            choice = input("Enter your choice (1-3): ").strip()
+            choice = input("Enter your choice (1-5): ").strip()
+            self.refresh()
 
             if choice == "1":
-                self.enrollment_manager.display_all_enrollments()
+                self.enrollment_manager.display_all_enrollments(page_size=PAGE_SIZE)
             elif choice == "2":
                 self.display_statistics()
             elif choice == "3":
+                self.display_grade_analytics()
+            elif choice == "4":
+                self.display_schedule_conflicts()
+            elif choice == "5":
                 break
             else:
-                print("Invalid choice. Please enter a number from 1 to 3.")
+                print("Invalid choice. Please enter a number from 1 to 5.")
 
     def display_statistics(self):
         """
         Display system statistics.
 
+        Every number is kept up to date by the managers as changes happen
+        (see enrollment_stats.py), so nothing here depends on how many
+        students, courses or enrollments there are. Enrollment numbers are
+        for the active term, the same counts the courses show, so no older
+        term is read from disk.
+
         Author: [Humza Khan]
         Date: [Dec 13]
         """
@@ -238,35 +381,93 @@ class RegistrationSystem:
         print("SYSTEM STATISTICS")
         print("=" * 70)
 
+        stats = self.course_manager.stats
         total_students = self.student_manager.get_student_count()
         total_courses = self.course_manager.get_course_count()
-        total_enrollments = len(self.enrollment_manager._enrollments)
 
-        if total_courses > 0:
-            avg_students_per_course = total_enrollments / total_courses
-        else:
-            avg_students_per_course = 0
-
-        top_course = None
-        for course in self.course_manager.courses:
-            if top_course is None:
-                top_course = course
-            else:
-                if course.enrolled_count > top_course.enrolled_count:
-                    top_course = course
+        top_courses = stats.top(TOP_COURSES)
 
         print(f"Total Students: {total_students}")
         print(f"Total Courses: {total_courses}")
-        print(f"Total Enrollments: {total_enrollments}")
-        print(f"Average Students per Course: {avg_students_per_course:.2f}")
+        print(f"Active Term: {self.enrollment_manager.active_semester or 'N/A'}")
+        print(f"Total Enrollments: {stats.total_enrolled}")
+        print(f"Average Students per Course: {stats.average_enrolled():.2f}")
 
-        if top_course:
+        if top_courses:
+            top_course = top_courses[0]
             print(f"Highest Enrollment Course: {top_course.course_code} - {top_course.course_name} ({top_course.enrolled_count} students)")
+            print("Most Enrolled Courses:")
+            for rank, course in enumerate(top_courses, 1):
+                print(f"  {rank}. {course.course_code:<10}{course.enrolled_count:>4} / {course.capacity} students")
         else:
             print("Highest Enrollment Course: N/A")
 
         print("=" * 70)
 
+    def display_grade_analytics(self, page_size=PAGE_SIZE):
+        """
+        Display grade distributions and mean GPAs by course, semester and
+        program (see grade_analytics.py).
+
+        Parameters:
+            page_size (int): Courses per page of the course table (one
+                table without questions if None)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        analytics = self.enrollment_manager.grade_analytics()
+        mean, graded = analytics.overall()
+
+        print("\n" + "=" * 70)
+        print("GRADE ANALYTICS")
+        print("=" * 70)
+        print(f"Graded Enrollments: {graded} of {analytics.row_count()}")
+        print(f"Overall Mean GPA: {_format_gpa(mean)}")
+
+        print("\nBy Semester:")
+        for semester, mean, graded in analytics.semester_trends():
+            print(f"  {semester:<14}{_format_gpa(mean):>6}  ({graded} graded)")
+
+        print("\nBy Program:")
+        for program, (mean, graded) in sorted(analytics.program_means().items()):
+            print(f"  {program:<30}{_format_gpa(mean):>6}  ({graded} graded)")
+        print()
+
+        means = analytics.course_means()
+        distributions = analytics.course_distributions()
+
+        def course_line(code):
+            mean, graded = means[code]
+            counts = "".join(f"{distributions[code][grade]:>4}" for grade in GRADES)
+            return f"{code:<11}{graded:>6}{_format_gpa(mean):>6} {counts}"
+
+        header = f"{'Course':<11}{'Graded':>6}{'GPA':>6} " + "".join(f"{grade:>4}" for grade in GRADES)
+        listing = TableListing("GRADES BY COURSE", 64, header, course_line, "Courses")
+        listing.render(sorted(means), len(means), page_size=page_size)
+
+    def display_schedule_conflicts(self, page_size=PAGE_SIZE):
+        """
+        Display every student taking two courses in the same semester
+        whose meeting times overlap.
+
+        Parameters:
+            page_size (int): Conflicts per page (one table without
+                questions if None)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        conflicts = self.enrollment_manager.find_schedule_conflicts()
+
+        def conflict_line(conflict):
+            student_id, semester, course_code, other_code = conflict
+            return f"{student_id:<14}{semester:<14}{course_code:<12}{other_code:<12}"
+
+        header = f"{'Student ID':<14}{'Semester':<14}{'Course':<12}{'Clashes With':<12}"
+        listing = TableListing("SCHEDULE CONFLICTS", 52, header, conflict_line, "Conflicts")
+        listing.render(conflicts, len(conflicts), page_size=page_size)
+
     def run(self):
         """
         Start the registration system.
@@ -282,7 +483,10 @@ class RegistrationSystem:
         print("=" * 70)
         print()
 
-        self.display_main_menu()
+        try:
+            self.display_main_menu()
+        finally:
+            self.shutdown()
 
         # When user exits
         print("\n" + "=" * 70)
@@ -290,6 +494,16 @@ class RegistrationSystem:
         print("=" * 70)
 
 
+def _format_gpa(mean):
+    """
+    Format a mean GPA with two decimals, or "-" when nothing is graded.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    return "-" if mean is None else f"{mean:.2f}"
+
+
 # ==============================================================================
 # PROGRAM ENTRY POINT (Do not modify)
 # ==============================================================================
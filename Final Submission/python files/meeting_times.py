@@ -0,0 +1,119 @@
+"""
+Meeting Times - Course Registration System
+===========================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Reads and writes the weekly meeting times of a course, e.g.
+"Mon 09:00-10:30; Wed 09:00-10:30".
+
+RESPONSIBILITIES:
+- Parse the text form used in courses.csv and at the prompts
+- Format meeting times back into that text form
+
+SLOTS:
+Each meeting is stored as a (start, end) pair of minutes since Monday
+00:00, so "Wed 09:00-10:30" is (3420, 3510). Two meetings overlap if
+each starts before the other ends; a class ending at 10:30 does not
+clash with one starting at 10:30. A meeting must end on the day it
+starts.
+
+"""
+
+DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MINUTES_PER_DAY = 24 * 60
+SEPARATOR = "; "
+MEETING_TIMES_EXAMPLE = "Mon 09:00-10:30; Wed 09:00-10:30"
+
+
+def parse_meeting_times(text):
+    """
+    Parse meeting times such as "Mon 09:00-10:30; Wed 09:00-10:30".
+
+    Day names may be written in any case and in full ("wednesday").
+
+    Parameters:
+        text (str): Meetings separated by ";" (empty for none)
+
+    Returns:
+        tuple: (start, end) minute pairs, sorted
+
+    Raises:
+        ValueError: If a meeting is not "Day HH:MM-HH:MM" or ends before
+            it starts
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    slots = []
+    for meeting in text.split(";"):
+        meeting = meeting.strip()
+        if meeting == "":
+            continue
+
+        parts = meeting.split()
+        if len(parts) != 2 or "-" not in parts[1]:
+            raise ValueError(f"Invalid meeting time: {meeting}")
+        day = parts[0][:3].capitalize()
+        if day not in DAYS:
+            raise ValueError(f"Invalid day: {parts[0]}")
+        start_text, end_text = parts[1].split("-", 1)
+        start = _minute_of_day(start_text)
+        end = _minute_of_day(end_text)
+        if end <= start:
+            raise ValueError(f"Meeting must end after it starts: {meeting}")
+
+        offset = DAYS.index(day) * MINUTES_PER_DAY
+        slots.append((offset + start, offset + end))
+    return tuple(sorted(slots))
+
+
+def format_meeting_times(slots):
+    """
+    Format (start, end) minute pairs as "Mon 09:00-10:30; Wed 09:00-10:30".
+
+    Returns:
+        str: Meeting times, "" if there are none
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    meetings = []
+    for start, end in slots:
+        day, start_minute = divmod(start, MINUTES_PER_DAY)
+        end_minute = end - day * MINUTES_PER_DAY
+        meetings.append(f"{DAYS[day]} {_clock(start_minute)}-{_clock(end_minute)}")
+    return SEPARATOR.join(meetings)
+
+
+def _minute_of_day(text):
+    """
+    Convert "HH:MM" (24-hour clock) to minutes since midnight.
+
+    Raises:
+        ValueError: If the time is not a valid HH:MM
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    hours, separator, minutes = text.partition(":")
+    if separator == "" or not hours.isdigit() or not minutes.isdigit() or len(minutes) != 2:
+        raise ValueError(f"Invalid time: {text}")
+    hours = int(hours)
+    minutes = int(minutes)
+    if hours > 24 or minutes > 59 or (hours == 24 and minutes > 0):
+        raise ValueError(f"Invalid time: {text}")
+    return hours * 60 + minutes
+
+
+def _clock(minute):
+    """
+    Convert minutes since midnight to "HH:MM".
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return f"{minute // 60:02d}:{minute % 60:02d}"
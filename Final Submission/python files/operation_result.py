@@ -0,0 +1,121 @@
+"""
+OperationResult Class - Course Registration System
+===================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Describes the outcome of one operation of the programmatic API
+(StudentManager.create_student(), EnrollmentManager.register(), ...), so
+callers such as batch jobs and load tests can check results without
+reading printed output. The interactive menu methods print the message.
+
+ERROR CODES:
+- INVALID_STUDENT_ID: student ID is not a number
+- STUDENT_NOT_FOUND / COURSE_NOT_FOUND: no such student or course
+- COURSE_EXISTS: course code is already used
+- ALREADY_ENROLLED: student is already enrolled in the course
+- INVALID_SEMESTER: semester is not a season and year, e.g. Fall2024
+- COURSE_FULL: course has no seats left
+- TIME_CONFLICT: course meets at the same time as one the student already
+  takes that semester
+- NOT_ENROLLED: student is not enrolled in the course
+- ALREADY_WAITLISTED: student is already on the course's waitlist
+- NOT_WAITLISTED: student is not on the course's waitlist
+- SEATS_AVAILABLE: course is not full, so there is no need to wait
+- INVALID_GRADE: grade is not one of the accepted letter grades
+- INVALID_VALUE: a field failed validation (e.g. year, credits, capacity)
+- INVALID_ROW: a line of an import file does not have the expected columns
+- FILE_NOT_FOUND: an import file does not exist
+
+"""
+
+INVALID_STUDENT_ID = "invalid_student_id"
+STUDENT_NOT_FOUND = "student_not_found"
+COURSE_NOT_FOUND = "course_not_found"
+COURSE_EXISTS = "course_exists"
+ALREADY_ENROLLED = "already_enrolled"
+INVALID_SEMESTER = "invalid_semester"
+COURSE_FULL = "course_full"
+TIME_CONFLICT = "time_conflict"
+NOT_ENROLLED = "not_enrolled"
+ALREADY_WAITLISTED = "already_waitlisted"
+NOT_WAITLISTED = "not_waitlisted"
+SEATS_AVAILABLE = "seats_available"
+INVALID_GRADE = "invalid_grade"
+INVALID_VALUE = "invalid_value"
+INVALID_ROW = "invalid_row"
+FILE_NOT_FOUND = "file_not_found"
+
+
+class OperationResult:
+    __slots__ = ("success", "message", "value", "error", "warnings")
+
+    def __init__(self, success, message, value=None, error=None, warnings=None):
+        """
+        Initialize an OperationResult.
+
+        Parameters:
+            success (bool): True if the operation was carried out
+            message (str): Message for the user, as printed by the menus
+            value: The student, course or enrollment the operation
+                created or changed (optional)
+            error (str): One of the error codes above, None on success
+            warnings (list): Messages about parts of the request that were
+                ignored, e.g. an invalid year in an edit (optional)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        Version: 1.0
+        """
+        self.success = success
+        self.message = message
+        self.value = value
+        self.error = error
+        self.warnings = warnings if warnings is not None else []
+
+    @classmethod
+    def ok(cls, message, value=None, warnings=None):
+        """
+        Create a successful result.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        return cls(True, message, value, None, warnings)
+
+    @classmethod
+    def failed(cls, error, message):
+        """
+        Create a failed result.
+
+        Parameters:
+            error (str): Error code
+            message (str): Error message
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        return cls(False, message, None, error)
+
+    def __bool__(self):
+        """
+        A result is true when the operation succeeded.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        return self.success
+
+    def __repr__(self):
+        """
+        Return a short description of the result.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        if self.success:
+            return f"OperationResult(ok, {self.message!r})"
+        return f"OperationResult({self.error}, {self.message!r})"
@@ -0,0 +1,257 @@
+"""
+Persistence Helpers - Course Registration System
+=================================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Decides when the managers write their data to disk, and makes sure every
+write of a data file is atomic.
+
+RESPONSIBILITIES:
+- Track unsaved changes for a manager (DirtyTracker)
+- Decide when unsaved changes are flushed (FlushPolicy)
+- Replace data files atomically (temp file plus rename), optionally
+  reporting where each group of lines was written
+- Pause garbage collection while a data file is bulk loaded
+
+FLUSH POLICIES:
+- IMMEDIATE: write after every change (the default)
+- EVERY_N_OPERATIONS: write once every N changes
+- EVERY_T_SECONDS: write on the first change at least T seconds after the
+  last write
+- ON_EXIT: write only when flush() is called, e.g. when the program exits
+
+"""
+
+import functools
+import gc
+import os
+import time
+
+IMMEDIATE = "immediate"
+EVERY_N_OPERATIONS = "every_n_operations"
+EVERY_T_SECONDS = "every_t_seconds"
+ON_EXIT = "on_exit"
+
+
+class FlushPolicy:
+    def __init__(self, mode=IMMEDIATE, operations=1, seconds=0.0):
+        """
+        Initialize a FlushPolicy.
+
+        Parameters:
+            mode (str): IMMEDIATE, EVERY_N_OPERATIONS, EVERY_T_SECONDS or ON_EXIT
+            operations (int): Number of changes per write (EVERY_N_OPERATIONS)
+            seconds (float): Minimum time between writes (EVERY_T_SECONDS)
+
+        Raises:
+            ValueError: If the mode is unknown or a limit is invalid
+
+        Author: [Humza Khan]
+        Date: [Dec 15]
+        Version: 1.0
+        """
+        if mode not in (IMMEDIATE, EVERY_N_OPERATIONS, EVERY_T_SECONDS, ON_EXIT):
+            raise ValueError(f"Unknown flush policy: {mode}")
+        if int(operations) < 1:
+            raise ValueError("Operations per flush must be 1 or greater")
+        if float(seconds) < 0:
+            raise ValueError("Seconds between flushes must be 0 or greater")
+
+        self.mode = mode
+        self.operations = int(operations)
+        self.seconds = float(seconds)
+
+    def is_due(self, pending, last_flush_time):
+        """
+        Check whether pending changes should be written now.
+
+        Parameters:
+            pending (int): Number of changes not yet written
+            last_flush_time (float): time.monotonic() of the last write
+
+        Returns:
+            bool: True if the changes should be written
+
+        Author: [Humza Khan]
+        Date: [Dec 15]
+        """
+        if pending == 0:
+            return False
+        if self.mode == IMMEDIATE:
+            return True
+        if self.mode == EVERY_N_OPERATIONS:
+            return pending >= self.operations
+        if self.mode == EVERY_T_SECONDS:
+            return time.monotonic() - last_flush_time >= self.seconds
+        return False
+
+
+class DirtyTracker:
+    def __init__(self, flush_function, policy=None):
+        """
+        Initialize a DirtyTracker.
+
+        Parameters:
+            flush_function (function): Writes the manager's data to disk
+            policy (FlushPolicy): When to write (IMMEDIATE if None)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        Version: 1.0
+        """
+        if policy is None:
+            policy = FlushPolicy()
+        self._flush_function = flush_function
+        self.policy = policy
+        self._pending = 0
+        self._last_flush_time = time.monotonic()
+
+    @property
+    def pending(self):
+        """
+        Get the number of changes not yet written to disk.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        """
+        return self._pending
+
+    def mark_dirty(self):
+        """
+        Record one change and write it if the policy says so.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        """
+        self._pending += 1
+        self.flush_if_due()
+
+    def mark_clean(self):
+        """
+        Record that the data was written to disk some other way.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        """
+        self._pending = 0
+        self._last_flush_time = time.monotonic()
+
+    def mark_unwritten(self, count):
+        """
+        Record that a write of count changes failed, so they are pending
+        again.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._pending += count
+
+    def flush_if_due(self):
+        """
+        Write pending changes if the policy says they are due.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        """
+        if self.policy.is_due(self._pending, self._last_flush_time):
+            self.flush()
+
+    def flush(self):
+        """
+        Write pending changes now, whatever the policy.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        """
+        if self._pending == 0:
+            return
+        self._flush_function()
+        self.mark_clean()
+
+
+def without_garbage_collection(function):
+    """
+    Decorator that turns off the garbage collector while function runs.
+
+    Loading a large file creates hundreds of thousands of objects that all
+    stay alive, and the collector would otherwise keep scanning them.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 17]
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            if was_enabled:
+                gc.enable()
+    return wrapper
+
+
+def atomic_write_lines(filename, header, lines):
+    """
+    Replace a file with the given lines without ever leaving it truncated.
+
+    The lines are written to a temporary file in the same directory, synced
+    to disk and then renamed over the original file.
+
+    Parameters:
+        filename (str): File to replace
+        header (str): First line of the file, without newline
+        lines (iterable): Remaining lines, without newlines
+
+    Author: [Humza Khan]
+    Date: [Dec 15]
+    """
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, "w") as file:
+        file.write(header + "\n")
+        for line in lines:
+            file.write(line + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_filename, filename)
+
+
+def atomic_write_segments(filename, header, segments):
+    """
+    Replace a file with groups of lines, like atomic_write_lines(), and
+    report where each group was written.
+
+    Lines end in "\n" on every system, so the positions are byte offsets
+    a reader can seek to.
+
+    Parameters:
+        filename (str): File to replace
+        header (str): First line of the file, without newline
+        segments (iterable): (name, lines) pairs; lines without newlines.
+            Empty groups are left out.
+
+    Returns:
+        list: (name, offset, length) tuples in file order, in bytes
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    temp_filename = filename + ".tmp"
+    positions = []
+    with open(temp_filename, "wb") as file:
+        offset = file.write((header + "\n").encode())
+        for name, lines in segments:
+            data = "".join(line + "\n" for line in lines).encode()
+            if len(data) == 0:
+                continue
+            file.write(data)
+            positions.append((name, offset, len(data)))
+            offset += len(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_filename, filename)
+    return positions
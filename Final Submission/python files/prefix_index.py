@@ -0,0 +1,208 @@
+"""
+PrefixTrie Class - Course Registration System
+==============================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Completes partly typed keys, such as the course code "CPRG2" or the
+start of a last name, without scanning every record.
+
+RESPONSIBILITIES:
+- Store each record under its lower-case key in a prefix tree (trie):
+  one node per character, so all keys starting with the same characters
+  share the same path from the root
+- Add, update and remove records as the managers change them
+- Return the first records, in key order, whose key starts with a prefix
+
+NODE FORMAT:
+Every node is a dictionary from the next character to the child node.
+The records whose key ends at the node are kept in a list under the
+empty string "", which can never be a character key.
+{"c": {"p": {...}}, "m": {"a": {"t": {"h": {"": [course]}}}}}
+
+LAZY BUILDING:
+As with TrigramIndex, reset(items) only remembers the manager's list and
+the trie is built at the first completion.
+
+"""
+
+RECORDS = ""
+
+
+class PrefixTrie:
+    def __init__(self, key):
+        """
+        Initialize an empty PrefixTrie.
+
+        Parameters:
+            key (function): Returns the text a record is completed by
+                (None counts as "")
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self._key = key
+        self.reset([])
+
+    def reset(self, items):
+        """
+        Replace every record with the given list, to be added to the trie
+        at the first completion.
+
+        Parameters:
+            items (list): The manager's list of records
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._unbuilt = items
+        self._root = {}
+        self._keys = {}
+
+    def build(self):
+        """
+        Add the records given to reset() now, if not done yet.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is None:
+            return
+        items = self._unbuilt
+        self._unbuilt = None
+        for item in items:
+            self._add(item)
+
+    def add(self, item):
+        """
+        Add a record.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is None:
+            self._add(item)
+
+    def update(self, item):
+        """
+        Move a record whose key may have changed.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is not None:
+            return
+        if self._keys.get(id(item)) != _lower_key(self._key(item)):
+            self.remove(item)
+            self._add(item)
+
+    def remove(self, item):
+        """
+        Remove a record, and any nodes no other key needs. Unknown records
+        are ignored.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is not None:
+            return
+        key = self._keys.pop(id(item), None)
+        if key is None:
+            return
+
+        path = [self._root]
+        for char in key:
+            path.append(path[-1][char])
+        records = path[-1][RECORDS]
+        for index, record in enumerate(records):
+            if record is item:
+                del records[index]
+                break
+        if len(records) == 0:
+            del path[-1][RECORDS]
+
+        for depth in range(len(key), 0, -1):
+            if len(path[depth]) > 0:
+                break
+            del path[depth - 1][key[depth - 1]]
+
+    def complete(self, prefix, limit=10):
+        """
+        Find records whose key starts with prefix (case-insensitive).
+
+        Only the nodes needed for the first limit records are visited, so
+        the time depends on the prefix length and limit, not on the number
+        of keys.
+
+        Parameters:
+            prefix (str): Start of the key
+            limit (int): Maximum number of records to return
+
+        Returns:
+            list: Matching records, sorted by key; records with the same
+                key in the order they were added
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.build()
+        node = self._root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return []
+
+        matches = []
+        stack = [node]
+        while stack and len(matches) < limit:
+            node = stack.pop()
+            records = node.get(RECORDS)
+            if records:
+                matches.extend(records[:limit - len(matches)])
+            stack.extend(node[char] for char in sorted(node, reverse=True) if char != RECORDS)
+        return matches
+
+    def __len__(self):
+        """
+        Get the number of records in the trie.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.build()
+        return len(self._keys)
+
+    def _add(self, item):
+        """
+        Add one record to the trie.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        key = _lower_key(self._key(item))
+        node = self._root
+        for char in key:
+            child = node.get(char)
+            if child is None:
+                child = node[char] = {}
+            node = child
+        records = node.get(RECORDS)
+        if records is None:
+            node[RECORDS] = [item]
+        else:
+            records.append(item)
+        self._keys[id(item)] = key
+
+
+def _lower_key(key):
+    """
+    Lower-case a key, turning None into "".
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return key.lower() if key else ""
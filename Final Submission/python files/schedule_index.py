@@ -0,0 +1,193 @@
+"""
+ScheduleIndex Class - Course Registration System
+=================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Finds clashing meeting times: whether a new registration would overlap a
+course the student already takes that semester, and every clash already
+in the enrollments.
+
+RESPONSIBILITIES:
+- Keep each student's meetings per semester in start-time order
+- Check a course's meetings against them with binary search
+- Sweep all enrollments for clashes in one sorted pass
+
+HOW THE INDEX WORKS:
+_intervals maps (student_id, semester) to a sorted list of
+(start, end, course_code) tuples (see meeting_times.py for the minute
+format). The meetings that could overlap a new meeting (start, end) are
+the ones starting before end; bisect finds the last of them, and the
+search walks back only while a meeting could still reach start, which
+_longest (never shorter than the longest meeting in the list) bounds.
+With no clashes in the list that is one or two comparisons, so a check
+costs O(log n).
+
+HOW THE SWEEP WORKS:
+find_conflicts() sorts every meeting by (student, semester, start) and
+walks through them once, keeping a heap of the meetings still running,
+ordered by end time. A meeting that starts clashes with every meeting
+still in the heap after the finished ones are popped, so the whole table
+is checked in O(n log n) plus the number of clashes, instead of
+comparing every pair of a student's courses.
+
+"""
+
+import bisect
+import heapq
+
+
+class ScheduleIndex:
+    def __init__(self):
+        """
+        Initialize an empty ScheduleIndex.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self.reset()
+
+    def reset(self, meetings=()):
+        """
+        Replace every meeting, sorting each student's semester once.
+
+        Parameters:
+            meetings (iterable): (student_id, semester, start, end,
+                course_code) tuples, the format find_conflicts() takes
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._intervals = {}
+        self._longest = {}
+        for student_id, semester, start, end, course_code in meetings:
+            key = (student_id, semester)
+            intervals = self._intervals.get(key)
+            if intervals is None:
+                self._intervals[key] = [(start, end, course_code)]
+                self._longest[key] = end - start
+            else:
+                intervals.append((start, end, course_code))
+                if end - start > self._longest[key]:
+                    self._longest[key] = end - start
+        for intervals in self._intervals.values():
+            intervals.sort()
+
+    def add(self, student_id, semester, course_code, slots):
+        """
+        Add a course's meetings to a student's semester.
+
+        Parameters:
+            student_id (int): Student ID
+            semester (str): Semester
+            course_code (str): Upper-case course code
+            slots (tuple): (start, end) minute pairs
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if not slots:
+            return
+        key = (student_id, semester)
+        intervals = self._intervals.setdefault(key, [])
+        longest = self._longest.get(key, 0)
+        for start, end in slots:
+            bisect.insort(intervals, (start, end, course_code))
+            longest = max(longest, end - start)
+        self._longest[key] = longest
+
+    def remove(self, student_id, semester, course_code):
+        """
+        Remove a course's meetings from a student's semester.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        key = (student_id, semester)
+        intervals = self._intervals.get(key)
+        if intervals is None:
+            return
+        intervals[:] = [interval for interval in intervals if interval[2] != course_code]
+        if len(intervals) == 0:
+            del self._intervals[key]
+            del self._longest[key]
+
+    def conflicts(self, student_id, semester, slots, course_code=None):
+        """
+        Find the courses whose meetings overlap the given meetings.
+
+        Parameters:
+            student_id (int): Student ID
+            semester (str): Semester
+            slots (tuple): (start, end) minute pairs to check
+            course_code (str): Course being checked; its own meetings are
+                ignored (optional)
+
+        Returns:
+            list: Codes of the clashing courses, without repeats
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        key = (student_id, semester)
+        intervals = self._intervals.get(key)
+        if not intervals or not slots:
+            return []
+
+        longest = self._longest[key]
+        clashes = []
+        for start, end in slots:
+            # (end,) sorts after every meeting starting before end
+            position = bisect.bisect_left(intervals, (end,)) - 1
+            while position >= 0 and intervals[position][0] + longest > start:
+                other_start, other_end, other_code = intervals[position]
+                if other_end > start and other_code != course_code and other_code not in clashes:
+                    clashes.append(other_code)
+                position -= 1
+        return clashes
+
+    def __len__(self):
+        """
+        Get the number of indexed meetings.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return sum(len(intervals) for intervals in self._intervals.values())
+
+
+def find_conflicts(meetings):
+    """
+    Find every pair of courses a student takes in the same semester whose
+    meetings overlap.
+
+    Parameters:
+        meetings (iterable): (student_id, semester, start, end,
+            course_code) tuples, one per meeting of each enrollment
+
+    Returns:
+        list: Sorted (student_id, semester, course_code, other_code)
+            tuples, with course_code < other_code
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    conflicts = set()
+    running = []
+    group = None
+    for student_id, semester, start, end, course_code in sorted(meetings):
+        if (student_id, semester) != group:
+            group = (student_id, semester)
+            running = []
+        while running and running[0][0] <= start:
+            heapq.heappop(running)
+        for other_end, other_code in running:
+            if other_code != course_code:
+                pair = (course_code, other_code) if course_code < other_code else (other_code, course_code)
+                conflicts.add((student_id, semester) + pair)
+        heapq.heappush(running, (end, course_code))
+    return sorted(conflicts)
@@ -0,0 +1,254 @@
+"""
+TrigramIndex Class - Course Registration System
+================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Finds the records whose text fields contain a search term without
+lower-casing and testing every record on every search.
+
+RESPONSIBILITIES:
+- Split each record's lower-case text fields into trigrams (every run of
+  three characters) and keep, for every trigram, the sorted list of
+  records that contain it (an inverted index)
+- Add, update and remove records as the managers change them
+- Answer "which records contain this term" by verifying only the records
+  in the shortest list among the term's trigrams
+
+HOW A SEARCH WORKS:
+A record can only contain "ander" if it contains each of "and", "nde" and
+"der", so only the records listed under the rarest of those trigrams need
+to be checked with an ordinary substring test (a three-character term is
+its own trigram, so its list needs no checking). Terms shorter than three
+characters have no trigrams; they are checked against every record, but
+with the lower-case text already prepared.
+
+Records are numbered in the order they were added, and an update keeps
+the number, so results come back in the same order as the manager's list.
+
+LAZY BUILDING:
+reset(items) only remembers the manager's list; the index is built at the
+first search, so loading a large file is not slowed down by an index that
+may never be used. Until then add(), update() and remove() do nothing,
+since the manager's list already reflects the change.
+
+"""
+
+from bisect import bisect_left, insort
+
+GRAM_LENGTH = 3
+SEPARATOR = "\n"
+
+
+class TrigramIndex:
+    def __init__(self, fields):
+        """
+        Initialize an empty TrigramIndex.
+
+        Parameters:
+            fields (function): Returns the searchable text fields of a
+                record as a tuple (None counts as "")
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self._fields = fields
+        self.reset([])
+
+    def reset(self, items):
+        """
+        Replace every record with the given list, to be indexed at the
+        first search.
+
+        Parameters:
+            items (list): The manager's list of records, in order
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._unbuilt = items
+        self._postings = {}
+        self._items = []
+        self._texts = []
+        self._positions = {}
+        self._removed = 0
+
+    def build(self):
+        """
+        Index the records given to reset() now, if not done yet.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is None:
+            return
+        items = self._unbuilt
+        self._unbuilt = None
+        for item in items:
+            self._add(item)
+
+    def add(self, item):
+        """
+        Add a record.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is None:
+            self._add(item)
+
+    def update(self, item):
+        """
+        Re-index a record whose fields changed, keeping its place in the
+        result order. Unknown records are added.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is not None:
+            return
+        position = self._positions.get(id(item))
+        if position is None:
+            self._add(item)
+            return
+
+        texts = _lower_texts(self._fields(item))
+        old_grams = _grams(self._texts[position].split(SEPARATOR))
+        new_grams = _grams(texts)
+        for gram in old_grams - new_grams:
+            self._discard(gram, position)
+        for gram in new_grams - old_grams:
+            insort(self._postings.setdefault(gram, []), position)
+        self._texts[position] = SEPARATOR.join(texts)
+
+    def remove(self, item):
+        """
+        Remove a record. Unknown records are ignored.
+
+        When more records have been removed than are left, the index is
+        rebuilt so searches do not keep skipping the gaps.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self._unbuilt is not None:
+            return
+        position = self._positions.pop(id(item), None)
+        if position is None:
+            return
+
+        for gram in _grams(self._texts[position].split(SEPARATOR)):
+            self._discard(gram, position)
+        self._items[position] = None
+        self._texts[position] = None
+        self._removed += 1
+
+        if self._removed > len(self._positions):
+            self.reset([item for item in self._items if item is not None])
+            self.build()
+
+    def search(self, term):
+        """
+        Find the records with a field that contains term (case-insensitive).
+
+        Returns:
+            list: Matching records, in the order they were added
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.build()
+        term = term.lower()
+        items = self._items
+        texts = self._texts
+        if SEPARATOR in term:
+            return []
+
+        if len(term) < GRAM_LENGTH:
+            return [items[position] for position, text in enumerate(texts)
+                    if text is not None and term in text]
+
+        candidates = None
+        for gram in _grams((term,)):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            if candidates is None or len(posting) < len(candidates):
+                candidates = posting
+        if len(term) == GRAM_LENGTH:
+            return [items[position] for position in candidates]
+        return [items[position] for position in candidates if term in texts[position]]
+
+    def __len__(self):
+        """
+        Get the number of records in the index.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self.build()
+        return len(self._positions)
+
+    def _add(self, item):
+        """
+        Index one record after the others.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        texts = _lower_texts(self._fields(item))
+        position = len(self._items)
+        self._items.append(item)
+        self._texts.append(SEPARATOR.join(texts))
+        self._positions[id(item)] = position
+
+        postings = self._postings
+        for gram in _grams(texts):
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = [position]
+            else:
+                posting.append(position)
+
+    def _discard(self, gram, position):
+        """
+        Remove one position from a trigram's sorted list.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        posting = self._postings[gram]
+        index = bisect_left(posting, position)
+        if index < len(posting) and posting[index] == position:
+            del posting[index]
+        if len(posting) == 0:
+            del self._postings[gram]
+
+
+def _lower_texts(texts):
+    """
+    Lower-case the fields of a record, turning None into "".
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return [text.lower() if text else "" for text in texts]
+
+
+def _grams(texts):
+    """
+    Get the set of trigrams of some lower-case fields. Trigrams never span
+    two fields.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    grams = set()
+    for text in texts:
+        for start in range(len(text) - GRAM_LENGTH + 1):
+            grams.add(text[start:start + GRAM_LENGTH])
+    return grams
@@ -0,0 +1,53 @@
+"""
+Semesters - Course Registration System
+=======================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Knows what a semester name such as "Fall2024" means, so the enrollment
+data and the reports agree on which names are valid and on their order.
+
+RESPONSIBILITIES:
+- Check that a semester is a season followed by a four-digit year
+- Sort semesters in time order
+
+ORDER:
+Within a year the seasons run Winter, Spring, Summer, Fall (SEASONS).
+Names that do not end in a year sort after every dated semester.
+
+"""
+
+SEASONS = {"Winter": 0, "Spring": 1, "Summer": 2, "Fall": 3}
+
+
+def semester_sort_key(semester):
+    """
+    Get a key that sorts semesters such as "Winter2024" and "Fall2024" in
+    time order. Names that do not end in a year sort last, by name.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    semester = semester or ""
+    season = semester.rstrip("0123456789")
+    year = semester[len(season):]
+    if year == "":
+        return (1, 0, 0, semester)
+    return (0, int(year), SEASONS.get(season, len(SEASONS)), semester)
+
+
+def is_valid_semester(semester):
+    """
+    Check whether a semester is a season from SEASONS followed by a
+    four-digit year, e.g. "Fall2024", so semester_sort_key() can place it
+    in time.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    season = semester.rstrip("0123456789")
+    year = semester[len(season):]
+    return season in SEASONS and len(year) == 4
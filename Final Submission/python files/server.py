@@ -0,0 +1,574 @@
+"""
+Registration Server - Course Registration System
+=================================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Serves the registration system to many clients at once over a local TCP
+connection, as an alternative to the terminal menus in main.py.
+
+RESPONSIBILITIES:
+- Accept client connections with asyncio streams
+- Read one JSON request per line and answer with one JSON response per line
+- Run register, waitlist, drop, grade, schedule, roster, search and
+  complete on the managers
+- Batch disk writes: changes made while a write is running are saved
+  together by the next write (group commit)
+
+PROTOCOL (JSON lines):
+Request:  {"id": 1, "op": "register", "student_id": 2023047891,
+           "course_code": "CPRG216", "semester": "Fall2024"}
+Response: {"id": 1, "ok": true, "error": null,
+           "message": "Student ... successfully registered in ...", "data": null}
+
+Operations and their fields:
+- register: student_id, course_code, semester
+- waitlist: student_id, course_code, semester (joins a full course's
+  waitlist)
+- drop: student_id, course_code, semester (optional; the active term
+  if missing) (takes a student who is only waiting off the waitlist)
+- grade: student_id, course_code, grade, semester (optional; the active
+  term if missing)
+- schedule: student_id
+- roster: course_code
+- search: kind ("student" or "course"), term, limit (optional),
+  fuzzy (optional; true ranks close names by typos, each result with a
+  "typos" count)
+- complete: kind ("course_code", "course_name" or "last_name"), prefix,
+  limit (optional, 10 by default)
+
+Lines may be up to STREAM_LIMIT bytes long. Every request line is
+answered: a malformed field (e.g. a limit that is not a whole number)
+gives "bad_request", and a request that fails unexpectedly gives
+"server_error".
+
+With durable=True (the default), register, waitlist, drop and grade are
+answered only after the change has been written to disk. If the write
+fails they are answered with the error "flush_failed"; the change stays
+in memory and is written with the next batch.
+
+HOW TO RUN:
+python server.py     (run from the folder with the csv files)
+
+FILE DEPENDENCIES:
+- main.py (RegistrationSystem class)
+- persistence.py (flush policies)
+- storage.py (CsvStorage class)
+- operation_result.py (OperationResult class and error codes)
+
+"""
+
+import asyncio
+import json
+
+from main import RegistrationSystem
+from operation_result import COURSE_NOT_FOUND, INVALID_STUDENT_ID, STUDENT_NOT_FOUND, OperationResult
+from persistence import ON_EXIT, FlushPolicy
+from storage import CsvStorage
+
+HOST = "127.0.0.1"
+PORT = 8216
+FLUSH_INTERVAL = 0.005
+SERVER_COMPACT_LIMIT = 100000
+STREAM_LIMIT = 16 * 1048576
+
+BAD_REQUEST = "bad_request"
+UNKNOWN_OPERATION = "unknown_operation"
+FLUSH_FAILED = "flush_failed"
+SERVER_ERROR = "server_error"
+LIMIT_MESSAGE = "Error: limit must be a whole number, 0 or more"
+FLUSH_FAILED_MESSAGE = "Error: Change was made but could not be saved to disk ({})"
+
+
+class RegistrationServer:
+    def __init__(self, system, host=HOST, port=PORT, flush_interval=FLUSH_INTERVAL, durable=True):
+        """
+        Initialize the RegistrationServer.
+
+        The system's managers should use the ON_EXIT flush policy; the
+        server decides when to write.
+
+        Parameters:
+            system (RegistrationSystem): The loaded registration system
+            host (str): Address to listen on
+            port (int): Port to listen on (0 picks a free port)
+            flush_interval (float): Seconds to collect changes before a write
+            durable (bool): Answer changes only after they are written
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self.system = system
+        self.host = host
+        self.port = port
+        self.flush_interval = flush_interval
+        self.durable = durable
+        self.flush_count = 0
+        self._server = None
+        self._flush_task = None
+        self._flush_waiters = []
+        self._changes_waiting = None
+        self._operations = {
+            "register": self._register,
+            "waitlist": self._waitlist,
+            "drop": self._drop,
+            "grade": self._grade,
+            "schedule": self._schedule,
+            "roster": self._roster,
+            "search": self._search,
+            "complete": self._complete
+        }
+
+    async def start(self):
+        """
+        Start listening for clients and start the flush loop.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._changes_waiting = asyncio.Event()
+        self._server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                  limit=STREAM_LIMIT)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def serve_forever(self):
+        """
+        Start the server and serve clients until cancelled, then save
+        everything.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        await self.start()
+        print(f"Registration server listening on {self.host}:{self.port}")
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """
+        Stop accepting clients, write pending changes and shut the system
+        down.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        failure = None
+        try:
+            await asyncio.to_thread(self.system.shutdown)
+        except Exception as error:
+            failure = FLUSH_FAILED_MESSAGE.format(error)
+            raise
+        finally:
+            for waiter in self._flush_waiters:
+                if not waiter.done():
+                    waiter.set_result(failure)
+            self._flush_waiters = []
+
+    async def handle_client(self, reader, writer):
+        """
+        Serve one client connection.
+
+        Requests are handled as they arrive, without waiting for earlier
+        ones to finish, so a client may send several before reading the
+        responses; the id field tells them apart.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            try:
+                response = await self.handle_request(line)
+            except Exception as error:
+                response = _response(None, False, SERVER_ERROR, f"Error: Request failed ({error})")
+            writer.write((json.dumps(response) + "\n").encode())
+            async with write_lock:
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, line):
+        """
+        Decode one request line, run it and build the response.
+
+        Parameters:
+            line (bytes): One JSON request
+
+        Returns:
+            dict: The response
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return _response(None, False, BAD_REQUEST, "Error: Request is not valid JSON")
+        if not isinstance(request, dict):
+            return _response(None, False, BAD_REQUEST, "Error: Request must be a JSON object")
+
+        request_id = request.get("id")
+        operation = self._operations.get(request.get("op"))
+        if operation is None:
+            return _response(request_id, False, UNKNOWN_OPERATION, f"Error: Unknown operation {request.get('op')}")
+
+        try:
+            result, data, changed = operation(request)
+        except KeyError as error:
+            return _response(request_id, False, BAD_REQUEST, f"Error: Missing field {error.args[0]}")
+        except Exception as error:
+            return _response(request_id, False, SERVER_ERROR, f"Error: Request failed ({error})")
+
+        if changed:
+            failure = await self._wait_for_flush()
+            if failure is not None:
+                return _response(request_id, False, FLUSH_FAILED, failure, data)
+        return _response(request_id, result.success, result.error, result.message, data)
+
+    async def _wait_for_flush(self):
+        """
+        Ask for the changes made so far to be written, and wait for the
+        write if durable.
+
+        Returns:
+            str or None: Error message if the write failed
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._changes_waiting.set()
+        if not self.durable:
+            return None
+        waiter = asyncio.get_running_loop().create_future()
+        self._flush_waiters.append(waiter)
+        return await waiter
+
+    async def _flush_loop(self):
+        """
+        Write changes in batches.
+
+        Waits for a change, collects more for flush_interval seconds, and
+        then writes them all at once in a worker thread, so clients are
+        still served while the disk is busy. Every client waiting when the
+        write started is answered when it ends. If the write fails (e.g.
+        the disk is full), those clients get the error and the loop keeps
+        running; the changes are retried with the next batch.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        while True:
+            await self._changes_waiting.wait()
+            await asyncio.sleep(self.flush_interval)
+            self._changes_waiting.clear()
+            waiters = self._flush_waiters
+            self._flush_waiters = []
+
+            failure = None
+            try:
+                await asyncio.to_thread(self.system.enrollment_manager.flush)
+            except asyncio.CancelledError:
+                # close() answers them once shutdown has saved everything
+                self._flush_waiters[:0] = waiters
+                raise
+            except Exception as error:
+                failure = FLUSH_FAILED_MESSAGE.format(error)
+            else:
+                self.flush_count += 1
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(failure)
+
+    def _register(self, request):
+        """
+        Register a student in a course.
+
+        Returns:
+            tuple: (OperationResult, response data, whether data changed)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        result = self.system.enrollment_manager.register(
+            request["student_id"], request["course_code"], request["semester"])
+        return result, None, result.success
+
+    def _waitlist(self, request):
+        """
+        Put a student on a full course's waitlist.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        result = self.system.enrollment_manager.join_waitlist(
+            request["student_id"], request["course_code"], request["semester"])
+        return result, None, result.success
+
+    def _drop(self, request):
+        """
+        Drop a student from a course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        result = self.system.enrollment_manager.drop(
+            request["student_id"], request["course_code"], request.get("semester"))
+        return result, None, result.success
+
+    def _grade(self, request):
+        """
+        Assign a grade.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        result = self.system.enrollment_manager.set_grade(
+            request["student_id"], request["course_code"], request["grade"], request.get("semester"))
+        return result, None, result.success
+
+    def _schedule(self, request):
+        """
+        List a student's enrollments with course names and credits.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        try:
+            student_id = int(request["student_id"])
+        except (TypeError, ValueError):
+            return _failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+        student = self.system.student_manager.find_student_by_id(student_id)
+        if student is None:
+            return _failed(STUDENT_NOT_FOUND, "Error: Student does not exist in system")
+
+        courses = self.system.course_manager
+        schedule = []
+        for e in self.system.enrollment_manager.get_student_enrollments(student_id):
+            course = courses.find_course_by_code(e["course_code"])
+            schedule.append({
+                "course_code": e["course_code"],
+                "course_name": course.course_name if course else "",
+                "credits": course.credits if course else 0,
+                "semester": e["semester"],
+                "grade": e["grade"]
+            })
+        return _succeeded(f"Schedule for {student.get_full_name()}", schedule)
+
+    def _roster(self, request):
+        """
+        List the students enrolled in a course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        course = self.system.course_manager.find_course_by_code(str(request["course_code"]))
+        if course is None:
+            return _failed(COURSE_NOT_FOUND, "Error: Course does not exist in system")
+
+        students = self.system.student_manager
+        roster = []
+        for e in self.system.enrollment_manager.get_course_enrollments(course.course_code):
+            student = students.find_student_by_id(e["student_id"])
+            roster.append({
+                "student_id": e["student_id"],
+                "name": student.get_full_name() if student else "",
+                "year": student.year if student else None,
+                "grade": e["grade"]
+            })
+        return _succeeded(f"Enrolled: {len(roster)} / {course.capacity}", roster)
+
+    def _search(self, request):
+        """
+        Search students or courses by name.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        term = str(request["term"])
+        try:
+            limit = _read_limit(request, 20 if request.get("fuzzy") else None)
+        except ValueError:
+            return _failed(BAD_REQUEST, LIMIT_MESSAGE)
+        if request.get("fuzzy"):
+            return self._fuzzy_search(request.get("kind", "student"), term, limit)
+        if request.get("kind", "student") == "course":
+            matches = [{"course_code": c.course_code, "course_name": c.course_name,
+                        "instructor": c.instructor, "enrolled": c.enrolled_count,
+                        "capacity": c.capacity}
+                       for c in self.system.course_manager.find_courses_by_name(term)]
+        else:
+            matches = [{"student_id": s.student_id, "name": s.get_full_name(), "email": s.email,
+                        "program": s.program, "year": s.year}
+                       for s in self.system.student_manager.find_students_by_name(term)]
+        if limit is not None:
+            matches = matches[:limit]
+        return _succeeded(f"Matches: {len(matches)}", matches)
+
+    def _fuzzy_search(self, kind, term, limit):
+        """
+        Search students by name, or courses by name and instructor,
+        allowing typos.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if kind == "course":
+            matches = [{"course_code": c.course_code, "course_name": c.course_name,
+                        "instructor": c.instructor, "typos": typos}
+                       for c, typos in self.system.course_manager.fuzzy_find_courses(term, limit)]
+        else:
+            matches = [{"student_id": s.student_id, "name": s.get_full_name(), "typos": typos}
+                       for s, typos in self.system.student_manager.fuzzy_find_students(term, limit)]
+        return _succeeded(f"Matches: {len(matches)}", matches)
+
+    def _complete(self, request):
+        """
+        Complete a partly typed course code, course name or last name.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        prefix = str(request["prefix"])
+        try:
+            limit = _read_limit(request, 10)
+        except ValueError:
+            return _failed(BAD_REQUEST, LIMIT_MESSAGE)
+        kind = request.get("kind", "course_code")
+        courses = self.system.course_manager
+        if kind == "last_name":
+            matches = [{"student_id": s.student_id, "name": s.get_full_name()}
+                       for s in self.system.student_manager.complete_last_name(prefix, limit)]
+        elif kind == "course_name":
+            matches = [{"course_code": c.course_code, "course_name": c.course_name}
+                       for c in courses.complete_course_name(prefix, limit)]
+        else:
+            matches = [{"course_code": c.course_code, "course_name": c.course_name}
+                       for c in courses.complete_course_code(prefix, limit)]
+        return _succeeded(f"Matches: {len(matches)}", matches)
+
+
+def _response(request_id, ok, error, message, data=None):
+    """
+    Build a response dictionary.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    return {"id": request_id, "ok": ok, "error": error, "message": message, "data": data}
+
+
+def _read_limit(request, default):
+    """
+    Get the optional limit field of a request as a whole number.
+
+    Parameters:
+        request (dict): The request
+        default (int): Limit when the field is missing (None for no limit)
+
+    Returns:
+        int: The limit
+
+    Raises:
+        ValueError: If limit is not a whole number of 0 or more
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    limit = request.get("limit")
+    if limit is None:
+        return default
+    if isinstance(limit, bool) or not isinstance(limit, (int, str)):
+        raise ValueError(f"Invalid limit {limit!r}")
+    limit = int(limit)
+    if limit < 0:
+        raise ValueError(f"Invalid limit {limit}")
+    return limit
+
+
+def _succeeded(message, data):
+    """
+    Result of a read-only operation that succeeded.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    return OperationResult.ok(message), data, False
+
+
+def _failed(error, message):
+    """
+    Result of a read-only operation that failed.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    return OperationResult.failed(error, message), None, False
+
+
+def create_server(host=HOST, port=PORT, flush_interval=FLUSH_INTERVAL, durable=True):
+    """
+    Load the registration system from the csv files and wrap it in a
+    RegistrationServer.
+
+    The journal is compacted less often than in the terminal program,
+    since a busy server would otherwise rewrite enrollments.csv every
+    few batches.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    system = RegistrationSystem(flush_policy=FlushPolicy(ON_EXIT),
+                                storage=CsvStorage(compact_limit=SERVER_COMPACT_LIMIT))
+    return RegistrationServer(system, host, port, flush_interval, durable)
+
+
+def main():
+    """
+    Run the server until Ctrl+C is pressed.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    server = create_server()
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    print("Registration server stopped")
+
+
+if __name__ == "__main__":
+    main()
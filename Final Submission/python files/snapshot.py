@@ -0,0 +1,169 @@
+"""
+Snapshot Cache - Course Registration System
+============================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Saves the loaded students, courses, enrollments and waitlist in a
+compact binary file, so the next start-up can skip parsing the csv files.
+
+RESPONSIBILITIES:
+- Save the managers' data to registration.snapshot
+- Load the snapshot only if it matches the current source files
+- Describe the source files by size, modification time and SHA-256 hash
+
+SNAPSHOT FORMAT:
+marshal-encoded dictionary of plain tuples, with the Python version, a
+signature of every source file and the table generations from
+registration.lock (see storage.py). Only the enrollment terms that were
+loaded are saved, with the list of those terms ("semesters", None for
+all), so the next start-up reads the other terms when needed as well.
+The csv files remain the real data; the
+snapshot is only a cache and is ignored whenever it is stale or unreadable.
+It is only used with the csv storage engine (CsvStorage).
+
+FILE DEPENDENCIES:
+- students.csv, courses.csv, enrollments.csv, enrollments.journal,
+  waitlist.csv (sources)
+- registration.snapshot (cache file)
+
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+from persistence import without_garbage_collection
+
+SNAPSHOT_FILE = "registration.snapshot"
+SNAPSHOT_VERSION = 6
+SOURCE_FILES = ("students.csv", "courses.csv", "enrollments.csv", "enrollments.journal",
+                "waitlist.csv")
+
+
+def file_signature(filename):
+    """
+    Describe a source file by size, modification time and hash.
+
+    Returns:
+        tuple or None: (size, mtime_ns, sha256 hex digest), None if the file
+            does not exist
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    try:
+        status = os.stat(filename)
+    except FileNotFoundError:
+        return None
+
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        for block in iter(lambda: file.read(1048576), b""):
+            digest.update(block)
+    return (status.st_size, status.st_mtime_ns, digest.hexdigest())
+
+
+def source_signatures():
+    """
+    Get the signature of every source file.
+
+    Returns:
+        dict: File name -> file_signature()
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    return {filename: file_signature(filename) for filename in SOURCE_FILES}
+
+
+def save_snapshot(student_manager, course_manager, enrollment_manager, generations=None):
+    """
+    Save the managers' data to the snapshot file.
+
+    Only call this when everything in memory has been written to the csv
+    files, otherwise the snapshot would not match its sources.
+
+    Parameters:
+        generations (dict): Table generations the data was loaded at
+
+    Author: [Humza Khan]
+    Date: [Dec 18]
+    """
+    semesters = enrollment_manager.loaded_semesters()
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "python": tuple(sys.version_info[:2]),
+        "sources": source_signatures(),
+        "generations": dict(generations or {}),
+        "students": student_manager.student_rows(),
+        "courses": course_manager.course_rows(),
+        "enrollments": list(enrollment_manager.enrollment_rows()),
+        "semesters": semesters if semesters is None else sorted(semesters),
+        "waitlist": enrollment_manager.waitlist_rows()
+    }
+
+    temp_filename = SNAPSHOT_FILE + ".tmp"
+    with open(temp_filename, "wb") as file:
+        file.write(marshal.dumps(data))
+    os.replace(temp_filename, SNAPSHOT_FILE)
+
+
+@without_garbage_collection
+def load_snapshot():
+    """
+    Load the snapshot if it is still fresh.
+
+    Size and modification time of the sources are compared first; the files
+    are only hashed when those match. The file is read in one piece because
+    marshal.load() on a file object reads it in small chunks.
+
+    Returns:
+        dict or None: Snapshot data, None if missing, stale or unreadable
+
+    Author: [Ali Alimarah]
+    Date: [Dec 18]
+    """
+    try:
+        with open(SNAPSHOT_FILE, "rb") as file:
+            data = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return None
+    if data.get("python") != tuple(sys.version_info[:2]):
+        return None
+
+    saved = data["sources"]
+    for filename in SOURCE_FILES:
+        signature = saved.get(filename)
+        try:
+            status = os.stat(filename)
+        except FileNotFoundError:
+            if signature is not None:
+                return None
+            continue
+        if signature is None or signature[:2] != (status.st_size, status.st_mtime_ns):
+            return None
+
+    if source_signatures() != saved:
+        return None
+    return data
+
+
+def load_managers_from_snapshot(student_manager, course_manager, enrollment_manager, data):
+    """
+    Fill empty managers from snapshot data returned by load_snapshot().
+
+    Author: [Ali Alimarah]
+    Date: [Dec 18]
+    """
+    student_manager.load_students(data["students"])
+    course_manager.load_courses(data["courses"])
+    enrollment_manager.load_enrollments(data["enrollments"], data["semesters"])
+    enrollment_manager.load_waitlist(data["waitlist"])
@@ -0,0 +1,1674 @@
+"""
+Storage Engines - Course Registration System
+=============================================
+
+TEAM MEMBER ASSIGNED TO THIS FILE:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Keeps the managers independent of where their data is stored. Each manager
+loads rows from a storage engine, reports every single-row change to it,
+and asks it to commit when the flush policy says so.
+
+STORAGE ENGINES:
+- CsvStorage: the original csv files, plus the enrollment journal
+- SqliteStorage: one SQLite database (stdlib sqlite3) in WAL mode, with
+  indexed tables; every change is a single-row statement
+
+Both engines provide the same methods:
+- load_students() / load_courses() / load_enrollments(semesters): rows as
+  tuples
+- enrollment_semesters(), load_more_enrollments(semesters): see TERMS
+- save_students(rows) / save_courses(rows) / save_enrollments(rows):
+  replace everything
+- insert_student(row), update_student(row), delete_student(student_id)
+- insert_course(row), update_course(row), delete_course(course_code)
+- insert_enrollment(row), delete_enrollment(student_id, course_code, semester),
+  update_grade(student_id, course_code, semester, grade)
+- load_waitlist(), save_waitlist(rows), insert_waitlist(row),
+  delete_waitlist(student_id, course_code)
+- commit_students(get_rows) / commit_courses(get_rows) /
+  commit_enrollments(get_rows, semesters) / commit_waitlist(get_rows):
+  make reported changes durable. get_rows is a function returning all
+  current rows, for engines that rewrite files.
+- prepare_enrollment_commit(get_rows, semesters) /
+  prepare_waitlist_commit(get_rows): take the reported changes (and the
+  rows, if needed) and return a function that writes them, so the caller
+  can release its lock during the disk write
+- changed_tables(): tables another program has changed since they were
+  loaded (see SEVERAL PROGRAMS below)
+- compact_enrollments(rows, semesters), close()
+
+ROW FORMATS:
+student:    (student_id, first_name, last_name, email, program, year)
+course:     (course_code, course_name, instructor, credits, capacity,
+             meeting_times)
+enrollment: (student_id, course_code, semester, grade)
+waitlist:   (student_id, course_code, semester, request_number)
+
+The waitlist (see waitlist.py) is kept in waitlist.csv next to
+enrollments.csv, rewritten at commit like students.csv and courses.csv.
+
+JOURNAL FILE FORMAT (enrollments.journal, CsvStorage only):
+Each enrollment change is appended as one line instead of rewriting
+enrollments.csv.
++,2023047891,CPRG216,Fall2024,      (student registered)
+-,2023047891,CPRG216,Fall2024       (student dropped)
+G,2023047891,CPRG216,Fall2024,A     (grade assigned)
+The journal is replayed on top of enrollments.csv when the file is read,
+and folded back into enrollments.csv by compact_enrollments().
+
+TERMS:
+Enrollments can be read a term (semester) at a time, so the
+EnrollmentManager loads the current term at start-up and older terms
+only when they are needed. enrollment_semesters() lists the terms
+without reading their rows; load_enrollments(semesters) and
+load_more_enrollments(semesters) read only the given terms. A manager
+that has not loaded every term passes the terms it holds to
+commit_enrollments() and compact_enrollments(); the other terms are
+kept as they are.
+
+CsvStorage writes enrollments.csv grouped by term, one segment per term,
+and records in enrollments.index where each segment is:
+21480 1734712345123456789      (size and mtime_ns of enrollments.csv)
+37 5133 Fall2023               (offset and length in bytes, semester)
+5170 5925 Winter2024
+Reading a term seeks straight to its segment, and rewriting copies the
+lines of terms that are not loaded without parsing them. If the index is
+missing or does not match enrollments.csv (e.g. the file was edited by
+hand), the file is scanned instead, and the next rewrite groups it again.
+SqliteStorage selects a term through an index on the semester column.
+
+SEVERAL PROGRAMS (CsvStorage):
+Several copies of the program (e.g. one per registrar desk) may use the
+same folder. Every read holds a shared lock and every write an exclusive
+lock on registration.lock (fcntl.flock; on systems without fcntl the files
+are not locked). The lock file also holds a generation number per table,
+one line each:
+students 12
+courses 3
+enrollments 187
+waitlist 9
+A write adds one to its table's generation. If the generation on disk is
+not the one this engine last loaded or wrote, another program has changed
+the table in the meantime, and instead of overwriting its changes the
+commit merges: the file is read again and only this program's own changes
+(remembered since the last commit) are applied to it. changed_tables()
+then reports the table until it is loaded again, so the managers can
+reload it (RegistrationSystem.refresh()).
+
+"""
+
+import contextlib
+import functools
+import os
+import sqlite3
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from persistence import atomic_write_lines, atomic_write_segments
+
+STUDENTS_FILE = "students.csv"
+COURSES_FILE = "courses.csv"
+ENROLLMENTS_FILE = "enrollments.csv"
+WAITLIST_FILE = "waitlist.csv"
+JOURNAL_FILE = "enrollments.journal"
+INDEX_FILE = "enrollments.index"
+JOURNAL_COMPACT_LIMIT = 1000
+LOCK_FILE = "registration.lock"
+DATABASE_FILE = "registration.db"
+
+TABLES = ("students", "courses", "enrollments", "waitlist")
+
+STUDENTS_HEADER = "student_id,first_name,last_name,email,program,year"
+COURSES_HEADER = "course_code,course_name,instructor,credits,capacity,meeting_times"
+ENROLLMENTS_HEADER = "student_id,course_code,semester,grade"
+WAITLIST_HEADER = "student_id,course_code,semester,request_number"
+
+
+class CsvStorage:
+    def __init__(self, use_journal=True, compact_limit=JOURNAL_COMPACT_LIMIT):
+        """
+        Initialize the csv storage engine.
+
+        Parameters:
+            use_journal (bool): Append enrollment changes to
+                enrollments.journal instead of rewriting enrollments.csv
+            compact_limit (int): Journal records after which the journal
+                is folded back into enrollments.csv
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        Version: 1.1
+        """
+        self.use_journal = use_journal
+        self.compact_limit = compact_limit
+        self.generations = {}
+        self._pending_rows = {"students": {}, "courses": {}, "waitlist": {}}
+        self._pending_journal = []
+        self._journal_length = None
+
+    # ------------------------------------------------------------------
+    # Locking and generations
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _locked(self, exclusive=False):
+        """
+        Hold the lock on registration.lock and read the generations.
+
+        With exclusive=True the (possibly changed) generations are written
+        back before the lock is released. They are not synced to disk:
+        after a crash every program loads its data again anyway.
+
+        Yields:
+            dict: Table name -> generation on disk
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with open(LOCK_FILE, "a+") as file:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            file.seek(0)
+            generations = dict.fromkeys(TABLES, 0)
+            for line in file:
+                parts = line.split()
+                if len(parts) == 2 and parts[0] in generations and parts[1].isdigit():
+                    generations[parts[0]] = int(parts[1])
+
+            yield generations
+
+            if exclusive:
+                file.seek(0)
+                file.truncate()
+                file.write("".join(f"{table} {generations[table]}\n" for table in TABLES))
+
+    def _is_stale(self, table, generations):
+        """
+        Check whether another program has written a table since this
+        engine last loaded or wrote it.
+
+        A table that was never loaded is not stale; its rows are simply
+        written.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self.generations.get(table, generations[table]) != generations[table]
+
+    def _committed(self, table, generations, stale, changed=True, forget=True):
+        """
+        Record a write of a table and forget the changes it contained.
+
+        The generation seen by this engine only moves forward if the
+        table was not stale; otherwise changed_tables() keeps reporting it
+        until it is loaded again. A prepared commit already took its
+        changes (forget=False), and the ones queued since stay queued.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if changed:
+            generations[table] += 1
+        if not stale:
+            self.generations[table] = generations[table]
+        if not forget:
+            return
+        if table == "enrollments":
+            self._pending_journal = []
+        else:
+            self._pending_rows[table] = {}
+
+    def _loaded(self, table, generations):
+        """
+        Record that a table was loaded; earlier unsaved changes no longer
+        apply.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.generations[table] = generations[table]
+        if table == "enrollments":
+            self._pending_journal = []
+        else:
+            self._pending_rows[table] = {}
+
+    def changed_tables(self):
+        """
+        Get the tables another program has changed since this engine last
+        loaded them.
+
+        Returns:
+            set: Table names ("students", "courses", "enrollments",
+                "waitlist")
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._locked() as generations:
+            return {table for table in TABLES
+                    if table in self.generations and generations[table] != self.generations[table]}
+
+    # ------------------------------------------------------------------
+    # Students
+    # ------------------------------------------------------------------
+
+    def load_students(self):
+        """
+        Read students.csv.
+
+        Returns:
+            list: Student rows (empty if the file does not exist)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        with self._locked() as generations:
+            rows = self._read_students()
+            self._loaded("students", generations)
+        return rows
+
+    def _read_students(self):
+        """
+        Read students.csv without locking.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        rows = []
+        try:
+            with open(STUDENTS_FILE, "r") as file:
+                header = file.readline()
+                for line in file:
+                    line = line.strip()
+                    if line == "":
+                        continue
+
+                    parts = line.split(",")
+                    if len(parts) != 6:
+                        continue
+
+                    rows.append((int(parts[0]), parts[1], parts[2], parts[3], parts[4], int(parts[5])))
+        except FileNotFoundError:
+            return []
+        return rows
+
+    def save_students(self, rows):
+        """
+        Replace students.csv with the given rows, whatever is in it.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        with self._locked(exclusive=True) as generations:
+            self._write_students(rows)
+            self._committed("students", generations, stale=False)
+
+    def _write_students(self, rows):
+        """
+        Replace students.csv without locking.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        atomic_write_lines(STUDENTS_FILE, STUDENTS_HEADER,
+                           (f"{r[0]},{r[1]},{r[2]},{r[3]},{r[4]},{r[5]}" for r in rows))
+
+    def insert_student(self, row):
+        """
+        Remember the new student; students.csv is rewritten at commit.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._pending_rows["students"][row[0]] = row
+
+    def update_student(self, row):
+        """
+        Remember the changed student; students.csv is rewritten at commit.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._pending_rows["students"][row[0]] = row
+
+    def delete_student(self, student_id):
+        """
+        Remember the removed student; students.csv is rewritten at commit.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._pending_rows["students"][student_id] = None
+
+    def commit_students(self, get_rows):
+        """
+        Rewrite students.csv with the current students, or merge this
+        program's changes into it if another program has changed it.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        with self._locked(exclusive=True) as generations:
+            stale = self._is_stale("students", generations)
+            if stale:
+                rows = _merge_rows(self._read_students(), self._pending_rows["students"])
+            else:
+                rows = get_rows()
+            self._write_students(rows)
+            self._committed("students", generations, stale)
+
+    # ------------------------------------------------------------------
+    # Courses
+    # ------------------------------------------------------------------
+
+    def load_courses(self):
+        """
+        Read courses.csv.
+
+        Returns:
+            list: Course rows (empty if the file does not exist)
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._locked() as generations:
+            rows = self._read_courses()
+            self._loaded("courses", generations)
+        return rows
+
+    def _read_courses(self):
+        """
+        Read courses.csv without locking. Files written before courses had
+        meeting times have no meeting_times column; those courses get "".
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        rows = []
+        try:
+            with open(COURSES_FILE, "r") as file:
+                header = file.readline()
+                for line in file:
+                    line = line.strip()
+                    if line == "":
+                        continue
+
+                    parts = line.split(",")
+                    if len(parts) == 5:
+                        parts.append("")
+                    elif len(parts) != 6:
+                        continue
+
+                    rows.append((parts[0], parts[1], parts[2], int(parts[3]), int(parts[4]), parts[5].strip()))
+        except FileNotFoundError:
+            return []
+        return rows
+
+    def save_courses(self, rows):
+        """
+        Replace courses.csv with the given rows, whatever is in it.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._locked(exclusive=True) as generations:
+            self._write_courses(rows)
+            self._committed("courses", generations, stale=False)
+
+    def _write_courses(self, rows):
+        """
+        Replace courses.csv without locking.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        atomic_write_lines(COURSES_FILE, COURSES_HEADER,
+                           (f"{r[0]},{r[1]},{r[2]},{r[3]},{r[4]},{r[5]}" for r in rows))
+
+    def insert_course(self, row):
+        """
+        Remember the new course; courses.csv is rewritten at commit.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self._pending_rows["courses"][row[0]] = row
+
+    def update_course(self, row):
+        """
+        Remember the changed course; courses.csv is rewritten at commit.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self._pending_rows["courses"][row[0]] = row
+
+    def delete_course(self, course_code):
+        """
+        Remember the removed course; courses.csv is rewritten at commit.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self._pending_rows["courses"][course_code] = None
+
+    def commit_courses(self, get_rows):
+        """
+        Rewrite courses.csv with the current courses, or merge this
+        program's changes into it if another program has changed it.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._locked(exclusive=True) as generations:
+            stale = self._is_stale("courses", generations)
+            if stale:
+                rows = _merge_rows(self._read_courses(), self._pending_rows["courses"])
+            else:
+                rows = get_rows()
+            self._write_courses(rows)
+            self._committed("courses", generations, stale)
+
+    # ------------------------------------------------------------------
+    # Enrollments
+    # ------------------------------------------------------------------
+
+    @property
+    def journal_length(self):
+        """
+        Get the number of records in enrollments.journal.
+
+        Counted from the file the first time it is needed (e.g. after a
+        snapshot load, when the journal was never replayed).
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        if self._journal_length is None:
+            try:
+                with open(JOURNAL_FILE, "rb") as file:
+                    self._journal_length = file.read().count(b"\n")
+            except FileNotFoundError:
+                self._journal_length = 0
+        return self._journal_length
+
+    def enrollment_semesters(self):
+        """
+        Get the semesters that have enrollments, without reading their rows.
+
+        The semesters come from enrollments.index (enrollments.csv is
+        scanned if the index is missing or stale), plus any semester that
+        so far only has records in the journal.
+
+        Returns:
+            list: Semesters, in file order
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._locked():
+            index = self._read_index()
+            if index is not None:
+                semesters = list(index)
+            else:
+                semesters = list(dict.fromkeys(row[2] for row in self._read_enrollments_csv()))
+
+            journal = self._read_journal_lines()
+            new_semesters = _journal_semesters(journal) - set(semesters)
+            if new_semesters:
+                rows, count = _apply_journal([], journal, new_semesters)
+                semesters.extend(dict.fromkeys(row[2] for row in rows))
+        return semesters
+
+    def load_enrollments(self, semesters=None):
+        """
+        Read enrollments.csv and replay enrollments.journal on top of it.
+
+        Without a journal the rows are streamed straight from the file.
+        The lock is held until the last row has been read.
+
+        Parameters:
+            semesters (iterable): Only read these semesters (all if None)
+
+        Yields:
+            tuple: Enrollment rows
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._locked() as generations:
+            self._loaded("enrollments", generations)
+            yield from self._read_enrollments(semesters)
+
+    def load_more_enrollments(self, semesters):
+        """
+        Read more semesters after load_enrollments().
+
+        Unlike load_enrollments() this does not count as loading the
+        table: queued changes are kept, and a change by another program
+        is still reported by changed_tables().
+
+        Returns:
+            list: Enrollment rows of the given semesters
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._locked():
+            return list(self._read_enrollments(semesters))
+
+    def _read_enrollments(self, semesters=None):
+        """
+        Read enrollments.csv and the journal without locking.
+
+        Returns:
+            iterable: Enrollment rows
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        if semesters is not None:
+            semesters = set(semesters)
+        if not os.path.exists(JOURNAL_FILE):
+            self._journal_length = 0
+            return self._read_enrollments_csv(semesters)
+        return self._replay_journal(self._read_enrollments_csv(semesters), semesters)
+
+    def _read_enrollments_csv(self, semesters=None):
+        """
+        Generate the rows of enrollments.csv.
+
+        With a valid enrollments.index only the segments of the wanted
+        semesters are read; otherwise the whole file is scanned.
+
+        Parameters:
+            semesters (set): Only generate these semesters (all if None)
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        index = self._read_index() if semesters is not None else None
+        if index is not None:
+            positions = sorted(index[semester] for semester in semesters if semester in index)
+            with open(ENROLLMENTS_FILE, "rb") as file:
+                for offset, length in positions:
+                    file.seek(offset)
+                    yield from _parse_enrollment_lines(file.read(length).decode().splitlines())
+            return
+
+        try:
+            with open(ENROLLMENTS_FILE, "r") as file:
+                header = file.readline()
+                yield from _parse_enrollment_lines(file, semesters)
+        except FileNotFoundError:
+            return
+
+    def _read_index(self):
+        """
+        Read enrollments.index without locking.
+
+        Returns:
+            dict or None: Semester -> (offset, length) of its segment, in
+                file order; None if the index is missing or does not
+                describe the current enrollments.csv
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        try:
+            with open(INDEX_FILE, "r") as file:
+                lines = file.read().splitlines()
+            status = os.stat(ENROLLMENTS_FILE)
+        except FileNotFoundError:
+            return None
+
+        if len(lines) == 0 or lines[0] != f"{status.st_size} {status.st_mtime_ns}":
+            return None
+        index = {}
+        for line in lines[1:]:
+            offset, length, semester = line.split(" ", 2)
+            index[semester] = (int(offset), int(length))
+        return index
+
+    def _replay_journal(self, rows, semesters=None):
+        """
+        Apply the changes in enrollments.journal to the csv rows.
+
+        Parameters:
+            rows (iterable): Enrollment rows
+            semesters (set): Semesters the rows cover (all if None)
+
+        Returns:
+            list: Enrollment rows with the journal applied
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with open(JOURNAL_FILE, "r") as file:
+            rows, self._journal_length = _apply_journal(rows, file, semesters)
+        return rows
+
+    def _read_journal_lines(self):
+        """
+        Read the lines of enrollments.journal without locking.
+
+        Returns:
+            list: Journal lines (empty if there is no journal)
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        try:
+            with open(JOURNAL_FILE, "r") as file:
+                return file.readlines()
+        except FileNotFoundError:
+            return []
+
+    def _merged_enrollments(self, semesters=None, records=None):
+        """
+        Read the enrollments on disk and apply this program's queued
+        records to them.
+
+        Parameters:
+            semesters (iterable): Only read these semesters (all if None)
+            records (list): Journal lines to apply (the queued ones if None)
+
+        Returns:
+            list: Enrollment rows
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        if records is None:
+            records = self._pending_journal
+        rows, count = _apply_journal(self._read_enrollments(semesters), records)
+        return rows
+
+    def save_enrollments(self, rows):
+        """
+        Replace enrollments.csv with the given rows, whatever is in it.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._locked(exclusive=True) as generations:
+            self._write_enrollments(rows)
+            self._committed("enrollments", generations, stale=False)
+
+    def _write_enrollments(self, rows, semesters=None, journal=()):
+        """
+        Replace enrollments.csv and enrollments.index without locking.
+
+        The rows are written grouped by semester. Semesters that are not
+        loaded keep their lines from the old file, with any journal
+        records for them applied.
+
+        Parameters:
+            rows (iterable): Enrollment rows of the loaded semesters
+            semesters (iterable): The loaded semesters (all if None)
+            journal (list): Journal lines to apply to the other semesters
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        segments = self._kept_segments(set(semesters), journal) if semesters is not None else {}
+        for r in rows:
+            lines = segments.get(r[2])
+            if lines is None:
+                lines = segments[r[2]] = []
+            lines.append(f"{r[0]},{r[1]},{r[2]},{r[3]}")
+
+        positions = atomic_write_segments(ENROLLMENTS_FILE, ENROLLMENTS_HEADER, segments.items())
+        status = os.stat(ENROLLMENTS_FILE)
+        atomic_write_lines(INDEX_FILE, f"{status.st_size} {status.st_mtime_ns}",
+                           (f"{offset} {length} {semester}" for semester, offset, length in positions))
+
+    def _kept_segments(self, semesters, journal):
+        """
+        Read the lines of every semester in enrollments.csv that is not
+        loaded, so that a rewrite keeps them, without locking.
+
+        Only semesters with journal records are parsed; the others are
+        copied line by line.
+
+        Parameters:
+            semesters (set): The loaded semesters, given empty lists
+            journal (list): Journal lines to apply to the other semesters
+
+        Returns:
+            dict: Semester -> lines without newlines, in file order
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        segments = {}
+        index = self._read_index()
+        if index is not None:
+            with open(ENROLLMENTS_FILE, "rb") as file:
+                for semester, (offset, length) in index.items():
+                    if semester in semesters:
+                        segments[semester] = []
+                    else:
+                        file.seek(offset)
+                        segments[semester] = file.read(length).decode().splitlines()
+        else:
+            try:
+                with open(ENROLLMENTS_FILE, "r") as file:
+                    header = file.readline()
+                    for line in file:
+                        parts = line.split(",")
+                        if len(parts) < 4:
+                            continue
+                        lines = segments.setdefault(parts[2].strip(), [])
+                        if parts[2].strip() not in semesters:
+                            lines.append(line.strip())
+            except FileNotFoundError:
+                pass
+
+        for semester in _journal_semesters(journal) - semesters:
+            rows, count = _apply_journal(_parse_enrollment_lines(segments.get(semester, [])),
+                                         journal, {semester})
+            segments[semester] = [f"{r[0]},{r[1]},{r[2]},{r[3]}" for r in rows]
+        return segments
+
+    def insert_enrollment(self, row):
+        """
+        Queue a "+" journal record.
+
+        Records are queued even without the journal, so that a commit can
+        merge them if another program has changed enrollments.csv.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self._pending_journal.append(f"+,{row[0]},{row[1]},{row[2]},{row[3]}\n")
+
+    def delete_enrollment(self, student_id, course_code, semester):
+        """
+        Queue a "-" journal record.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self._pending_journal.append(f"-,{student_id},{course_code},{semester}\n")
+
+    def update_grade(self, student_id, course_code, semester, grade):
+        """
+        Queue a "G" journal record.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self._pending_journal.append(f"G,{student_id},{course_code},{semester},{grade}\n")
+
+    def commit_enrollments(self, get_rows, semesters=None):
+        """
+        Make queued enrollment changes durable.
+
+        In journal mode the queued records are appended with a single write
+        and sync. Records appended by other programs stay valid, since
+        replaying skips changes that no longer apply. Once the journal
+        would reach compact_limit records (e.g. after a bulk import) it is
+        compacted instead, so the records are written only once. Without
+        the journal enrollments.csv is rewritten, merging the queued records
+        into it if another program has changed it.
+
+        Parameters:
+            get_rows (function): Returns the rows of the loaded semesters
+            semesters (iterable): The loaded semesters (all if None); the
+                others are kept as they are on disk
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        self.prepare_enrollment_commit(get_rows, semesters)()
+
+    def prepare_enrollment_commit(self, get_rows, semesters=None):
+        """
+        Take the queued enrollment records, plus a copy of the rows if the
+        commit rewrites enrollments.csv, and return the function that
+        writes them (see commit_enrollments()).
+
+        Only this step needs the caller's lock. The returned function does
+        the file I/O, so it can run after the lock is released; records
+        queued in the meantime are left for the next commit. If the write
+        fails, its records are queued again.
+
+        Parameters:
+            get_rows (function): Returns the rows of the loaded semesters
+            semesters (iterable): The loaded semesters (all if None)
+
+        Returns:
+            function: Writes the changes
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        records = self._pending_journal
+        if self.use_journal and len(records) == 0:
+            return _nothing_to_write
+        self._pending_journal = []
+
+        rows = None
+        if not self.use_journal or self.journal_length + len(records) >= self.compact_limit:
+            rows = list(get_rows())
+        return functools.partial(self._write_enrollment_changes, records, rows, semesters)
+
+    def _write_enrollment_changes(self, records, rows, semesters):
+        """
+        Append taken journal records, or rewrite enrollments.csv from the
+        rows if they were copied; see prepare_enrollment_commit().
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        try:
+            with self._locked(exclusive=True) as generations:
+                stale = self._is_stale("enrollments", generations)
+                if stale:
+                    self._journal_length = None
+                    if rows is not None:
+                        rows = self._merged_enrollments(semesters, records)
+
+                if not self.use_journal:
+                    self._write_enrollments(rows, semesters)
+                elif rows is not None:
+                    self._fold_journal(rows, semesters)
+                else:
+                    with open(JOURNAL_FILE, "a") as file:
+                        file.write("".join(records))
+                        file.flush()
+                        os.fsync(file.fileno())
+                    self._journal_length = self.journal_length + len(records)
+
+                self._committed("enrollments", generations, stale, forget=False)
+        except BaseException:
+            self._pending_journal[:0] = records
+            raise
+
+    def compact_enrollments(self, rows, semesters=None):
+        """
+        Fold the journal back into enrollments.csv.
+
+        Rewrites enrollments.csv from the given rows and then deletes the
+        journal. Queued records are dropped, since the rows already
+        contain them. If another program has changed the enrollments, the
+        rows are read from disk instead and the queued records applied.
+
+        Parameters:
+            rows (iterable): Rows of the loaded semesters
+            semesters (iterable): The loaded semesters (all if None); the
+                others are kept as they are on disk, plus their journal
+                records
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        with self._locked(exclusive=True) as generations:
+            stale = self._is_stale("enrollments", generations)
+            changed = len(self._pending_journal) > 0
+            self._fold_journal(self._merged_enrollments(semesters) if stale else rows, semesters)
+            self._committed("enrollments", generations, stale, changed)
+
+    def _fold_journal(self, rows, semesters=None):
+        """
+        Rewrite enrollments.csv from the rows and delete the journal,
+        without locking.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+        journal = self._read_journal_lines() if semesters is not None else ()
+        self._write_enrollments(rows, semesters, journal)
+        try:
+            os.remove(JOURNAL_FILE)
+        except FileNotFoundError:
+            pass
+        self._journal_length = 0
+
+    # ------------------------------------------------------------------
+    # Waitlist
+    # ------------------------------------------------------------------
+
+    def load_waitlist(self):
+        """
+        Read waitlist.csv.
+
+        Returns:
+            list: Waitlist rows (empty if the file does not exist)
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._locked() as generations:
+            rows = self._read_waitlist()
+            self._loaded("waitlist", generations)
+        return rows
+
+    def _read_waitlist(self):
+        """
+        Read waitlist.csv without locking.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        rows = []
+        try:
+            with open(WAITLIST_FILE, "r") as file:
+                header = file.readline()
+                for line in file:
+                    line = line.strip()
+                    if line == "":
+                        continue
+
+                    parts = line.split(",")
+                    if len(parts) != 4:
+                        continue
+
+                    rows.append((int(parts[0]), parts[1].strip().upper(), parts[2].strip(), int(parts[3])))
+        except FileNotFoundError:
+            return []
+        return rows
+
+    def save_waitlist(self, rows):
+        """
+        Replace waitlist.csv with the given rows, whatever is in it.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        with self._locked(exclusive=True) as generations:
+            self._write_waitlist(rows)
+            self._committed("waitlist", generations, stale=False)
+
+    def _write_waitlist(self, rows):
+        """
+        Replace waitlist.csv without locking.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        atomic_write_lines(WAITLIST_FILE, WAITLIST_HEADER,
+                           (f"{r[0]},{r[1]},{r[2]},{r[3]}" for r in rows))
+
+    def insert_waitlist(self, row):
+        """
+        Remember the new waitlist entry; waitlist.csv is rewritten at commit.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._pending_rows["waitlist"][(row[0], row[1])] = row
+
+    def delete_waitlist(self, student_id, course_code):
+        """
+        Remember the removed waitlist entry; waitlist.csv is rewritten at
+        commit.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._pending_rows["waitlist"][(student_id, course_code)] = None
+
+    def commit_waitlist(self, get_rows):
+        """
+        Rewrite waitlist.csv with the current waitlist, or merge this
+        program's changes into it if another program has changed it.
+        Nothing is written if the waitlist has not changed.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.prepare_waitlist_commit(get_rows)()
+
+    def prepare_waitlist_commit(self, get_rows):
+        """
+        Take the remembered waitlist changes and a copy of the waitlist,
+        and return the function that writes them, like
+        prepare_enrollment_commit().
+
+        Returns:
+            function: Writes the changes
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        changes = self._pending_rows["waitlist"]
+        if len(changes) == 0:
+            return _nothing_to_write
+        self._pending_rows["waitlist"] = {}
+        return functools.partial(self._write_waitlist_changes, changes, list(get_rows()))
+
+    def _write_waitlist_changes(self, changes, rows):
+        """
+        Rewrite waitlist.csv for a prepared commit; see
+        prepare_waitlist_commit(). Changes made since are newer, so they
+        win over these if the write fails and they are remembered again.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        try:
+            with self._locked(exclusive=True) as generations:
+                stale = self._is_stale("waitlist", generations)
+                if stale:
+                    rows = _merge_rows(self._read_waitlist(), changes, _waitlist_key)
+                self._write_waitlist(rows)
+                self._committed("waitlist", generations, stale, forget=False)
+        except BaseException:
+            pending = self._pending_rows["waitlist"]
+            for key, row in changes.items():
+                pending.setdefault(key, row)
+            raise
+
+    def close(self):
+        """
+        Nothing to close; files are opened per operation.
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
+
+
+class SqliteStorage:
+    def __init__(self, filename=DATABASE_FILE):
+        """
+        Open (and if needed create) the SQLite database.
+
+        The database runs in WAL mode, so a commit appends to the write-ahead
+        log instead of rewriting the database file. The connection may be
+        used from any thread; EnrollmentManager makes its calls while
+        holding its data lock, so they never overlap. SQLite does its own
+        locking between programs, and every change is a single-row
+        statement, so programs never overwrite each other's changes.
+
+        Parameters:
+            filename (str): Database file
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        Version: 1.1
+        """
+        self.generations = {}
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS students (
+                student_id INTEGER NOT NULL UNIQUE,
+                first_name TEXT, last_name TEXT, email TEXT, program TEXT,
+                year INTEGER);
+            CREATE TABLE IF NOT EXISTS courses (
+                course_code TEXT NOT NULL UNIQUE,
+                course_name TEXT, instructor TEXT, credits INTEGER,
+                capacity INTEGER, meeting_times TEXT NOT NULL DEFAULT '');
+            CREATE TABLE IF NOT EXISTS enrollments (
+                student_id INTEGER NOT NULL,
+                course_code TEXT NOT NULL,
+                semester TEXT NOT NULL,
+                grade TEXT NOT NULL DEFAULT '');
+            CREATE INDEX IF NOT EXISTS enrollments_by_key
+                ON enrollments (student_id, course_code, semester);
+            CREATE INDEX IF NOT EXISTS enrollments_by_course
+                ON enrollments (course_code);
+            CREATE INDEX IF NOT EXISTS enrollments_by_semester
+                ON enrollments (semester);
+            CREATE TABLE IF NOT EXISTS waitlist (
+                student_id INTEGER NOT NULL,
+                course_code TEXT NOT NULL,
+                semester TEXT NOT NULL,
+                request_number INTEGER NOT NULL,
+                UNIQUE (student_id, course_code));
+        """)
+        # Databases created before courses had meeting times
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(courses)")]
+        if "meeting_times" not in columns:
+            self._connection.execute("ALTER TABLE courses ADD COLUMN meeting_times TEXT NOT NULL DEFAULT ''")
+        self._connection.commit()
+
+    def _data_version(self):
+        """
+        Get SQLite's data version, which changes whenever another
+        connection commits.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def changed_tables(self):
+        """
+        Get the tables that may have been changed by another program since
+        they were loaded. SQLite only tells whether anything changed, so
+        that is reported for every loaded table.
+
+        Returns:
+            set: Table names ("students", "courses", "enrollments",
+                "waitlist")
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        version = self._data_version()
+        return {table for table, seen in self.generations.items() if seen != version}
+
+    # ------------------------------------------------------------------
+    # Students
+    # ------------------------------------------------------------------
+
+    def load_students(self):
+        """
+        Read all students in the order they were added.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self.generations["students"] = self._data_version()
+        return self._connection.execute(
+            "SELECT student_id, first_name, last_name, email, program, year "
+            "FROM students ORDER BY rowid").fetchall()
+
+    def save_students(self, rows):
+        """
+        Replace all students with the given rows.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM students")
+            self._connection.executemany("INSERT INTO students VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def insert_student(self, row):
+        """
+        Insert one student.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute("INSERT INTO students VALUES (?, ?, ?, ?, ?, ?)", row)
+
+    def update_student(self, row):
+        """
+        Update one student, found by ID.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute(
+            "UPDATE students SET first_name = ?, last_name = ?, email = ?, program = ?, year = ? "
+            "WHERE student_id = ?", (row[1], row[2], row[3], row[4], row[5], row[0]))
+
+    def delete_student(self, student_id):
+        """
+        Delete one student.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
+
+    def commit_students(self, get_rows):
+        """
+        Commit the open transaction.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.commit()
+
+    # ------------------------------------------------------------------
+    # Courses
+    # ------------------------------------------------------------------
+
+    def load_courses(self):
+        """
+        Read all courses in the order they were added.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self.generations["courses"] = self._data_version()
+        return self._connection.execute(
+            "SELECT course_code, course_name, instructor, credits, capacity, meeting_times "
+            "FROM courses ORDER BY rowid").fetchall()
+
+    def save_courses(self, rows):
+        """
+        Replace all courses with the given rows.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM courses")
+            self._connection.executemany("INSERT INTO courses VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def insert_course(self, row):
+        """
+        Insert one course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute("INSERT INTO courses VALUES (?, ?, ?, ?, ?, ?)", row)
+
+    def update_course(self, row):
+        """
+        Update one course, found by code.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute(
+            "UPDATE courses SET course_name = ?, instructor = ?, credits = ?, capacity = ?, "
+            "meeting_times = ? WHERE course_code = ?", (row[1], row[2], row[3], row[4], row[5], row[0]))
+
+    def delete_course(self, course_code):
+        """
+        Delete one course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute("DELETE FROM courses WHERE course_code = ?", (course_code,))
+
+    def commit_courses(self, get_rows):
+        """
+        Commit the open transaction.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.commit()
+
+    # ------------------------------------------------------------------
+    # Enrollments
+    # ------------------------------------------------------------------
+
+    def enrollment_semesters(self):
+        """
+        Get the semesters that have enrollments, without reading their rows.
+
+        Returns:
+            list: Semesters
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return [row[0] for row in self._connection.execute("SELECT DISTINCT semester FROM enrollments")]
+
+    def load_enrollments(self, semesters=None):
+        """
+        Read enrollments in the order they were added.
+
+        Parameters:
+            semesters (iterable): Only read these semesters (all if None)
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self.generations["enrollments"] = self._data_version()
+        return self._select_enrollments(semesters)
+
+    def load_more_enrollments(self, semesters):
+        """
+        Read more semesters after load_enrollments(), without counting as
+        loading the table.
+
+        Returns:
+            list: Enrollment rows of the given semesters
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return self._select_enrollments(semesters).fetchall()
+
+    def _select_enrollments(self, semesters):
+        """
+        Select the enrollments of some semesters (all if None) in the order
+        they were added.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        query = "SELECT student_id, course_code, semester, grade FROM enrollments"
+        if semesters is None:
+            return self._connection.execute(query + " ORDER BY rowid")
+        semesters = list(semesters)
+        placeholders = ", ".join("?" * len(semesters))
+        return self._connection.execute(f"{query} WHERE semester IN ({placeholders}) ORDER BY rowid",
+                                        semesters)
+
+    def save_enrollments(self, rows):
+        """
+        Replace all enrollments with the given rows.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM enrollments")
+            self._connection.executemany("INSERT INTO enrollments VALUES (?, ?, ?, ?)", rows)
+
+    def insert_enrollment(self, row):
+        """
+        Insert one enrollment.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute("INSERT INTO enrollments VALUES (?, ?, ?, ?)", row)
+
+    def delete_enrollment(self, student_id, course_code, semester):
+        """
+        Delete one enrollment (the oldest, if the key is duplicated).
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute(
+            "DELETE FROM enrollments WHERE rowid = (SELECT rowid FROM enrollments "
+            "WHERE student_id = ? AND course_code = ? AND semester = ? ORDER BY rowid LIMIT 1)",
+            (student_id, course_code, semester))
+
+    def update_grade(self, student_id, course_code, semester, grade):
+        """
+        Set the grade of one enrollment (the oldest, if the key is duplicated).
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.execute(
+            "UPDATE enrollments SET grade = ? WHERE rowid = (SELECT rowid FROM enrollments "
+            "WHERE student_id = ? AND course_code = ? AND semester = ? ORDER BY rowid LIMIT 1)",
+            (grade, student_id, course_code, semester))
+
+    def commit_enrollments(self, get_rows, semesters=None):
+        """
+        Commit the open transaction.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.commit()
+
+    def prepare_enrollment_commit(self, get_rows, semesters=None):
+        """
+        Commit the open transaction now, under the caller's lock, since
+        statements from other threads must not join it halfway. In WAL
+        mode the commit only appends to the write-ahead log.
+
+        Returns:
+            function: Nothing is left to write
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._connection.commit()
+        return _nothing_to_write
+
+    def compact_enrollments(self, rows, semesters=None):
+        """
+        Commit and fold the write-ahead log back into the database file.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.commit()
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # ------------------------------------------------------------------
+    # Waitlist
+    # ------------------------------------------------------------------
+
+    def load_waitlist(self):
+        """
+        Read all waitlist entries in request order.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self.generations["waitlist"] = self._data_version()
+        return self._connection.execute(
+            "SELECT student_id, course_code, semester, request_number "
+            "FROM waitlist ORDER BY request_number").fetchall()
+
+    def save_waitlist(self, rows):
+        """
+        Replace the whole waitlist with the given rows.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM waitlist")
+            self._connection.executemany("INSERT INTO waitlist VALUES (?, ?, ?, ?)", rows)
+
+    def insert_waitlist(self, row):
+        """
+        Insert one waitlist entry, replacing the student's old entry for
+        the course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._connection.execute("INSERT OR REPLACE INTO waitlist VALUES (?, ?, ?, ?)", row)
+
+    def delete_waitlist(self, student_id, course_code):
+        """
+        Delete one waitlist entry.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._connection.execute("DELETE FROM waitlist WHERE student_id = ? AND course_code = ?",
+                                 (student_id, course_code))
+
+    def commit_waitlist(self, get_rows):
+        """
+        Commit the open transaction.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._connection.commit()
+
+    def prepare_waitlist_commit(self, get_rows):
+        """
+        Commit the open transaction now; see prepare_enrollment_commit().
+
+        Returns:
+            function: Nothing is left to write
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        self._connection.commit()
+        return _nothing_to_write
+
+    def close(self):
+        """
+        Commit and close the database connection.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self._connection.commit()
+        self._connection.close()
+
+
+def copy_storage(source, target):
+    """
+    Copy all students, courses, enrollments and waitlist entries from one
+    storage engine to another, e.g. to move the csv files into an SQLite
+    database.
+
+    Author: [Humza Khan]
+    Date: [Dec 19]
+    """
+    target.save_students(source.load_students())
+    target.save_courses(source.load_courses())
+    target.save_enrollments(source.load_enrollments())
+    target.save_waitlist(source.load_waitlist())
+
+
+def _nothing_to_write():
+    """
+    Write function of a prepared commit that has nothing to write.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+
+
+def _merge_rows(rows, changes, key=None):
+    """
+    Apply remembered changes to student, course or waitlist rows read from
+    a file.
+
+    Parameters:
+        rows (list): Rows from the file
+        changes (dict): Key (student ID or course code) -> new row, or None
+            if the row was deleted
+        key (function): Row -> key in changes (the first column if None)
+
+    Returns:
+        list: Merged rows; changed rows keep their place, new rows go last
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    changes = dict(changes)
+    merged = []
+    for row in rows:
+        row_key = key(row) if key is not None else row[0]
+        if row_key in changes:
+            change = changes.pop(row_key)
+            if change is not None:
+                merged.append(change)
+        else:
+            merged.append(row)
+    merged.extend(row for row in changes.values() if row is not None)
+    return merged
+
+
+def _waitlist_key(row):
+    """
+    Get the key of a waitlist row: a student waits at most once per course.
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return (row[0], row[1])
+
+
+def _parse_enrollment_lines(lines, semesters=None):
+    """
+    Generate enrollment rows from lines of enrollments.csv (without the
+    header). Blank and short lines are skipped.
+
+    Parameters:
+        lines (iterable): Lines, with or without newlines
+        semesters (set): Only generate these semesters (all if None)
+
+    Author: [Humza Khan]
+    Date: [Dec 19]
+    """
+    for line in lines:
+        line = line.strip()
+        if line == "":
+            continue
+
+        parts = line.split(",")
+        if len(parts) < 4:
+            continue
+
+        semester = parts[2].strip()
+        if semesters is not None and semester not in semesters:
+            continue
+        yield (int(parts[0]), parts[1].strip().upper(), semester, parts[3].strip())
+
+
+def _journal_semesters(lines):
+    """
+    Get the semesters that journal records change.
+
+    Returns:
+        set: Semesters
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    semesters = set()
+    for line in lines:
+        parts = line.split(",")
+        if line.endswith("\n") and len(parts) >= 4:
+            semesters.add(parts[3].strip())
+    return semesters
+
+
+def _apply_journal(rows, lines, semesters=None):
+    """
+    Apply journal records to enrollment rows.
+
+    Records that are already reflected in the rows (for example after an
+    interrupted compaction, or when two programs made the same change) and
+    incomplete lines are skipped, so replaying is safe to repeat. If a key
+    appears more than once, the first live row is the one changed, as in
+    EnrollmentManager._by_key.
+
+    Parameters:
+        rows (iterable): Enrollment rows
+        lines (iterable): Journal lines, each ending in a newline
+        semesters (set): Semesters the rows cover; records for other
+            semesters are counted but not applied (all if None)
+
+    Returns:
+        tuple: (list of enrollment rows, number of complete records)
+
+    Author: [Humza Khan]
+    Date: [Dec 19]
+    """
+    rows = [list(row) for row in rows]
+    positions = {}
+    for position, row in enumerate(rows):
+        positions.setdefault((row[0], row[1], row[2]), []).append(position)
+
+    count = 0
+    for line in lines:
+        if not line.endswith("\n"):
+            continue
+        parts = line.strip().split(",")
+        if len(parts) < 4:
+            continue
+        count += 1
+
+        action = parts[0]
+        try:
+            student_id = int(parts[1])
+        except ValueError:
+            continue
+        course_code = parts[2].strip().upper()
+        semester = parts[3].strip()
+        if semesters is not None and semester not in semesters:
+            continue
+        grade = parts[4].strip() if len(parts) > 4 else ""
+        key = (student_id, course_code, semester)
+        live = positions.get(key)
+
+        if action == "+" and not live:
+            positions.setdefault(key, []).append(len(rows))
+            rows.append([student_id, course_code, semester, grade])
+        elif action == "-" and live:
+            rows[live.pop(0)] = None
+        elif action == "G" and live:
+            rows[live[0]][3] = grade
+
+    return [tuple(row) for row in rows if row is not None], count
@@ -27,12 +27,15 @@ import random
 
 
 class Student:
+    __slots__ = ("_student_id", "_first_name", "_last_name", "_email",
+                 "_program", "_year")
+
     def __init__(self, student_id=None, first_name=None, last_name=None,
                  email=None, program=None, year=None):
         """
         Author: [Humza Khan]
         Date: [Dec 04]
-        Version: 1.0
+        Version: 1.1
         """
         self._student_id = None
         self._first_name = None
@@ -51,6 +54,32 @@ class Student:
         self.program = program
         self.year = year
 
+    @classmethod
+    def from_trusted(cls, student_id, first_name, last_name, email, program, year):
+        """
+        Create a Student from already-parsed file data without the setters.
+
+        Used for bulk loading. student_id and year must already be ints;
+        both are range-checked together in one test.
+
+        Raises:
+            ValueError: If student_id or year is out of range
+
+        Author: [Ali Alimarah]
+        Date: [Dec 17]
+        """
+        if not (1000000000 <= student_id <= 9999999999 and 1 <= year <= 4):
+            raise ValueError(f"Invalid student ID or year for student {student_id}")
+
+        student = object.__new__(cls)
+        student._student_id = student_id
+        student._first_name = first_name
+        student._last_name = last_name
+        student._email = email
+        student._program = program
+        student._year = year
+        return student
+
     @property
     def student_id(self):
         """
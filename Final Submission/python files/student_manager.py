@@ -24,29 +24,69 @@ RESPONSIBILITIES:
 FILE DEPENDENCIES:
 - students.csv (data file)
 - student.py (Student class)
+- persistence.py (flush policy)
+- storage.py (CsvStorage / SqliteStorage storage engines)
+- operation_result.py (OperationResult class)
+- search_index.py (TrigramIndex class)
+- prefix_index.py (PrefixTrie class)
+- fuzzy_index.py (FuzzyIndex class)
+- listing.py (TableListing class)
 
 """
 
+from fuzzy_index import FuzzyIndex
+from listing import TableListing
+from operation_result import (INVALID_STUDENT_ID, INVALID_VALUE, STUDENT_NOT_FOUND,
+                              OperationResult)
+from persistence import DirtyTracker, without_garbage_collection
+from prefix_index import PrefixTrie
+from search_index import TrigramIndex
+from storage import CsvStorage
 from student import Student
 
+STUDENT_HEADER = f"{'ID':<12}{'Name':<25}{'Email':<30}{'Program':<15}{'Year':<4}"
+
 
 class StudentManager:
-    def __init__(self):
+    def __init__(self, flush_policy=None, load_from_file=True, storage=None):
         """
         Initialize the StudentManager.
 
         Creates an empty list of students and loads data from students.csv file.
 
+        Parameters:
+            flush_policy (FlushPolicy): When changes are written to
+                students.csv (after every change if None)
+            load_from_file (bool): Read students.csv now; pass False when
+                the data will come from load_students() instead
+            storage (CsvStorage or SqliteStorage): Where students are
+                stored (the csv files if None)
+
         Implementation Notes:
         - Initialize empty _students list (private attribute)
+        - Initialize empty _student_index dictionary (student ID -> Student)
+        - Initialize trigram indexes over names and emails for searches,
+          a prefix trie over last names for completion and a fuzzy index
+          over names for typo-tolerant searches (each built when first
+          used)
         - Call read_students_file() to load existing data
 
         Author: [Humza Khan]
         Date: [Dec 06]
-        Version: 1.0
+        Version: 1.7
         """
+        if storage is None:
+            storage = CsvStorage()
+        self.storage = storage
         self._students = []
-        self.read_students_file()
+        self._student_index = {}
+        self._name_index = TrigramIndex(_student_names)
+        self._email_index = TrigramIndex(_student_email)
+        self._last_name_trie = PrefixTrie(_last_name_key)
+        self._fuzzy_name_index = FuzzyIndex(_student_names)
+        self._tracker = DirtyTracker(self._commit_changes, flush_policy)
+        if load_from_file:
+            self.read_students_file()
 
     @property
     def students(self):
@@ -61,74 +101,73 @@ class StudentManager:
         """
         return self._students
 
+    @without_garbage_collection
     def read_students_file(self):
         """
-        Read student data from students.csv and populate the students list.
+        Read student data from the storage engine (students.csv by default)
+        and populate the students list.
 
         File Format:
         student_id,first_name,last_name,email,program,year
 
-        Implementation Notes:
-        - Open students.csv for reading
-        - Skip the header line
-        - For each data line, split by comma and create Student object
-        - Add each Student to _students list
-        - Handle FileNotFoundError if file doesn't exist
-
         Author: [Ali Alimarah]
         Date: [Dec 06]
         """
-        self._students = []
-        try:
-            with open("students.csv", "r") as file:
-                header = file.readline()
-                for line in file:
-                    line = line.strip()
-                    if line == "":
-                        continue
-
-                    parts = line.split(",")
-                    if len(parts) != 6:
-                        continue
-
-                    student_id = int(parts[0])
-                    first_name = parts[1]
-                    last_name = parts[2]
-                    email = parts[3]
-                    program = parts[4]
-                    year = int(parts[5])
-
-                    student = Student(student_id, first_name, last_name, email, program, year)
-                    self._students.append(student)
-
-        except FileNotFoundError:
-            self._students = []
+        self.load_students(self.storage.load_students())
 
-    def write_students_to_file(self):
+    @without_garbage_collection
+    def load_students(self, rows):
         """
-        Write all student data to students.csv file.
+        Replace all students with already-validated rows, e.g. from a snapshot.
 
-        Writes header line followed by all students in CSV format.
+        Parameters:
+            rows (iterable): (student_id, first_name, last_name, email,
+                program, year) tuples
 
-        Implementation Notes:
-        - Open students.csv for writing (will overwrite existing)
-        - Write header: "student_id,first_name,last_name,email,program,year"
-        - For each student, write their to_csv_format() output
+        Author: [Ali Alimarah]
+        Date: [Dec 18]
+        """
+        self._students = [Student.from_trusted(*row) for row in rows]
+        self._rebuild_student_index()
+
+    def student_rows(self):
+        """
+        Get every student as a plain tuple, the format load_students() takes.
+
+        Returns:
+            list: (student_id, first_name, last_name, email, program, year)
+                tuples
+
+        Author: [Ali Alimarah]
+        Date: [Dec 18]
+        """
+        return [_student_row(s) for s in self._students]
+
+    def write_students_to_file(self):
+        """
+        Write all student data to the storage engine (students.csv by
+        default), replacing what is stored.
 
         Author: [Ali Alimarah]
         Date: [Dec 06]
         """
-        with open("students.csv", "w") as file:
-            file.write("student_id,first_name,last_name,email,program,year\n")
-            for student in self._students:
-                file.write(student.to_csv_format() + "\n")
+        self.storage.save_students(self.student_rows())
+        self._tracker.mark_clean()
+
+    def flush(self):
+        """
+        Write any unsaved student changes to students.csv now.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 15]
+        """
+        self._tracker.flush()
 
     def add_student(self):
         """
         Add a new student to the system through user input.
 
-        Prompts user for all student information, creates a new Student
-        object, adds it to the list, and saves to file.
+        Prompts user for all student information and calls create_student().
 
         Author: [Humza Khan]
         Date: [Dec 07]
@@ -139,40 +178,85 @@ class StudentManager:
         program = input("Enter student's program: ").strip()
         year_text = input("Enter student's year (1-4): ").strip()
 
+        print(self.create_student(first_name, last_name, email, program, year_text).message)
+
+    def create_student(self, first_name, last_name, email, program, year):
+        """
+        Add a new student with a generated ID and save it.
+
+        Parameters:
+            first_name, last_name, email, program (str): Student details
+            year (int or str): Year of study, 1-4
+
+        Returns:
+            OperationResult: The new Student as value on success
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
         try:
-            year = int(year_text)
+            year = int(year)
             student = Student(None, first_name, last_name, email, program, year)
-            self._students.append(student)
-            self.write_students_to_file()
-            print(f"Student {student.student_id} added successfully!")
-        except ValueError:
-            print("Error: Invalid year. Student not added.")
+            while student.student_id in self._student_index:
+                student = Student(None, first_name, last_name, email, program, year)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_VALUE, "Error: Invalid year. Student not added.")
+
+        self._students.append(student)
+        self._student_index[student.student_id] = student
+        self._name_index.add(student)
+        self._email_index.add(student)
+        self._last_name_trie.add(student)
+        self._fuzzy_name_index.add(student)
+        self.storage.insert_student(_student_row(student))
+        self._tracker.mark_dirty()
+        return OperationResult.ok(f"Student {student.student_id} added successfully!", student)
 
     def remove_student(self):
         """
         Remove a student from the system by ID.
 
-        Prompts user for student ID, searches for student, removes if found,
-        and saves updated data to file.
+        Prompts user for student ID and calls delete_student().
 
         Author: [Humza Khan]
         Date: [Dec 07]
         """
         student_id_text = input("Enter student ID to remove: ").strip()
+        print(self.delete_student(student_id_text).message)
+
+    def delete_student(self, student_id):
+        """
+        Remove a student from the system and save the change.
+
+        Parameters:
+            student_id (int or str): Student ID
+
+        Returns:
+            OperationResult: The removed Student as value on success
+
+        Author: [Humza Khan]
+        Date: [Dec 19]
+        """
         try:
-            student_id = int(student_id_text)
-        except ValueError:
-            print("Error: Invalid student ID")
-            return
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
 
         student = self.find_student_by_id(student_id)
         if student is None:
-            print(f"Error: No student found with ID {student_id}")
-            return
+            return OperationResult.failed(STUDENT_NOT_FOUND, f"Error: No student found with ID {student_id}")
 
         self._students.remove(student)
-        self.write_students_to_file()
-        print(f"Student {student.get_full_name()} (ID: {student.student_id}) removed successfully.")
+        if self._student_index.get(student.student_id) is student:
+            del self._student_index[student.student_id]
+        self._name_index.remove(student)
+        self._email_index.remove(student)
+        self._last_name_trie.remove(student)
+        self._fuzzy_name_index.remove(student)
+        self.storage.delete_student(student.student_id)
+        self._tracker.mark_dirty()
+        return OperationResult.ok(
+            f"Student {student.get_full_name()} (ID: {student.student_id}) removed successfully.", student)
 
     def search_student_by_id(self):
         """
@@ -201,6 +285,8 @@ class StudentManager:
         Search for students by name (first or last) and display results.
 
         Searches for partial matches in both first and last names (case-insensitive).
+        If nothing matches, the closest names allowing for typos are shown
+        instead.
 
         Author: [Ali Alimarah / Humza Khan]
         Date: [Dec 07]
@@ -210,34 +296,82 @@ class StudentManager:
             print("No students found matching ''")
             return
 
-        matches = []
-        for student in self._students:
-            if term in student.first_name.lower() or term in student.last_name.lower():
-                matches.append(student)
-
+        matches = self.find_students_by_name(term)
         if len(matches) == 0:
-            print(f"No students found matching '{term}'")
-            return
+            matches = [student for student, typos in self.fuzzy_find_students(term)]
+            if len(matches) == 0:
+                print(f"No students found matching '{term}'")
+                return
+            print(f"No students found matching '{term}'. Closest matches:")
 
         print("\n" + "=" * 84)
         print("SEARCH RESULTS")
         print("=" * 84)
-        print(f"{'ID':<12}{'Name':<25}{'Email':<30}{'Program':<15}{'Year':<4}")
+        print(STUDENT_HEADER)
         print("-" * 84)
-        for student in matches:
-            name = student.get_full_name()
-            program = student.program
-            if program is None:
-                program = ""
-            if len(program) > 14:
-                program = program[:14]
-            email = student.email
-            if email is None:
-                email = ""
-            print(f"{student.student_id:<12}{name:<25}{email:<30}{program:<15}{student.year:<4}")
+        print("\n".join(_student_line(student) for student in matches))
         print("=" * 84)
         print(f"Matches: {len(matches)}")
 
+    def find_students_by_name(self, term):
+        """
+        Find students whose first or last name contains term
+        (case-insensitive).
+
+        Returns:
+            list: Matching Student objects, in list order
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        return self._name_index.search(term.strip())
+
+    def find_students_by_email(self, term):
+        """
+        Find students whose email contains term (case-insensitive).
+
+        Returns:
+            list: Matching Student objects, in list order
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return self._email_index.search(term.strip())
+
+    def fuzzy_find_students(self, term, limit=20):
+        """
+        Find students whose names are close to term, allowing a few typos
+        in each word (e.g. "Martinze" finds "Martinez").
+
+        Parameters:
+            term (str): One or more name words
+            limit (int): Maximum number of students to return
+
+        Returns:
+            list: (Student, typos) tuples, fewest typos first
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return self._fuzzy_name_index.search(term, limit)
+
+    def complete_last_name(self, prefix, limit=10):
+        """
+        Find students whose last name starts with prefix
+        (case-insensitive), for autocompletion.
+
+        Parameters:
+            prefix (str): Start of the last name
+            limit (int): Maximum number of students to return
+
+        Returns:
+            list: Student objects, sorted by last name
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return self._last_name_trie.complete(prefix.strip(), limit)
+
     def edit_student_info(self):
         """
         Edit an existing student's information.
@@ -252,36 +386,75 @@ class StudentManager:
             print("Error: Invalid student ID")
             return
 
-        student = self.find_student_by_id(student_id)
-        if student is None:
+        if self.find_student_by_id(student_id) is None:
             print(f"Error: No student found with ID {student_id}")
             return
 
-        new_first = input("Enter new first name (or press Enter to skip): ")
-        if new_first.strip() != "":
-            student.first_name = new_first.strip()
+        new_first = input("Enter new first name (or press Enter to skip): ").strip()
+        new_last = input("Enter new last name (or press Enter to skip): ").strip()
+        new_email = input("Enter new email (or press Enter to skip): ").strip()
+        new_program = input("Enter new program (or press Enter to skip): ").strip()
+        new_year = input("Enter new year 1-4 (or press Enter to skip): ").strip()
 
-        new_last = input("Enter new last name (or press Enter to skip): ")
-        if new_last.strip() != "":
-            student.last_name = new_last.strip()
+        result = self.update_student(student_id, new_first or None, new_last or None,
+                                     new_email or None, new_program or None, new_year or None)
+        for warning in result.warnings:
+            print(warning)
+        print(result.message)
 
-        new_email = input("Enter new email (or press Enter to skip): ")
-        if new_email.strip() != "":
-            student.email = new_email.strip()
+    def update_student(self, student_id, first_name=None, last_name=None, email=None,
+                       program=None, year=None):
+        """
+        Change a student's details and save the change.
 
-        new_program = input("Enter new program (or press Enter to skip): ")
-        if new_program.strip() != "":
-            student.program = new_program.strip()
+        Fields left as None are not changed. An invalid year is ignored
+        and reported in the result's warnings; the other fields are still
+        updated.
+
+        Parameters:
+            student_id (int or str): Student ID
+            year (int or str): New year of study, 1-4
+
+        Returns:
+            OperationResult: The Student as value on success
 
-        new_year = input("Enter new year 1-4 (or press Enter to skip): ")
-        if new_year.strip() != "":
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        try:
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            return OperationResult.failed(INVALID_STUDENT_ID, "Error: Invalid student ID")
+
+        student = self.find_student_by_id(student_id)
+        if student is None:
+            return OperationResult.failed(STUDENT_NOT_FOUND, f"Error: No student found with ID {student_id}")
+
+        if first_name is not None:
+            student.first_name = first_name
+        if last_name is not None:
+            student.last_name = last_name
+        if email is not None:
+            student.email = email
+        if program is not None:
+            student.program = program
+        if first_name is not None or last_name is not None:
+            self._name_index.update(student)
+            self._last_name_trie.update(student)
+            self._fuzzy_name_index.update(student)
+        if email is not None:
+            self._email_index.update(student)
+
+        warnings = []
+        if year is not None:
             try:
-                student.year = int(new_year.strip())
-            except ValueError:
-                print("Error: Invalid year. Year not updated.")
+                student.year = int(year)
+            except (TypeError, ValueError):
+                warnings.append("Error: Invalid year. Year not updated.")
 
-        self.write_students_to_file()
-        print(f"Student {student.student_id} updated successfully!")
+        self.storage.update_student(_student_row(student))
+        self._tracker.mark_dirty()
+        return OperationResult.ok(f"Student {student.student_id} updated successfully!", student, warnings)
 
     def display_student_info(self, student):
         """
@@ -300,31 +473,24 @@ class StudentManager:
         print(f"Year:         {student.year}")
         print("=" * 42)
 
-    def display_students_list(self):
+    def display_students_list(self, offset=0, limit=None, page_size=None):
         """
-        Display all students in a formatted table.
+        Display students in a formatted table.
+
+        Only the students shown are formatted, and the table is written a
+        page at a time (see listing.py).
+
+        Parameters:
+            offset (int): Number of students to skip
+            limit (int): Maximum number of students to show (all if None)
+            page_size (int): Students per page, asking before each next
+                page (one table without questions if None)
 
         Author: [Humza Khan]
         Date: [Dec 07]
         """
-        print("=" * 84)
-        print("STUDENT LIST")
-        print("=" * 84)
-        print(f"{'ID':<12}{'Name':<25}{'Email':<30}{'Program':<15}{'Year':<4}")
-        print("-" * 84)
-        for student in self._students:
-            name = student.get_full_name()
-            program = student.program
-            if program is None:
-                program = ""
-            if len(program) > 14:
-                program = program[:14]
-            email = student.email
-            if email is None:
-                email = ""
-            print(f"{student.student_id:<12}{name:<25}{email:<30}{program:<15}{student.year:<4}")
-        print("=" * 84)
-        print(f"Total Students: {len(self._students)}")
+        listing = TableListing("STUDENT LIST", 84, STUDENT_HEADER, _student_line, "Total Students")
+        listing.render(self._students, len(self._students), offset, limit, page_size)
 
     def get_student_count(self):
         """
@@ -351,10 +517,96 @@ class StudentManager:
         Author: [Ali Alimarah]
         Date: [Dec 07]
         """
+        return self._student_index.get(student_id)
+
+    def _rebuild_student_index(self):
+        """
+        Rebuild the student ID index from the students list. The search
+        indexes and the last name trie are rebuilt when next used.
+
+        If the file contains the same ID twice, the first student wins,
+        matching the order a linear search would find them in.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 14]
+        """
+        self._student_index = {}
         for student in self._students:
-            if student.student_id == student_id:
-                return student
-        return None
+            self._student_index.setdefault(student.student_id, student)
+        self._name_index.reset(self._students)
+        self._email_index.reset(self._students)
+        self._last_name_trie.reset(self._students)
+        self._fuzzy_name_index.reset(self._students)
+
+    def _commit_changes(self):
+        """
+        Make reported student changes durable in the storage engine.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 19]
+        """
+        self.storage.commit_students(self.student_rows)
+
+
+def _student_row(student):
+    """
+    Convert a Student to the row tuple used by the storage engines.
+
+    Author: [Ali Alimarah]
+    Date: [Dec 19]
+    """
+    return (student.student_id, student.first_name, student.last_name,
+            student.email, student.program, student.year)
+
+
+def _student_line(student):
+    """
+    Format a Student as a line of the student tables.
+
+    Author: [Humza Khan]
+    Date: [Dec 07]
+    """
+    name = student.get_full_name()
+    program = student.program
+    if program is None:
+        program = ""
+    if len(program) > 14:
+        program = program[:14]
+    email = student.email
+    if email is None:
+        email = ""
+    return f"{student.student_id:<12}{name:<25}{email:<30}{program:<15}{student.year:<4}"
+
+
+def _student_names(student):
+    """
+    Get the fields searched by find_students_by_name() and
+    fuzzy_find_students().
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    return (student.first_name, student.last_name)
+
+
+def _student_email(student):
+    """
+    Get the field searched by find_students_by_email().
+
+    Author: [Ali Alimarah]
+    Date: [Dec 20]
+    """
+    return (student.email,)
+
+
+def _last_name_key(student):
+    """
+    Get the key completed by complete_last_name().
+
+    Author: [Humza Khan]
+    Date: [Dec 20]
+    """
+    return student.last_name
 
 
 # ==============================================================================
@@ -0,0 +1,108 @@
+"""
+Transcript Class - Course Registration System
+==============================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Works out a student's transcript: every course taken with its credits
+and grade, the credit-weighted GPA and the student's academic standing.
+
+RESPONSIBILITIES:
+- Combine a student's enrollments with each course's name and credits
+- Compute the GPA, weighting each grade's points by the course credits
+- Classify the standing from the GPA
+
+GPA:
+GPA = sum(grade points x credits) / sum(credits), over graded courses
+only. Courses no longer in the system count 0 credits, so they are
+listed but do not change the GPA.
+
+CACHING:
+Transcripts are read-only once built. EnrollmentManager.get_transcript()
+keeps one per student and throws it away when that student's
+enrollments, grades or courses change.
+
+FILE DEPENDENCIES:
+- grade_analytics.py (GRADE_POINTS)
+- semesters.py (semester_sort_key)
+
+"""
+
+from grade_analytics import GRADE_POINTS
+from semesters import semester_sort_key
+
+DEANS_LIST_GPA = 3.5
+PROBATION_GPA = 2.0
+
+
+class Transcript:
+    def __init__(self, student_id, enrollments, find_course):
+        """
+        Build a transcript from a student's enrollments.
+
+        Parameters:
+            student_id (int): Student ID
+            enrollments (list): The student's enrollments
+            find_course (function): Course code -> Course or None
+
+        Attributes:
+            entries (tuple): (course_code, course_name, semester, credits,
+                grade) tuples, oldest semester first; grade is "" until
+                assigned
+            gpa (float or None): Credit-weighted GPA, None if nothing is
+                graded
+            graded_credits (int): Credits of graded courses
+            earned_credits (int): Credits of graded courses passed (not F)
+            credits_in_progress (int): Credits of courses not graded yet
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        self.student_id = student_id
+        entries = []
+        points = 0.0
+        self.graded_credits = 0
+        self.earned_credits = 0
+        self.credits_in_progress = 0
+        for e in enrollments:
+            course = find_course(e["course_code"])
+            course_name = course.course_name if course else ""
+            credits = course.credits if course and course.credits else 0
+            grade = e["grade"] or ""
+            entries.append((e["course_code"], course_name, e["semester"], credits, grade))
+
+            grade_points = GRADE_POINTS.get(grade)
+            if grade_points is None:
+                self.credits_in_progress += credits
+                continue
+            points += grade_points * credits
+            self.graded_credits += credits
+            if grade != "F":
+                self.earned_credits += credits
+
+        entries.sort(key=lambda entry: (semester_sort_key(entry[2]), entry[0]))
+        self.entries = tuple(entries)
+        self.gpa = points / self.graded_credits if self.graded_credits > 0 else None
+
+    def standing(self):
+        """
+        Get the academic standing for the GPA.
+
+        Returns:
+            str: "Dean's List", "Good Standing", "Academic Probation" or
+                "No Grades Yet"
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        if self.gpa is None:
+            return "No Grades Yet"
+        if self.gpa >= DEANS_LIST_GPA:
+            return "Dean's List"
+        if self.gpa >= PROBATION_GPA:
+            return "Good Standing"
+        return "Academic Probation"
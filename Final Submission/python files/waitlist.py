@@ -0,0 +1,333 @@
+"""
+CourseWaitlists Class - Course Registration System
+===================================================
+
+TEAM MEMBER ASSIGNED TO THIS CLASS:
+Humza Khan - 000947358
+Ali Alimarah - 000964330
+
+PURPOSE:
+Keeps a waitlist for every full course, so students who could not get a
+seat are registered in order as seats free up.
+
+RESPONSIBILITIES:
+- Add and remove students on a course's waitlist
+- Hand out the next student to promote, by configurable priority,
+  passing over students whose semester has no free seat
+- Report a student's position and list a course's waitlist in order
+
+PRIORITY:
+The priority is a tuple of key names from PRIORITY_KEYS, compared in
+order. The default ("year", "requested") puts higher years first and,
+within a year, the earliest request first. ("requested",) is a plain
+first-come, first-served queue. Every request gets the next request
+number, which is saved with it, so the order survives a restart. Two
+programs sharing the same files can hand out the same number; such ties
+go to the lower student ID. The student's year is read when the student
+joins (or when the waitlist is loaded).
+
+HOW THE HEAPS WORK:
+Each course has a heap (heapq) of (priority..., request number,
+student ID, semester) tuples, so the next student is found in
+O(log n). Removing a student from the middle of a heap would be O(n),
+so removals only forget the student in _waiting and leave the tuple in
+the heap; pop() skips such stale tuples. _semester_counts counts the
+waiting students of each course per semester, so a caller can tell
+without popping whether any of them could get a free seat. Once stale
+tuples outnumber live ones the heap is rebuilt from the live ones, so a
+long run of drops and cancellations never leaves the heap mostly
+garbage.
+
+ROW FORMAT:
+(student_id, course_code, semester, request_number)
+
+"""
+
+import heapq
+
+PRIORITY_KEYS = {
+    "year": lambda year, request_number: -year,
+    "requested": lambda year, request_number: request_number
+}
+DEFAULT_PRIORITY = ("year", "requested")
+MIN_REBUILD = 64
+
+
+class CourseWaitlists:
+    def __init__(self, priority=DEFAULT_PRIORITY):
+        """
+        Initialize CourseWaitlists with no one waiting.
+
+        Parameters:
+            priority (tuple): Key names from PRIORITY_KEYS, most important
+                first
+
+        Raises:
+            ValueError: If a key name is not in PRIORITY_KEYS
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        Version: 1.0
+        """
+        for name in priority:
+            if name not in PRIORITY_KEYS:
+                raise ValueError(f"Unknown waitlist priority: {name}")
+        self._priority = [PRIORITY_KEYS[name] for name in priority]
+        self.reset([], {})
+
+    def reset(self, rows, years):
+        """
+        Replace every waitlist with the given rows.
+
+        Parameters:
+            rows (iterable): Waitlist rows (see ROW FORMAT)
+            years (dict): Student ID -> year, for the "year" priority
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._heaps = {}
+        self._waiting = {}
+        self._stale = {}
+        self._semester_counts = {}
+        self._next_request = 1
+        for student_id, course_code, semester, request_number in rows:
+            self._record(student_id, course_code, semester, years.get(student_id, 0), request_number)
+        for course_code, waiting in self._waiting.items():
+            heap = list(waiting.values())
+            heapq.heapify(heap)
+            self._heaps[course_code] = heap
+            self._stale[course_code] = 0
+
+    def add(self, student_id, course_code, semester, year):
+        """
+        Put a student at the end of their priority group on a course's
+        waitlist.
+
+        Parameters:
+            student_id (int): Student ID
+            course_code (str): Upper-case course code
+            semester (str): Semester the student asked for
+            year (int): The student's year
+
+        Returns:
+            tuple: The new waitlist row
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        entry = self._record(student_id, course_code, semester, year, self._next_request)
+        heapq.heappush(self._heaps.setdefault(course_code, []), entry)
+        self._stale.setdefault(course_code, 0)
+        return (student_id, course_code, semester, entry[-3])
+
+    def _record(self, student_id, course_code, semester, year, request_number):
+        """
+        Record a waiting student, without touching the heap.
+
+        A student already waiting for the course is replaced; their old
+        heap entry becomes stale.
+
+        Returns:
+            tuple: The heap entry
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self.remove(student_id, course_code)
+        key = tuple(priority(year, request_number) for priority in self._priority)
+        entry = key + (request_number, student_id, semester)
+        self._waiting.setdefault(course_code, {})[student_id] = entry
+        self._count_semester(course_code, semester, 1)
+        self._next_request = max(self._next_request, request_number + 1)
+        return entry
+
+    def remove(self, student_id, course_code):
+        """
+        Take a student off a course's waitlist.
+
+        Returns:
+            bool: True if the student was waiting
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        waiting = self._waiting.get(course_code)
+        entry = waiting.pop(student_id, None) if waiting is not None else None
+        if entry is None:
+            return False
+        self._count_semester(course_code, entry[-1], -1)
+        self._stale[course_code] = self._stale.get(course_code, 0) + 1
+        self._rebuild_if_stale(course_code)
+        return True
+
+    def pop(self, course_code, accept=None):
+        """
+        Take the first student off a course's waitlist.
+
+        Students whose row accept() turns down (e.g. because the semester
+        they asked for has no free seat) are passed over but keep their
+        place.
+
+        Parameters:
+            course_code (str): Upper-case course code
+            accept (function): Waitlist row -> bool (accept all if None)
+
+        Returns:
+            tuple or None: Their waitlist row, None if no one is waiting
+                (or no one is accepted)
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        heap = self._heaps.get(course_code)
+        waiting = self._waiting.get(course_code)
+        passed_over = []
+        found = None
+        while heap:
+            entry = heapq.heappop(heap)
+            student_id = entry[-2]
+            if waiting.get(student_id) is not entry:
+                self._stale[course_code] -= 1
+                continue
+            row = (student_id, course_code, entry[-1], entry[-3])
+            if accept is None or accept(row):
+                del waiting[student_id]
+                self._count_semester(course_code, entry[-1], -1)
+                found = row
+                break
+            passed_over.append(entry)
+
+        for entry in passed_over:
+            heapq.heappush(heap, entry)
+        if waiting is not None and len(waiting) == 0:
+            self._forget_course(course_code)
+        return found
+
+    def semesters(self, course_code):
+        """
+        Get the semesters students are waiting for in a course.
+
+        Returns:
+            list: Semesters with at least one waiting student
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        return list(self._semester_counts.get(course_code, {}))
+
+    def contains(self, student_id, course_code):
+        """
+        Check whether a student is waiting for a course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return student_id in self._waiting.get(course_code, {})
+
+    def position(self, student_id, course_code):
+        """
+        Get a student's place on a course's waitlist.
+
+        Counts the students ahead, so it takes O(n) time; only pop() is
+        O(log n).
+
+        Returns:
+            int or None: 1 for the next student to be promoted, None if
+                the student is not waiting
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        waiting = self._waiting.get(course_code, {})
+        entry = waiting.get(student_id)
+        if entry is None:
+            return None
+        return 1 + sum(1 for other in waiting.values() if other < entry)
+
+    def length(self, course_code):
+        """
+        Get the number of students waiting for a course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return len(self._waiting.get(course_code, {}))
+
+    def entries(self, course_code):
+        """
+        Get a course's waitlist in promotion order.
+
+        Returns:
+            list: Waitlist rows, next to be promoted first
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        ordered = sorted(self._waiting.get(course_code, {}).values())
+        return [(entry[-2], course_code, entry[-1], entry[-3]) for entry in ordered]
+
+    def rows(self):
+        """
+        Generate every waitlist row, in request order within each course.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        for course_code, waiting in self._waiting.items():
+            for entry in sorted(waiting.values(), key=lambda entry: entry[-3]):
+                yield (entry[-2], course_code, entry[-1], entry[-3])
+
+    def __len__(self):
+        """
+        Get the number of waiting students, over all courses.
+
+        Author: [Ali Alimarah]
+        Date: [Dec 20]
+        """
+        return sum(len(waiting) for waiting in self._waiting.values())
+
+    def _rebuild_if_stale(self, course_code):
+        """
+        Rebuild a course's heap from its live entries once stale entries
+        outnumber them.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        waiting = self._waiting[course_code]
+        if len(waiting) == 0:
+            self._forget_course(course_code)
+            return
+        stale = self._stale[course_code]
+        if stale < MIN_REBUILD or stale <= len(waiting):
+            return
+        heap = list(waiting.values())
+        heapq.heapify(heap)
+        self._heaps[course_code] = heap
+        self._stale[course_code] = 0
+
+    def _count_semester(self, course_code, semester, change):
+        """
+        Add change (+1 or -1) to the number of students waiting for a
+        course in a semester.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        counts = self._semester_counts.setdefault(course_code, {})
+        counts[semester] = counts.get(semester, 0) + change
+        if counts[semester] == 0:
+            del counts[semester]
+
+    def _forget_course(self, course_code):
+        """
+        Drop the empty waitlist of a course.
+
+        Author: [Humza Khan]
+        Date: [Dec 20]
+        """
+        self._heaps.pop(course_code, None)
+        self._waiting.pop(course_code, None)
+        self._stale.pop(course_code, None)
+        self._semester_counts.pop(course_code, None)